@@ -0,0 +1,65 @@
+#   ----------------------------------------------------------------
+#   Name:           AttributeCheck.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Tool and audit check that runs the Null, Blank
+#                   and text hygiene row rules in a single table scan
+#                   and writes each rule's report
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import datetime
+import os
+from Audit import audit_context, finding_emitter, option_list, register_check, run_check
+from AttributeScan import row_rules, write_rule_report
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that returns the row rules of the check, every row rule when attribute_rules is not given
+def check_rules(context):
+    return option_list(context, 'attribute_rules', list(row_rules))
+
+
+#   Function that writes the report of each row rule
+def finish_check(state, context, dataset_results):
+    for rule in check_rules(context):
+        report_file = open(os.path.join(context.report_loc, '{0}_{1}_Check.txt'.format(context.conn_base, rule)), 'w')
+        write_rule_report(report_file, context.catalog, rule, dataset_results, 'AttributeCheck',
+                          finding_emitter(context))
+        report_file.close()
+
+
+register_check('AttributeCheck', None, rules=check_rules, finish=finish_check)
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    conn_file = arcpy.GetParameterAsText(0)
+    report_loc = arcpy.GetParameterAsText(1)
+    rule_input = arcpy.GetParameterAsText(2)
+    catalog_file = arcpy.GetParameterAsText(3)
+    state_file = arcpy.GetParameterAsText(4)
+    workers = arcpy.GetParameterAsText(5)
+    batch_size = arcpy.GetParameterAsText(6)
+    pushdown = arcpy.GetParameterAsText(7)
+
+    start_time = datetime.datetime.today().time()
+    note('AttributeCheck.py beginning at {0}...'.format(str(start_time)))
+    run_check(audit_context(conn_file, report_loc, catalog_file,
+                            {'attribute_rules': rule_input, 'state_file': state_file, 'workers': workers,
+                             'batch_size': batch_size, 'pushdown': pushdown}), 'AttributeCheck')
+    note('All attributes have been verified. Please see results in the generated txt files.')
+    end_time = datetime.datetime.today().time()
+    note('AttributeCheck.py completed at {0}...'.format(str(end_time)))
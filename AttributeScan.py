@@ -0,0 +1,536 @@
+#   ----------------------------------------------------------------
+#   Name:           AttributeScan.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that contains the attribute scanning
+#                   engine used by the row checks. Row rules are
+#                   registered once and any set of them is evaluated
+#                   in a single SearchCursor pass per dataset that
+#                   reads only the columns the rules apply to, or in
+#                   OID range batches read as NumPy columns where the
+#                   rules are evaluated as vectorized operations. The
+#                   text hygiene rules share one compiled matcher. A
+#                   profile scan keeps per-column counts and a sample
+#                   of OIDs instead of every matching OID. Matching
+#                   OIDs are kept as runs of consecutive OIDs. Rules
+#                   with a where clause can be pushed down to the
+#                   database instead of read row by row. The rule
+#                   reports are rendered from typed findings. The
+#                   scans live in a module so worker processes can
+#                   import them.
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import numpy
+import random
+from collections import namedtuple
+from functools import partial
+from Catalog import sde_executor, workspace_dialect
+from CatalogModel import iter_datasets
+from Findings import Finding
+from Incremental import cached_scans
+from Instrument import count, span
+from OidRuns import append_oid, format_run, merge_runs
+from Parallel import scan_datasets
+from Pushdown import pushdown_applies, pushdown_rules, rule_predicates, rule_sql, table_name
+from TextHygiene import compile_matcher
+
+
+#   Row rule registry
+#   applies_to picks the catalog fields a rule reads, predicate is called with each of their values,
+#   vector_predicate is called with a column array and its Null mask and returns the mask of matches,
+#   rules with the same classifier are matched together by classifier(rules)(value), which returns the
+#   rules the value breaks, and the other attributes drive the rule's report and findings
+RowRule = namedtuple('RowRule', ['name', 'predicate', 'applies_to', 'message', 'table_prefix', 'total_label',
+                                 'vector_predicate', 'classifier', 'severity'])
+row_rules = {}
+
+#   SQL execute functions of the workspaces the rules were pushed down to, by connection file
+pushdown_executors = {}
+
+#   Scan engine version, part of the incremental state key so results of an older engine are not reused
+SCAN_VERSION = 8
+
+#   Stands for the OID in the projection of a table without one, its rows are numbered by cursor position instead
+ROW_POSITION = 'ROW@'
+
+#   Field types that are never read by a row rule, their values are expensive to fetch
+skip_types = ['OID', 'Geometry', 'Blob', 'Raster']
+
+#   Values TableToNumPyArray writes in place of a Null for each field type the batch engine reads
+#   Float and date Nulls become NaN and NaT, a text field holding only the unit separator reads as Null
+null_values = {'String': '\x1f', 'Guid': '\x1f', 'GlobalID': '\x1f', 'SmallInteger': -32768,
+               'Integer': -2147483648, 'BigInteger': -9223372036854775808, 'Single': numpy.nan,
+               'Double': numpy.nan, 'Date': numpy.datetime64('NaT')}
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that registers a row rule so the scanner and the reports know it
+#   Rules without a vector_predicate are always evaluated row by row
+def register_rule(name, predicate, applies_to, message, table_prefix='tbl', total_label=None,
+                  vector_predicate=None, classifier=None, severity='Warning'):
+    row_rules[name] = RowRule(name, predicate, applies_to, message, table_prefix,
+                              total_label or '{0} Instances'.format(name), vector_predicate, classifier, severity)
+
+
+#   Function that registers a text hygiene rule, all of them share the compiled TextHygiene matcher
+def register_hygiene_rule(name, message, total_label=None, vector_predicate=None):
+    classify = compile_matcher((name,))
+    register_rule(name, lambda value: bool(classify(value)), is_text_field, message, 'tbl', total_label,
+                  vector_predicate, compile_matcher)
+
+
+#   Function that tells whether a field is a text field
+def is_text_field(field):
+    return field.type == 'String'
+
+
+#   Function that tells whether a field can hold a Null
+def is_nullable_field(field):
+    return field.isNullable and field.type not in skip_types
+
+
+#   Function that returns the mask of the values of a text column that contain a run of two or more spaces
+def column_has_extra_spaces(column, nulls):
+    return numpy.char.find(column, '  ') >= 0
+
+
+register_rule('Null', lambda value: value is None, is_nullable_field, 'contains 1 or more Null values', 'fc',
+              vector_predicate=lambda column, nulls: nulls)
+register_rule('Blank', lambda value: value == '', is_text_field, 'contains 1 or more Blank values', 'fc',
+              vector_predicate=lambda column, nulls: column == '')
+register_hygiene_rule('ExtraSpaces', 'contains extra whitespace', 'Extra Spaces Instances', column_has_extra_spaces)
+register_hygiene_rule('LeadingSpaces', 'contains leading spaces', 'Leading Spaces Instances')
+register_hygiene_rule('TrailingSpaces', 'contains trailing spaces', 'Trailing Spaces Instances')
+register_hygiene_rule('Tabs', 'contains tab characters', 'Tab Instances')
+register_hygiene_rule('NonBreakingSpaces', 'contains non-breaking spaces', 'Non-Breaking Space Instances')
+register_hygiene_rule('ControlCharacters', 'contains control characters', 'Control Character Instances')
+register_hygiene_rule('Unnormalized', 'contains text that is not Unicode normalized', 'Unnormalized Instances')
+
+
+#   Function that builds the cursor projection of a dataset for a set of rules
+#   The OID, or ROW_POSITION for a table without one, is always first, followed by the union of the fields the
+#   rules apply to in field order. Returns the projection and, for each rule, the positions of its fields in it
+def rule_projection(dataset, rules):
+    oid_fields = [fn.name for fn in dataset.fields if fn.type == 'OID']
+    rule_fields = dict((rule, set(fn.name for fn in dataset.fields if row_rules[rule].applies_to(fn)))
+                       for rule in rules)
+    fields = [fn.name for fn in dataset.fields
+              if fn.type != 'OID' and any(fn.name in rule_fields[rule] for rule in rules)]
+    projection = ['OID@' if oid_fields else ROW_POSITION] + fields
+    positions = dict((rule, [i + 1 for i, name in enumerate(fields) if name in rule_fields[rule]])
+                     for rule in rules)
+    return projection, positions
+
+
+#   Function that reads the rows of a rule projection with a SearchCursor, each row starts with its OID
+#   A table without an OID has no row identity, its rows start with their position in the cursor from 1, and its
+#   findings hold runs of row positions rather than OIDs
+def search_rows(dataset, projection):
+    if projection[0] == ROW_POSITION:
+        with arcpy.da.SearchCursor(dataset.name, projection[1:]) as cursor:
+            for position, row in enumerate(cursor, 1):
+                yield (position,) + tuple(row)
+    else:
+        with arcpy.da.SearchCursor(dataset.name, projection) as cursor:
+            yield from cursor
+
+
+#   Function that matches the rules row by row and calls hit(rule, position, OID) for every match
+#   Each row starts with its OID. Rules that share a classifier are matched with one classify call per value.
+#   Returns the number of rows read
+def match_rows(rows, rules, positions, hit):
+    checks = [(rule, row_rules[rule].predicate, positions[rule]) for rule in rules
+              if positions[rule] and row_rules[rule].classifier is None]
+    groups = {}
+    for rule in rules:
+        if positions[rule] and row_rules[rule].classifier is not None:
+            groups.setdefault(row_rules[rule].classifier, []).append(rule)
+    classified = [(classifier(tuple(group)), sorted(set(i for rule in group for i in positions[rule])))
+                  for classifier, group in groups.items()]
+    rule_positions = dict((rule, set(positions[rule])) for rule in rules)
+    row_count = 0
+    for row in rows:
+        row_count += 1
+        for rule, predicate, check_positions in checks:
+            for i in check_positions:
+                if predicate(row[i]):
+                    hit(rule, i, row[0])
+        for classify, group_positions in classified:
+            for i in group_positions:
+                for rule in classify(row[i]):
+                    if i in rule_positions[rule]:
+                        hit(rule, i, row[0])
+    return row_count
+
+
+#   Function that evaluates the rules row by row, projection names the columns of the rows
+#   Returns {rule: [runs of OIDs with a match, instance count, {field: instance count}, {field: runs of OIDs}]},
+#   see OidRuns. The runs of the rule are the runs of its fields merged
+def evaluate_rows(rows, rules, positions, projection):
+    field_runs = dict((rule, [[] for name in projection]) for rule in rules)
+    counts = dict((rule, [0] * len(projection)) for rule in rules)
+
+    def hit(rule, i, oid):
+        append_oid(field_runs[rule][i], oid)
+        counts[rule][i] += 1
+    count('Rows read', match_rows(rows, rules, positions, hit))
+    results = {}
+    for rule in rules:
+        runs = dict((projection[i], merge_runs(field_runs[rule][i])) for i, count in enumerate(counts[rule]) if count)
+        results[rule] = [merge_runs([run for name in runs for run in runs[name]]), sum(counts[rule]),
+                         dict((projection[i], count) for i, count in enumerate(counts[rule]) if count), runs]
+    return results
+
+
+#   Function that scans a feature class or table once and evaluates every rule on the fields it applies to
+#   Returns {rule: [runs of OIDs with a match, instance count, {field: instance count}, {field: runs of OIDs}]}
+def scan_rules(dataset, rules):
+    projection, positions = rule_projection(dataset, rules)
+    if not any(positions[rule] for rule in rules):
+        return evaluate_rows([], rules, positions, projection)
+    with span('SearchCursor', 'arcpy', dataset=dataset.name):
+        return evaluate_rows(search_rows(dataset, projection), rules, positions, projection)
+
+
+#   Function that returns the runs of consecutive OIDs of a sorted array of unique OIDs
+def array_runs(oids):
+    if not len(oids):
+        return []
+    breaks = numpy.flatnonzero(numpy.diff(oids) != 1)
+    firsts = numpy.concatenate((oids[:1], oids[breaks + 1]))
+    lasts = numpy.concatenate((oids[breaks], oids[-1:]))
+    return numpy.stack((firsts, lasts), axis=1).tolist()
+
+
+#   Function that returns the Null mask of a column read with the null_values in place of Nulls
+def null_mask(column, null_value):
+    if column.dtype.kind == 'f':
+        return numpy.isnan(column)
+    if column.dtype.kind == 'M':
+        return numpy.isnat(column)
+    return column == null_value
+
+
+#   Function that reads a feature class or table as columns in OID ranges of batch_size rows
+#   The range bounds come from the sorted OID column so gaps in the OIDs do not make empty batches.
+#   Yields the OID array and {field: [values, Null mask]} for each batch
+def read_batches(dataset, fields, batch_size):
+    oid_field = [fn.name for fn in dataset.fields if fn.type == 'OID'][0]
+    field_types = dict((fn.name, fn.type) for fn in dataset.fields)
+    null_value = dict((name, null_values[field_types[name]]) for name in fields)
+    with span('TableToNumPyArray', 'arcpy', dataset=dataset.name, fields='OID@'):
+        bounds = numpy.sort(arcpy.da.TableToNumPyArray(dataset.name, ['OID@'])['OID@'])[::batch_size].tolist()
+    for i, low in enumerate(bounds):
+        where_clause = '{0} >= {1}'.format(oid_field, low)
+        if i + 1 < len(bounds):
+            where_clause += ' AND {0} < {1}'.format(oid_field, bounds[i + 1])
+        with span('TableToNumPyArray', 'arcpy', dataset=dataset.name, batch=i):
+            batch = arcpy.da.TableToNumPyArray(dataset.name, ['OID@'] + fields, where_clause, null_value=null_value)
+        count('Row batches')
+        count('Rows read', len(batch))
+        yield batch['OID@'], dict((name, [batch[name], null_mask(batch[name], null_value[name])])
+                                  for name in fields)
+
+
+#   Function that evaluates the rules on a batch of columns
+#   rule_fields is a list of (rule, fields it applies to). Yields (rule, field, OIDs with a match) per column
+def evaluate_columns(oids, columns, rule_fields):
+    for rule, fields in rule_fields:
+        vector_predicate = row_rules[rule].vector_predicate
+        for name in fields:
+            column, nulls = columns[name]
+            matches = vector_predicate(column, nulls)
+            if matches.any():
+                yield rule, name, oids[matches]
+
+
+#   Function that scans a feature class or table in batches and evaluates the rules as column operations
+#   Datasets without an OID, with a field type the batch reader does not know or rules without a
+#   vector_predicate are scanned row by row. Returns the same result as scan_rules
+def scan_rules_batch(dataset, rules, batch_size):
+    projection, positions = rule_projection(dataset, rules)
+    field_types = dict((fn.name, fn.type) for fn in dataset.fields)
+    rule_fields = [(rule, [projection[i] for i in positions[rule]]) for rule in rules if positions[rule]]
+    if (not rule_fields or projection[0] != 'OID@'
+            or any(row_rules[rule].vector_predicate is None for rule in rules)
+            or any(field_types[name] not in null_values for name in projection[1:])):
+        return scan_rules(dataset, rules)
+    matches = dict((rule, {}) for rule in rules)
+    for oids, columns in read_batches(dataset, projection[1:], batch_size):
+        for rule, name, rule_oids in evaluate_columns(oids, columns, rule_fields):
+            matches[rule].setdefault(name, []).append(rule_oids)
+    results = {}
+    for rule in rules:
+        field_oids = dict((name, numpy.concatenate(matches[rule][name])) for name in projection[1:]
+                          if name in matches[rule])
+        results[rule] = [array_runs(numpy.unique(numpy.concatenate(list(field_oids.values())))) if field_oids else [],
+                         sum(len(oids) for oids in field_oids.values()),
+                         dict((name, len(oids)) for name, oids in field_oids.items()),
+                         dict((name, array_runs(numpy.unique(oids))) for name, oids in field_oids.items())]
+    return results
+
+
+#   Function that adds OIDs to a reservoir sample of sample_size OIDs, seen is the number of OIDs offered before
+#   Every OID offered so far has the same chance of being in the sample however many there are
+def sample_oids(sample, seen, oids, sample_size, rnd):
+    for oid in oids:
+        seen += 1
+        if len(sample) < sample_size:
+            sample.append(oid)
+        else:
+            j = rnd.randrange(seen)
+            if j < sample_size:
+                sample[j] = oid
+    return seen
+
+
+#   Function that profiles a feature class or table, memory does not grow with the number of matches
+#   Every field is sampled with its own seeded generator so the same rows give the same sample in either engine.
+#   Returns [row count, {rule: {field: [instance count, sample of OIDs]}}] for every field a rule applies to
+def profile_rules(dataset, rules, sample_size):
+    projection, positions = rule_projection(dataset, rules)
+    counts = dict((rule, [0] * len(projection)) for rule in rules)
+    samples = dict((rule, [[] for name in projection]) for rule in rules)
+    generators = dict((rule, [random.Random(0) for name in projection]) for rule in rules)
+
+    def hit(rule, i, oid):
+        counts[rule][i] = sample_oids(samples[rule][i], counts[rule][i], [oid], sample_size, generators[rule][i])
+    if not any(positions[rule] for rule in rules):
+        with span('GetCount', 'arcpy', dataset=dataset.name):
+            row_count = int(arcpy.GetCount_management(dataset.name)[0])
+    else:
+        with span('SearchCursor', 'arcpy', dataset=dataset.name):
+            row_count = match_rows(search_rows(dataset, projection), rules, positions, hit)
+        count('Rows read', row_count)
+    return [row_count, dict((rule, dict((projection[i], [counts[rule][i], sorted(samples[rule][i])])
+                                        for i in positions[rule])) for rule in rules)]
+
+
+#   Function that profiles a feature class or table in batches with the vectorized rules
+#   Falls back to profile_rules where scan_rules_batch falls back to scan_rules. Returns the same result
+def profile_rules_batch(dataset, rules, batch_size, sample_size):
+    projection, positions = rule_projection(dataset, rules)
+    field_types = dict((fn.name, fn.type) for fn in dataset.fields)
+    rule_fields = [(rule, [projection[i] for i in positions[rule]]) for rule in rules if positions[rule]]
+    if (not rule_fields or projection[0] != 'OID@'
+            or any(row_rules[rule].vector_predicate is None for rule in rules)
+            or any(field_types[name] not in null_values for name in projection[1:])):
+        return profile_rules(dataset, rules, sample_size)
+    profile = dict((rule, dict((name, [0, []]) for name in fields)) for rule, fields in rule_fields)
+    generators = dict((rule, dict((name, random.Random(0)) for name in fields)) for rule, fields in rule_fields)
+    row_count = 0
+    for oids, columns in read_batches(dataset, projection[1:], batch_size):
+        row_count += len(oids)
+        for rule, name, rule_oids in evaluate_columns(oids, columns, rule_fields):
+            column_profile = profile[rule][name]
+            column_profile[0] = sample_oids(column_profile[1], column_profile[0], rule_oids.tolist(), sample_size,
+                                            generators[rule][name])
+    for rule in rules:
+        for column_profile in profile.setdefault(rule, {}).values():
+            column_profile[1].sort()
+    return [row_count, profile]
+
+
+#   Function that returns the pushdown dialect of a workspace, None when the rules cannot be pushed down
+def pushdown_dialect(conn_file):
+    dialect = workspace_dialect(conn_file)
+    if dialect is None and arcpy.Describe(conn_file).workspaceType == 'LocalDatabase':
+        return 'File Geodatabase'
+    return dialect
+
+
+#   Function that returns the SQL execute function of a workspace, opened once per process
+def pushdown_executor(conn_file):
+    if conn_file not in pushdown_executors:
+        pushdown_executors[conn_file] = sde_executor(conn_file)
+    return pushdown_executors[conn_file]
+
+
+#   Function that returns [is versioned, is archived] of a dataset, workspaces without versioning report neither
+def dataset_versioning(name):
+    with span('Describe', 'arcpy', dataset=name):
+        desc = arcpy.Describe(name)
+        return [bool(getattr(desc, 'isVersioned', False)), bool(getattr(desc, 'isArchived', False))]
+
+
+#   Function that evaluates rules with arcpy where clauses, one OID query per rule and field
+#   Returns the same result as pushdown_rules
+def where_clause_rules(dataset, dialect, rule_fields):
+    results = dict((rule, [[], 0, {}, {}]) for rule, fields in rule_fields)
+    for rule, field, where in rule_predicates(dialect, rule_fields):
+        with span('TableToNumPyArray', 'arcpy', dataset=dataset.name, rule=rule, field=field):
+            oids = numpy.unique(arcpy.da.TableToNumPyArray(dataset.name, ['OID@'], where)['OID@'])
+        if len(oids):
+            field_runs = array_runs(oids)
+            results[rule][0].extend(field_runs)
+            results[rule][1] += len(oids)
+            results[rule][2][field] = len(oids)
+            results[rule][3][field] = field_runs
+    for rule in results:
+        results[rule][0] = merge_runs(results[rule][0])
+    return results
+
+
+#   Function that evaluates the rules that have a where clause in the dialect inside the database
+#   The other rules are scanned by the cursor or, with a batch_size, the batch engine, and so are all the rules
+#   of a versioned or archived dataset. Returns the same result as scan_rules
+def scan_rules_pushdown(dataset, rules, conn_file, dialect, batch_size=0):
+    projection, positions = rule_projection(dataset, rules)
+    pushed = [rule for rule in rules if rule in rule_sql[dialect]]
+    if projection[0] != 'OID@':
+        pushed = []
+    if pushed and dialect != 'File Geodatabase' and not pushdown_applies(dialect, *dataset_versioning(dataset.name)):
+        note('{0} is versioned or archived, its rules are scanned instead of pushed down.'.format(dataset.name))
+        pushed = []
+    remaining = [rule for rule in rules if rule not in pushed]
+    results = {}
+    if remaining:
+        results.update(scan_rules_batch(dataset, remaining, batch_size) if batch_size
+                       else scan_rules(dataset, remaining))
+    if pushed:
+        oid_field = [fn.name for fn in dataset.fields if fn.type == 'OID'][0]
+        rule_fields = [(rule, [projection[i] for i in positions[rule]]) for rule in pushed]
+        if dialect == 'File Geodatabase':
+            results.update(where_clause_rules(dataset, dialect, rule_fields))
+        else:
+            results.update(pushdown_rules(pushdown_executor(conn_file), dialect, table_name(dataset.name),
+                                          oid_field, rule_fields))
+    return dict((rule, results[rule]) for rule in rules)
+
+
+#   Function that scans every dataset of the catalog for the rules in one cursor pass per dataset
+#   Unchanged datasets come from the incremental state when one is given, the rest go to the worker pool.
+#   A batch_size reads the datasets in batches of that many rows with the vectorized rules.
+#   A sample_size profiles the datasets instead, keeping that many example OIDs per rule and field.
+#   pushdown evaluates the rules that have a where clause in the database, it does not apply to profiles
+#   Returns {dataset name: scan_rules result} or {dataset name: profile_rules result}
+def scan_catalog(catalog, rules, conn_file, state=None, workers=1, batch_size=0, sample_size=None,
+                 pushdown=False):
+    datasets = [dataset for fds, dataset in iter_datasets(catalog)]
+    check = 'AttributeScan{0}_{1}'.format(SCAN_VERSION, '_'.join(rules))
+    if sample_size is not None:
+        check = 'AttributeProfile{0}_{1}_{2}'.format(SCAN_VERSION, sample_size, '_'.join(rules))
+        if batch_size:
+            scan_function = partial(profile_rules_batch, rules=list(rules), batch_size=batch_size,
+                                    sample_size=sample_size)
+        else:
+            scan_function = partial(profile_rules, rules=list(rules), sample_size=sample_size)
+    elif pushdown and pushdown_dialect(conn_file) is not None:
+        scan_function = partial(scan_rules_pushdown, rules=list(rules), conn_file=conn_file,
+                                dialect=pushdown_dialect(conn_file), batch_size=batch_size)
+    elif batch_size:
+        scan_function = partial(scan_rules_batch, rules=list(rules), batch_size=batch_size)
+    else:
+        scan_function = partial(scan_rules, rules=list(rules))
+    results = cached_scans(state, check, datasets,
+                           lambda stale: scan_datasets(stale, scan_function, conn_file, workers), conn_file)
+    return dict(zip([dataset.name for dataset in datasets], results))
+
+
+#   Function that yields the findings of one rule in one dataset, one finding per field and run of matching OIDs
+def rule_findings(workspace, fds, dataset, rule, dataset_result, check=None):
+    row_rule = row_rules[rule]
+    for field, runs in dataset_result[rule][3].items():
+        for run in runs:
+            yield Finding(workspace, fds, dataset.name, field, run[0], run[1], check, rule, row_rule.severity,
+                          row_rule.message)
+
+
+#   Function that writes the report of one dataset and rule and returns its instance count
+#   The report lines are rendered from the findings, the runs of every field merged into one line per run, and
+#   the findings are handed to emit_finding when it is given
+def write_rule_findings(report_file, catalog, fds, dataset, rule, dataset_result, prefix, check, emit_finding):
+    row_rule = row_rules[rule]
+    runs = []
+    for finding in rule_findings(catalog.workspace, fds, dataset, rule, dataset_result, check):
+        if emit_finding is not None:
+            emit_finding(finding)
+        runs.append([finding.oidStart, finding.oidEnd])
+    for run in merge_runs(runs):
+        report_file.write('{0} - {1} - OID {2} {3}\n'.format(prefix, dataset.name, format_run(run), row_rule.message))
+    return dataset_result[rule][1]
+
+
+#   Function that writes the report of one rule from the scan results of every dataset
+#   dataset_results maps the dataset name to the scan_rules result, check names the check in the findings
+def write_rule_report(report_file, catalog, rule, dataset_results, check=None, emit_finding=None):
+    row_rule = row_rules[rule]
+    error_count = 0
+    note('-------------------------------------------------------------------')
+    note('Writing the top level {0} features...'.format(catalog.workspace))
+    note('-------------------------------------------------------------------')
+    for fc in catalog.featureClasses:
+        error_count += write_rule_findings(report_file, catalog, None, fc, rule, dataset_results[fc.name], 'fc',
+                                           check, emit_finding)
+
+    note('-------------------------------------------------------------------')
+    note('Writing the top level {0} tables...'.format(catalog.workspace))
+    note('-------------------------------------------------------------------')
+    for tbl in catalog.tables:
+        error_count += write_rule_findings(report_file, catalog, None, tbl, rule, dataset_results[tbl.name],
+                                           row_rule.table_prefix, check, emit_finding)
+
+    for ds in catalog.featureDatasets:
+        note('-------------------------------------------------------------------')
+        note('Writing the {0} Feature Dataset...'.format(ds.name))
+        note('-------------------------------------------------------------------')
+        for fc in ds.featureClasses:
+            error_count += write_rule_findings(report_file, catalog, ds.name, fc, rule, dataset_results[fc.name],
+                                               'fc', check, emit_finding)
+
+    report_file.write('\n\n{0}: {1}\n'.format(row_rule.total_label, error_count))
+    return error_count
+
+
+#   Function that writes the instance count of each rule by dataset and field
+def write_field_summary(report_file, catalog, rules, dataset_results):
+    for fds, dataset in iter_datasets(catalog):
+        for rule in rules:
+            for field, count in dataset_results[dataset.name][rule][2].items():
+                report_file.write('{0} - {1} - {2}: {3}\n'.format(dataset.name, field, rule, count))
+    report_file.write('\n')
+    for rule in rules:
+        report_file.write('\n{0}: {1}'.format(row_rules[rule].total_label,
+                                              sum(result[rule][1] for result in dataset_results.values())))
+    report_file.write('\n')
+
+
+#   Function that writes the column completeness report from the profile_rules results of every dataset
+#   The fill rate is the share of rows that are neither Null nor Blank, of the rules that were profiled
+def write_profile_report(report_file, catalog, rules, dataset_profiles):
+    totals = dict((rule, 0) for rule in rules)
+    for fds, dataset in iter_datasets(catalog):
+        row_count, profile = dataset_profiles[dataset.name]
+        for fn in dataset.fields:
+            if not any(fn.name in profile[rule] for rule in rules):
+                continue
+            line = '{0} - {1} - {2} rows'.format(dataset.name, fn.name, row_count)
+            empty_count = 0
+            for rule in rules:
+                if fn.name not in profile[rule]:
+                    continue
+                count, sample = profile[rule][fn.name]
+                totals[rule] += count
+                if rule in ['Null', 'Blank']:
+                    empty_count += count
+                line += ' - {0}: {1}'.format(rule, count)
+                if sample:
+                    line += ' (OID {0}{1})'.format(', '.join(str(oid) for oid in sample),
+                                                   ', ...' if count > len(sample) else '')
+            if row_count:
+                line += ' - Fill rate: {0}%'.format(round((row_count - empty_count) / row_count * 100, 2))
+            report_file.write(line + '\n')
+    report_file.write('\n')
+    for rule in rules:
+        report_file.write('\n{0}: {1}'.format(row_rules[rule].total_label, totals[rule]))
+    report_file.write('\n')
+    return totals
@@ -0,0 +1,479 @@
+#   ----------------------------------------------------------------
+#   Name:           Audit.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that runs any number of checks over one
+#                   connection and one catalog. The checks
+#                   register visitor functions that receive dataset
+#                   and field events from a single traversal of the
+#                   catalog, and the row rules of all the checks are
+#                   evaluated in a single row scan. A timing summary
+#                   of every check is written at the end. Many
+#                   connections are audited by a pool of worker
+#                   processes, one workspace per process, with a limit
+#                   on the workspaces of each DBMS audited at once.
+#                   The checks can stream their findings as typed
+#                   records to a findings file beside the reports and
+#                   to a history store that reports what changed since
+#                   the previous run. The instrument option traces
+#                   the catalog calls, cursors, checks and report
+#                   writes of a run to a Chrome trace and OpenMetrics
+#                   text.
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import csv
+import importlib
+import multiprocessing
+import multiprocessing.connection
+import os
+import sys
+import time
+from collections import Counter, namedtuple
+from AttributeScan import scan_catalog
+from Catalog import iter_datasets, open_catalog, workspace_dialect, workspace_identity
+from DomainExport import export_extensions
+from Findings import Finding, close_findings, emit, open_findings
+from FindingsHistory import drop_run_checks, open_history, open_store, run_workspace, write_delta, write_trend
+from Incremental import open_state, save_state
+from Instrument import span, start_instrumentation, stop_instrumentation, write_chrome_trace, write_openmetrics
+
+
+#   Global variables
+#   A registered check, every function but start is optional
+#   start(context) returns the check state, the visitors and finish receive it
+#   visit_dataset(state, context, feature dataset, dataset) and visit_field(state, context, feature dataset,
+#   dataset, field) are called in catalog order, rules(context) returns the row rules the check needs and
+#   finish(state, context, dataset results) writes the report
+AuditCheck = namedtuple('AuditCheck', ['name', 'start', 'visit_dataset', 'visit_field', 'rules', 'finish'])
+#   What every check can read, options holds the check inputs by name
+#   findings holds the open findings streams, it is empty when the audit does not write findings
+#   finding_counts counts the findings of each check, whether or not they are written
+AuditContext = namedtuple('AuditContext', ['conn_file', 'conn_base', 'report_loc', 'catalog', 'options',
+                                           'findings', 'finding_counts'])
+audit_checks = {}
+#   The audit of one workspace in a batch, failed holds the error message of each failed check and findingCounts
+#   the number of findings of each check
+WorkspaceAudit = namedtuple('WorkspaceAudit', ['connFile', 'dbms', 'timings', 'failed', 'datasetCount',
+                                               'domainCount', 'findingCounts'])
+
+#   Check modules the runner runs when no checks are given
+#   AttributeCheck writes the report of every row rule, it runs only when it is asked for
+audit_modules = ['AliasUtilizationCheck', 'DomainAssociationCheck', 'DomainDictionary', 'DomainDuplicationCheck',
+                 'DomainSimilarityCheck', 'EmptyDataCheck', 'ExtraSpacesCheck', 'FieldnameTruncationCheck',
+                 'MetadataCheck', 'NullBlankCheck', 'OrphanDomainCheck', 'ReserveredWordCheck',
+                 'SpatialReferenceCheck']
+
+#   Options that name a folder in a batch, every workspace reads and writes its own file in it, named by the
+#   connection file name. A previous_export folder that is the report folder compares with the last export there.
+batch_folder_options = {'catalog_file': '{0}_Catalog.json.gz', 'state_file': '{0}_Scan_State.json',
+                        'previous_export': '{0}_Domain_Dictionary.{1}'}
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that registers a check so the runner can run it, the name is the name of its module
+def register_check(name, start, visit_dataset=None, visit_field=None, rules=None, finish=None):
+    audit_checks[name] = AuditCheck(name, start, visit_dataset, visit_field, rules, finish)
+
+
+#   Function that opens the catalog once and returns the context the checks share
+#   The findings_format option, JSONL, CSV, SQLite or Parquet, opens a findings stream, findings_compress gzips it
+def audit_context(conn_file, report_loc, catalog_file='', options=None):
+    arcpy.env.workspace = conn_file
+    conn_base = os.path.basename(conn_file)
+    options = options or {}
+    #   The instrument option, Timing or Memory, traces the run from the catalog read on, see run_checks
+    if options.get('instrument') not in [None, '', ' ']:
+        start_instrumentation(options['instrument'] == 'Memory')
+    #   The catalog_max_age option is the age in hours after which the catalog snapshot is rebuilt
+    max_age = options.get('catalog_max_age')
+    catalog = open_catalog(conn_file, catalog_file, float(max_age) if max_age not in [None, '', ' '] else None)
+    findings = []
+    if options.get('findings_format') not in [None, '', ' ']:
+        findings.append(open_findings(os.path.join(report_loc, '{0}_Findings'.format(conn_base)),
+                                      options['findings_format'], options.get('findings_compress') == 'true'))
+    return AuditContext(conn_file, conn_base, report_loc, catalog, options, findings, Counter())
+
+
+#   Function that returns an option of the context, or the default when it was not given
+def option(context, name, default=None):
+    value = context.options.get(name)
+    return default if value in [None, '', ' '] else value
+
+
+#   Function that returns a multivalue option of the context as a list, or the default when it was not given
+def option_list(context, name, default=None):
+    value = option(context, name)
+    if value is None:
+        return default
+    return [item.strip("' ") for item in value.split(';')]
+
+
+#   Function that counts a finding and hands it to every findings stream of the context
+def emit_finding(context, finding):
+    context.finding_counts[finding.check] += 1
+    for stream in context.findings:
+        emit(stream, finding)
+
+
+#   Function that returns the function the row rule reports hand their findings to
+def finding_emitter(context):
+    return lambda finding: emit_finding(context, finding)
+
+
+#   Function that counts and streams a finding of a check and returns it, so the text report can render the same
+#   record. Nothing is streamed when the audit does not write findings.
+def report_finding(context, check, container, dataset, field, rule, message, severity='Warning'):
+    finding = Finding(context.conn_base, container, dataset, field, None, None, check, rule, severity, message)
+    emit_finding(context, finding)
+    return finding
+
+
+#   Function that returns the location of a dataset or field as the text reports write it
+#   'fds: conn - Feature Dataset: fds - Feature Class: fc', 'tbl: conn - Table: tbl' or 'fc: conn - Feature Class: fc'
+#   followed by ' - Field Name: field' for a field
+def location_label(workspace, container, dataset, dataset_type, field=None):
+    if container is not None:
+        label = 'fds: {0} - Feature Dataset: {1} - Feature Class: {2}'.format(workspace, container, dataset)
+    elif dataset_type == 'Table':
+        label = 'tbl: {0} - Table: {1}'.format(workspace, dataset)
+    else:
+        label = 'fc: {0} - Feature Class: {1}'.format(workspace, dataset)
+    if field is not None:
+        label += ' - Field Name: {0}'.format(field)
+    return label
+
+
+#   Function that renders a finding as a line of a text report, its location, the separator and its message
+#   A finding without a dataset, a domain finding for instance, is written as its message alone
+def finding_line(finding, dataset_type=None, separator=' '):
+    if finding.dataset is None:
+        return '{0}\n'.format(finding.message)
+    return '{0}{1}{2}\n'.format(location_label(finding.workspace, finding.container, finding.dataset, dataset_type,
+                                               finding.field), separator, finding.message)
+
+
+#   Function that runs the checks over a single traversal of the catalog and a single row scan
+#   A check that fails is reported and skipped, the others carry on
+#   Returns [{check name: seconds}, {check name: error}]
+def run_checks(context, names):
+    for name in names:
+        if name not in audit_checks:
+            importlib.import_module(name)
+    checks = [audit_checks[name] for name in names]
+    timings = dict((name, 0.0) for name in names)
+    failed = {}
+    #   The history_file option records the findings of the run in a history store
+    #   Runs are kept by workspace identity, connection files of the same name in two folders keep two histories
+    history_file = option(context, 'history_file')
+    if history_file is not None:
+        run_id, history = open_history(history_file, workspace_identity(context.conn_file), names)
+        context.findings.append(history)
+
+    def call(check, function, *args):
+        if check.name in failed or function is None:
+            return None
+        begin = time.perf_counter()
+        try:
+            with span(check.name, 'check', phase=function.__name__):
+                return function(*args)
+        except Exception as e:
+            failed[check.name] = e
+            note('The {0} check failed ({1}), carrying on with the other checks...'.format(check.name, e))
+        finally:
+            timings[check.name] += time.perf_counter() - begin
+
+    states = dict((check.name, call(check, check.start, context)) for check in checks)
+
+    dataset_visitors = [check for check in checks if check.visit_dataset is not None]
+    field_visitors = [check for check in checks if check.visit_field is not None]
+    if dataset_visitors or field_visitors:
+        note('-------------------------------------------------------------------')
+        note('Checking the {0} datasets...'.format(context.conn_base))
+        note('-------------------------------------------------------------------')
+        for fds, dataset in iter_datasets(context.catalog):
+            note('Checking the {0} {1}.'.format(dataset.name, 'Table' if dataset.datasetType == 'Table'
+                                                 else 'Feature Class'))
+            with span('Visit', 'dataset', dataset=dataset.name):
+                for check in dataset_visitors:
+                    call(check, check.visit_dataset, states[check.name], context, fds, dataset)
+                if not field_visitors:
+                    continue
+                for field in dataset.fields:
+                    for check in field_visitors:
+                        call(check, check.visit_field, states[check.name], context, fds, dataset, field)
+
+    rules = []
+    rule_checks = []
+    for check in checks:
+        check_rules = call(check, check.rules, context) or []
+        if check_rules:
+            rule_checks.append(check.name)
+        for rule in check_rules:
+            if rule not in rules:
+                rules.append(rule)
+    dataset_results = None
+    if rules:
+        note('Scanning for {0}...'.format(', '.join(rules)))
+        begin = time.perf_counter()
+        state_file = option(context, 'state_file')
+        state = open_state(state_file) if state_file is not None else None
+        try:
+            with span('Row scan', 'audit', rules=', '.join(rules)):
+                dataset_results = scan_catalog(context.catalog, rules, context.conn_file, state,
+                                               int(option(context, 'workers', 1)),
+                                               int(option(context, 'batch_size', 0)),
+                                               pushdown=option(context, 'pushdown') == 'true')
+            if state is not None:
+                save_state(state)
+        except Exception as e:
+            note('The row scan failed ({0}), skipping the checks that need it...'.format(e))
+            for name in rule_checks:
+                failed[name] = e
+        timings['Row scan'] = time.perf_counter() - begin
+
+    for check in checks:
+        call(check, check.finish, states[check.name], context, dataset_results)
+    for stream in context.findings:
+        try:
+            with span('Close findings', 'report', path=stream.path):
+                note('Findings written to {0}...'.format(close_findings(stream)))
+        except Exception as e:
+            note('The findings could not be written ({0})...'.format(e))
+            failed['Findings'] = e
+    if history_file is not None and 'Findings' not in failed:
+        with span('Findings delta', 'report'):
+            write_history_delta(context, history_file, run_id, failed)
+    if option(context, 'instrument') is not None:
+        write_instrumentation(context)
+    return [timings, failed]
+
+
+#   Function that stops instrumentation and writes the trace and metrics of the run beside the reports
+#   Spans and counters of worker processes stay in those processes, a run with workers traces the pool as one span
+def write_instrumentation(context):
+    peak_memory = stop_instrumentation()
+    trace_file = os.path.join(context.report_loc, '{0}_Trace.json'.format(context.conn_base))
+    metrics_file = os.path.join(context.report_loc, '{0}_Metrics.txt'.format(context.conn_base))
+    write_chrome_trace(trace_file)
+    write_openmetrics(metrics_file, peak_memory)
+    note('Trace written to {0} and metrics to {1}...'.format(trace_file, metrics_file))
+
+
+#   Function that writes the finding trend of the workspace and what changed since the previous run of each check
+#   Checks that failed are dropped from the run first so they are compared with their last complete run
+def write_history_delta(context, history_file, run_id, failed):
+    conn = open_store(history_file)
+    drop_run_checks(conn, run_id, list(failed))
+    report_file = open(os.path.join(context.report_loc, '{0}_Findings_Delta.txt'.format(context.conn_base)), 'w')
+    write_trend(report_file, conn, run_workspace(conn, run_id))
+    report_file.write('\n\n')
+    write_delta(report_file, conn, run_id)
+    report_file.close()
+    conn.close()
+
+
+#   Function that notes the time every check took
+def note_timings(timings, failed):
+    for name, seconds in timings.items():
+        note('{0} took {1} seconds{2}'.format(name, round(seconds, 4), ' and failed' if name in failed else ''))
+
+
+#   Function that writes the time each check took and whether it failed
+def write_timing_lines(report_file, timings, failed):
+    for name, seconds in timings.items():
+        report_file.write('{0} - {1} seconds - {2}\n'.format(name, round(seconds, 4),
+                                                            'Failed: {0}'.format(failed[name]) if name in failed
+                                                            else 'Completed'))
+
+
+#   Function that writes the time every check took and the checks that failed
+def write_timings(report_file, timings, failed):
+    write_timing_lines(report_file, timings, failed)
+    report_file.write('\n\nChecks Run: {0}\n'
+                      'Checks Failed: {1}\n'
+                      'Total Seconds: {2}'.format(str(len([name for name in timings if name != 'Row scan'])),
+                                                  str(len(failed)), str(round(sum(timings.values()), 4))))
+
+
+#   Function used by the check tools to run their own check, a failure is raised so the tool fails
+def run_check(context, name):
+    timings, failed = run_checks(context, [name])
+    note_timings(timings, failed)
+    if name in failed:
+        raise failed[name]
+
+
+#   Function that returns the DBMS a workspace is limited by in a batch
+def workspace_dbms(conn_file):
+    try:
+        return workspace_dialect(conn_file) or 'File'
+    except Exception:
+        return 'Unknown'
+
+
+#   Function that returns the options of one workspace of a batch, the folder options become its own files
+def workspace_options(options, conn_file):
+    workspace_files = {}
+    for name, file_name in batch_folder_options.items():
+        if options.get(name) not in [None, '', ' ']:
+            workspace_files[name] = os.path.join(options[name], file_name.format(
+                os.path.basename(conn_file), export_extensions.get(options.get('export_format'), 'jsonl')))
+    return dict(options, **workspace_files)
+
+
+#   Function run in a batch worker process to audit one workspace
+#   Exceptions do not always survive the trip back to the batch, the failures are returned as messages
+def audit_workspace(conn_file, dbms, report_loc, names, options):
+    options = workspace_options(options, conn_file)
+    try:
+        context = audit_context(conn_file, report_loc, options.get('catalog_file', ''), options)
+    except Exception as e:
+        note('The {0} catalog could not be read ({1}), skipping the workspace...'.format(conn_file, e))
+        return WorkspaceAudit(conn_file, dbms, {}, {'Catalog': str(e)}, 0, 0, {})
+    timings, failed = run_checks(context, names)
+    return WorkspaceAudit(conn_file, dbms, timings, dict((name, str(e)) for name, e in failed.items()),
+                          len(list(iter_datasets(context.catalog))), len(context.catalog.domains),
+                          dict(context.finding_counts))
+
+
+#   Function run in the process of one batch workspace, it sends the audit of the workspace back on its pipe
+#   Exceptions do not always survive the trip back to the batch, a failure is sent as a message
+def audit_process(writer, conn_file, dbms, report_loc, names, options):
+    try:
+        writer.send(audit_workspace(conn_file, dbms, report_loc, names, options))
+    except Exception as e:
+        writer.send(WorkspaceAudit(conn_file, dbms, {}, {'Workspace': str(e)}, 0, 0, {}))
+    writer.close()
+
+
+#   Function that stops the process of a batch workspace, frees its worker and DBMS slot and returns its exit code
+def stop_process(running, processes, conn_file, dbms, terminate=False):
+    process, reader, begin = processes.pop(conn_file)
+    if terminate:
+        process.terminate()
+    process.join()
+    reader.close()
+    running[dbms] -= 1
+    return process.exitcode
+
+
+#   Function that audits many workspaces and returns a WorkspaceAudit for each, in the order they were given
+#   workers is the number of worker processes, dbms_limit the number of workspaces of one DBMS audited at once
+#   Every workspace is audited in a process of its own so the arcpy workspace environment is never shared, and
+#   sends its audit back on a pipe of its own. A workspace still running timeout seconds after its process started
+#   is terminated and recorded as failed, and a process that dies without an audit is recorded as failed. The
+#   worker and DBMS slot of a workspace are only freed once its process has ended. None waits for every workspace.
+def run_batch(conn_files, report_loc, names, options, workers=1, dbms_limit=1, timeout=None):
+    dbms = dict((conn_file, workspace_dbms(conn_file)) for conn_file in conn_files)
+    if workers <= 1 or len(conn_files) < 2:
+        results = []
+        for conn_file in conn_files:
+            note('Auditing the {0} workspace ({1})...'.format(conn_file, dbms[conn_file]))
+            results.append(audit_workspace(conn_file, dbms[conn_file], report_loc, names, options))
+        return results
+    #   Inside ArcGIS Pro sys.executable is the application, the workers need the python interpreter
+    if not os.path.basename(sys.executable).lower().startswith('python'):
+        multiprocessing.set_executable(os.path.join(sys.exec_prefix, 'python.exe'))
+    workers = min(workers, len(conn_files))
+    note('Auditing {0} workspaces with {1} worker processes, {2} per DBMS...'.format(len(conn_files), workers,
+                                                                                   dbms_limit))
+    #   The checks scan with a single process inside a batch worker
+    options = dict(options, workers=1)
+    results = {}
+    pending = list(conn_files)
+    running = Counter()
+    #   {conn_file: [process, reader, start time]} of the workspaces whose process has not ended
+    processes = {}
+    while pending or processes:
+        for conn_file in list(pending):
+            if len(processes) >= workers:
+                break
+            #   File workspaces do not share a database server, they are only limited by the workers
+            if dbms[conn_file] != 'File' and running[dbms[conn_file]] >= dbms_limit:
+                continue
+            pending.remove(conn_file)
+            running[dbms[conn_file]] += 1
+            note('Auditing the {0} workspace ({1})...'.format(conn_file, dbms[conn_file]))
+            reader, writer = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(target=audit_process, args=(writer, conn_file, dbms[conn_file],
+                                                                          report_loc, names, options))
+            process.start()
+            #   The batch keeps only the reading end, so the pipe reports the end of a process that dies
+            writer.close()
+            processes[conn_file] = [process, reader, time.perf_counter()]
+        #   Wake up at least once a minute to look for workspaces that ran out of time
+        readers = dict((reader, conn_file) for conn_file, (process, reader, begin) in processes.items())
+        for reader in multiprocessing.connection.wait(list(readers), 60 if timeout is None else min(60, timeout)):
+            conn_file = readers[reader]
+            try:
+                results[conn_file] = reader.recv()
+            except EOFError:
+                results[conn_file] = None
+            exit_code = stop_process(running, processes, conn_file, dbms[conn_file])
+            if results[conn_file] is None:
+                results[conn_file] = WorkspaceAudit(conn_file, dbms[conn_file], {}, {
+                    'Workspace': 'The worker process ended without an audit (exit code {0})'.format(exit_code)},
+                    0, 0, {})
+        for conn_file, (process, reader, begin) in list(processes.items()):
+            if timeout is not None and time.perf_counter() - begin > timeout:
+                note('The {0} workspace did not finish in {1} seconds, stopping its worker...'.format(conn_file,
+                                                                                                     timeout))
+                stop_process(running, processes, conn_file, dbms[conn_file], terminate=True)
+                results[conn_file] = WorkspaceAudit(conn_file, dbms[conn_file], {}, {
+                    'Workspace': 'Timed out after {0} seconds'.format(timeout)}, 0, 0, {})
+    return [results[conn_file] for conn_file in conn_files]
+
+
+#   Function that writes the consolidated summary of a batch, one block per workspace and the batch totals
+def write_batch_summary(report_file, results):
+    for result in results:
+        report_file.write('________________________________________\n')
+        report_file.write('Workspace: {0} ({1})\n'.format(os.path.basename(result.connFile), result.dbms))
+        report_file.write('Datasets: {0} - Domains: {1}\n'.format(result.datasetCount, result.domainCount))
+        write_timing_lines(report_file, result.timings, result.failed)
+        #   A workspace that could not be read or timed out fails without timings
+        for name, error in result.failed.items():
+            if name not in result.timings:
+                report_file.write('{0} - Failed: {1}\n'.format(name, error))
+        for name, count in sorted(result.findingCounts.items()):
+            report_file.write('{0} - {1} findings\n'.format(name, count))
+    failed_count = len([result for result in results if result.failed])
+    report_file.write('\n\nWorkspaces Audited: {0}\n'
+                      'Workspaces With Failures: {1}\n'
+                      'Datasets: {2}\n'
+                      'Domains: {3}\n'
+                      'Checks Failed: {4}\n'
+                      'Findings: {5}\n'
+                      'Total Seconds: {6}'.format(str(len(results)), str(failed_count),
+                                                  str(sum(result.datasetCount for result in results)),
+                                                  str(sum(result.domainCount for result in results)),
+                                                  str(sum(len(result.failed) for result in results)),
+                                                  str(sum(sum(result.findingCounts.values()) for result in results)),
+                                                  str(round(sum(sum(result.timings.values()) for result in results),
+                                                            4))))
+
+
+#   Function that writes the workspace by check matrix of a batch, the seconds of each check or Failed, then the
+#   finding count of each check
+def write_batch_matrix(matrix_path, results, names):
+    with open(matrix_path, 'w', newline='') as matrix_file:
+        matrix = csv.writer(matrix_file)
+        matrix.writerow(['Workspace', 'DBMS', 'Datasets', 'Domains'] + names +
+                        ['{0} Findings'.format(name) for name in names])
+        for result in results:
+            failed = [name in result.failed or not result.timings for name in names]
+            matrix.writerow([os.path.basename(result.connFile), result.dbms, result.datasetCount,
+                             result.domainCount] +
+                            ['Failed' if name_failed else round(result.timings.get(name, 0.0), 4)
+                             for name, name_failed in zip(names, failed)] +
+                            ['' if name_failed else result.findingCounts.get(name, 0)
+                             for name, name_failed in zip(names, failed)])
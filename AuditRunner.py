@@ -0,0 +1,76 @@
+#   ----------------------------------------------------------------
+#   Name:           AuditRunner.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Tool that runs the selected checks, or all of
+#                   them, over one connection in one run and writes
+#                   every report and a timing summary
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import datetime
+import os
+from Audit import audit_context, audit_modules, note_timings, run_checks, write_timings
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    conn_file = arcpy.GetParameterAsText(0)
+    conn_base = os.path.basename(conn_file)
+    report_loc = arcpy.GetParameterAsText(1)
+    check_input = arcpy.GetParameterAsText(2)
+    if check_input in [None, '', ' ']:
+        check_names = audit_modules
+    else:
+        check_names = [check.strip("' ") for check in check_input.split(';')]
+    #   Inputs of the checks, each check reads the ones it needs
+    options = {'catalog_file': arcpy.GetParameterAsText(3),
+               'state_file': arcpy.GetParameterAsText(4),
+               'workers': arcpy.GetParameterAsText(5),
+               'batch_size': arcpy.GetParameterAsText(6),
+               'pushdown': arcpy.GetParameterAsText(7),
+               'wkt_srs': arcpy.GetParameterAsText(8),
+               'db_type': arcpy.GetParameterAsText(9),
+               'count_mode': arcpy.GetParameterAsText(10),
+               'null_blank': arcpy.GetParameterAsText(11),
+               'hygiene_rules': arcpy.GetParameterAsText(12),
+               'attribute_rules': arcpy.GetParameterAsText(13),
+               'threshold': arcpy.GetParameterAsText(14),
+               'export_format': arcpy.GetParameterAsText(15),
+               'findings_format': arcpy.GetParameterAsText(16),
+               'findings_compress': arcpy.GetParameterAsText(17),
+               'history_file': arcpy.GetParameterAsText(18),
+               'instrument': arcpy.GetParameterAsText(19),
+               'previous_export': arcpy.GetParameterAsText(20),
+               'catalog_max_age': arcpy.GetParameterAsText(21),
+               'report_type': arcpy.GetParameterAsText(22),
+               'sample_size': arcpy.GetParameterAsText(23),
+               'metadata_threads': arcpy.GetParameterAsText(24)}
+
+    #   Start timer
+    start_time = datetime.datetime.today().time()
+    note('AuditRunner.py beginning at {0}...'.format(str(start_time)))
+
+    context = audit_context(conn_file, report_loc, options['catalog_file'], options)
+    timings, failed = run_checks(context, check_names)
+    note_timings(timings, failed)
+    report_file = open(os.path.join(report_loc, '{0}_Audit_Summary.txt'.format(conn_base)), 'w')
+    write_timings(report_file, timings, failed)
+    report_file.close()
+
+    note('All checks have been run. Please see results in the generated txt files.')
+    end_time = datetime.datetime.today().time()
+    note('AuditRunner.py completed at {0}...'.format(str(end_time)))
@@ -0,0 +1,99 @@
+#   ----------------------------------------------------------------
+#   Name:           BatchAuditRunner.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Tool that runs the audit checks over many
+#                   connection files. Every workspace writes the
+#                   reports of a single audit, and a consolidated
+#                   summary and workspace by check matrix of the
+#                   times and finding counts are written for the
+#                   whole batch. A workspace that does not finish in
+#                   the timeout is recorded as failed.
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import datetime
+import glob
+import os
+from Audit import audit_modules, run_batch, write_batch_matrix, write_batch_summary
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that returns the connection files of the input, a folder stands for every connection file in it
+def batch_connections(connection_input):
+    conn_files = []
+    for entry in [entry.strip("' ") for entry in connection_input.split(';')]:
+        if os.path.isdir(entry):
+            entries = sorted(glob.glob(os.path.join(entry, '*.sde')))
+        else:
+            entries = [entry]
+        for conn_file in entries:
+            if conn_file not in conn_files:
+                conn_files.append(conn_file)
+    return conn_files
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    #   Connection files or folders of connection files
+    conn_files = batch_connections(arcpy.GetParameterAsText(0))
+    report_loc = arcpy.GetParameterAsText(1)
+    check_input = arcpy.GetParameterAsText(2)
+    if check_input in [None, '', ' ']:
+        check_names = audit_modules
+    else:
+        check_names = [check.strip("' ") for check in check_input.split(';')]
+    workers = int(arcpy.GetParameterAsText(3) or 1)
+    #   Workspaces of one DBMS audited at once, so a database server is not overloaded
+    dbms_limit = int(arcpy.GetParameterAsText(4) or 1)
+    #   Minutes a workspace may take before it is recorded as failed, 0 waits for every workspace
+    timeout_minutes = float(arcpy.GetParameterAsText(19) or 240)
+    #   Inputs of the checks, each check reads the ones it needs
+    options = {'batch_size': arcpy.GetParameterAsText(5),
+               'pushdown': arcpy.GetParameterAsText(6),
+               'wkt_srs': arcpy.GetParameterAsText(7),
+               'db_type': arcpy.GetParameterAsText(8),
+               'count_mode': arcpy.GetParameterAsText(9),
+               'null_blank': arcpy.GetParameterAsText(10),
+               'hygiene_rules': arcpy.GetParameterAsText(11),
+               'attribute_rules': arcpy.GetParameterAsText(12),
+               'threshold': arcpy.GetParameterAsText(13),
+               'export_format': arcpy.GetParameterAsText(14),
+               'findings_format': arcpy.GetParameterAsText(15),
+               'findings_compress': arcpy.GetParameterAsText(16),
+               'history_file': arcpy.GetParameterAsText(17),
+               'instrument': arcpy.GetParameterAsText(18),
+               #   Folders, every workspace keeps its own catalog snapshot, scan state and previous export in them
+               'catalog_file': arcpy.GetParameterAsText(20),
+               'catalog_max_age': arcpy.GetParameterAsText(21),
+               'state_file': arcpy.GetParameterAsText(22),
+               'previous_export': arcpy.GetParameterAsText(23),
+               'report_type': arcpy.GetParameterAsText(24),
+               'sample_size': arcpy.GetParameterAsText(25),
+               'metadata_threads': arcpy.GetParameterAsText(26)}
+
+    start_time = datetime.datetime.today().time()
+    note('BatchAuditRunner.py beginning at {0}...'.format(str(start_time)))
+
+    results = run_batch(conn_files, report_loc, check_names, options, workers, dbms_limit,
+                        timeout_minutes * 60 if timeout_minutes > 0 else None)
+    report_file = open(os.path.join(report_loc, 'Batch_Audit_Summary.txt'), 'w')
+    write_batch_summary(report_file, results)
+    report_file.close()
+    write_batch_matrix(os.path.join(report_loc, 'Batch_Audit_Matrix.csv'), results, check_names)
+
+    note('All workspaces have been audited. Please see results in the generated txt and csv files.')
+    end_time = datetime.datetime.today().time()
+    note('BatchAuditRunner.py completed at {0}...'.format(str(end_time)))
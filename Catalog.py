@@ -0,0 +1,270 @@
+#   ----------------------------------------------------------------
+#   Name:           Catalog.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module and tool that walks a workspace once and
+#                   builds an in-memory catalog of its feature
+#                   classes, tables, feature datasets, fields,
+#                   domains and spatial references. The catalog can
+#                   be saved to a compact snapshot that the schema
+#                   checks read instead of the database, it is
+#                   rebuilt when the schema stamp of the workspace
+#                   changes or it is older than a maximum age.
+#                   Enterprise geodatabases are read from GDB_Items
+#                   in bulk, with the Describe walk as the fallback.
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import datetime
+import json
+import os
+import time
+from CatalogModel import Catalog, Dataset, Domain, FeatureDataset, Field, SpatialRef, Subtype, definition_hash, \
+    iter_datasets, load_catalog, save_catalog
+from GdbItems import read_catalog, read_schema_stamp
+from Instrument import span
+
+
+#   Global variables
+#   dbclient connection property to the GdbItems dialect
+dbms_dialects = {'sqlserver': 'SQL Server', 'oracle': 'Oracle', 'postgresql': 'PostgreSQL'}
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that reads the spatial reference properties the checks compare
+def read_spatial_ref(srs):
+    if srs is None:
+        return None
+    return SpatialRef(srs.name, srs.factoryCode, srs.exportToString(), srs.XYTolerance, srs.XYResolution, srs.domain)
+
+
+#   Function that reads the subtypes of a feature class or table and the domains they assign
+def read_subtypes(name):
+    subtypes = []
+    with span('ListSubtypes', 'arcpy', dataset=name):
+        subtype_items = sorted(arcpy.da.ListSubtypes(name).items())
+    for code, subtype in subtype_items:
+        if not subtype['SubtypeField']:
+            continue
+        field_domains = [[field, values[1].name] for field, values in subtype['FieldValues'].items()
+                         if values[1] is not None]
+        subtypes.append(Subtype(code, subtype['Name'], field_domains))
+    return subtypes
+
+
+#   Function that describes a feature class or table once and keeps its fields, spatial reference and subtypes
+#   The Describe walk has no definition XML, so the definition hash covers the described properties
+#   Members of a feature dataset share its spatial reference, which is passed in instead of read again
+def read_dataset(name, feature_dataset=None, feature_dataset_srs=None):
+    with span('Describe', 'arcpy', dataset=name):
+        desc = arcpy.Describe(name)
+        fields = [Field(fn.name, fn.aliasName, fn.type, fn.length, fn.domain, fn.isNullable) for fn in desc.fields]
+    if feature_dataset_srs is not None:
+        srs = feature_dataset_srs
+        dataset_type = 'FeatureClass'
+    elif hasattr(desc, 'spatialReference'):
+        srs = read_spatial_ref(desc.spatialReference)
+        dataset_type = 'FeatureClass'
+    else:
+        srs = None
+        dataset_type = 'Table'
+    subtypes = read_subtypes(name)
+    def_hash = definition_hash(json.dumps([desc.aliasName, dataset_type, srs, fields, subtypes]))
+    return Dataset(name, desc.aliasName, dataset_type, feature_dataset, srs, fields, def_hash, subtypes)
+
+
+#   Function that reads the workspace domains
+def read_domains(conn_file):
+    domains = []
+    with span('ListDomains', 'arcpy'):
+        workspace_domains = arcpy.da.ListDomains(conn_file)
+    for domain in workspace_domains:
+        if domain.domainType == 'CodedValue':
+            coded_values = [[val, desc] for val, desc in domain.codedValues.items()]
+            domain_range = None
+        else:
+            coded_values = None
+            domain_range = list(domain.range)
+        domains.append(Domain(domain.name, domain.domainType, domain.type, coded_values, domain_range))
+    return domains
+
+
+#   Function that walks the workspace a single time and returns the catalog
+def walk_catalog(conn_file):
+    arcpy.env.workspace = conn_file
+    conn_base = os.path.basename(conn_file)
+    note('Walking the {0} catalog...'.format(conn_base))
+    domains = read_domains(conn_file)
+    with span('ListFeatureClasses', 'arcpy'):
+        fc_names = sorted(arcpy.ListFeatureClasses())
+    feature_classes = [read_dataset(fc) for fc in fc_names]
+    with span('ListTables', 'arcpy'):
+        tbl_names = sorted(arcpy.ListTables())
+    tables = [read_dataset(tbl) for tbl in tbl_names]
+    with span('ListDatasets', 'arcpy'):
+        ds_names = sorted(arcpy.ListDatasets())
+    feature_datasets = []
+    for ds in ds_names:
+        note('Reading the {0} Feature Dataset...'.format(ds))
+        with span('Describe', 'arcpy', dataset=ds):
+            ds_srs = read_spatial_ref(arcpy.Describe(ds).spatialReference)
+        with span('ListFeatureClasses', 'arcpy', dataset=ds):
+            ds_fc_names = sorted(arcpy.ListFeatureClasses(feature_dataset=ds))
+        ds_fcs = [read_dataset(fc, ds, ds_srs) for fc in ds_fc_names]
+        feature_datasets.append(FeatureDataset(ds, ds_srs, ds_fcs))
+    return Catalog(conn_base, datetime.datetime.today().isoformat(timespec='seconds'), domains,
+                   feature_classes, tables, feature_datasets, None)
+
+
+#   Function that returns the GdbItems dialect of an enterprise geodatabase, or None for other workspaces
+def workspace_dialect(conn_file):
+    desc = arcpy.Describe(conn_file)
+    if desc.workspaceType != 'RemoteDatabase':
+        return None
+    return dbms_dialects.get(getattr(desc.connectionProperties, 'dbclient', '').lower())
+
+
+#   Function that returns the identity of a workspace, the same for every connection file to it
+#   An enterprise geodatabase is its DBMS client, instance, database and version, any other workspace is its
+#   normalized full path
+def workspace_identity(conn_file):
+    desc = arcpy.Describe(conn_file)
+    if desc.workspaceType == 'RemoteDatabase':
+        props = desc.connectionProperties
+        parts = [str(getattr(props, name, '') or '') for name in ['dbclient', 'instance', 'database', 'version']]
+        if parts[1] or parts[2]:
+            return '/'.join(parts).lower()
+    return os.path.normcase(os.path.abspath(conn_file))
+
+
+#   Function that returns an execute function over ArcSDESQLExecute
+#   ArcSDESQLExecute returns a scalar for a single value and True for an empty result, these become row lists
+def sde_executor(conn_file):
+    sde_conn = arcpy.ArcSDESQLExecute(conn_file)
+
+    def execute(sql):
+        with span('ArcSDESQLExecute', 'sql'):
+            result = sde_conn.execute(sql)
+        if isinstance(result, list):
+            return result
+        if result is True or result is None:
+            return []
+        return [[result]]
+    return execute
+
+
+#   Function that reads an enterprise catalog from GDB_Items
+#   Tables and feature classes that are not registered with the geodatabase are described individually
+def read_catalog_items(conn_file, dialect):
+    conn_base = os.path.basename(conn_file)
+    note('Reading the {0} catalog from GDB_Items...'.format(conn_base))
+    catalog = read_catalog(sde_executor(conn_file), dialect, conn_base)
+    registered = set(dataset.name.upper() for fds, dataset in iter_datasets(catalog))
+    arcpy.env.workspace = conn_file
+    feature_classes = catalog.featureClasses + [read_dataset(fc) for fc in arcpy.ListFeatureClasses()
+                                                if fc.upper() not in registered]
+    tables = catalog.tables + [read_dataset(tbl) for tbl in arcpy.ListTables() if tbl.upper() not in registered]
+    return catalog._replace(featureClasses=sorted(feature_classes, key=lambda dataset: dataset.name),
+                            tables=sorted(tables, key=lambda dataset: dataset.name))
+
+
+#   Function that builds the catalog from GDB_Items when it can and falls back to the Describe walk
+def build_catalog(conn_file):
+    dialect = workspace_dialect(conn_file)
+    if dialect is not None:
+        try:
+            return read_catalog_items(conn_file, dialect)
+        except Exception as e:
+            note('GDB_Items could not be read ({0}), walking the catalog instead...'.format(e))
+    return walk_catalog(conn_file)
+
+
+#   Function that returns a stamp of the workspace schema that changes when the schema does, None when unknown
+#   Enterprise geodatabases are stamped from GDB_Items, so datasets that are not registered are not covered.
+#   File geodatabases are stamped by the file of their GDB_Items table.
+def schema_stamp(conn_file):
+    try:
+        dialect = workspace_dialect(conn_file)
+        if dialect is not None:
+            return read_schema_stamp(sde_executor(conn_file), dialect)
+        items_file = os.path.join(conn_file, 'a00000004.gdbtable')
+        if os.path.exists(items_file):
+            items_stat = os.stat(items_file)
+            return '{0}/{1}'.format(items_stat.st_mtime_ns, items_stat.st_size)
+    except Exception as e:
+        note('The {0} schema stamp could not be read ({1})...'.format(conn_file, e))
+    return None
+
+
+#   Function that returns why a snapshot no longer describes the workspace, None while it still does
+#   max_age is in hours. A snapshot of a workspace that cannot be stamped is judged by its age alone.
+def snapshot_staleness(catalog, stamp, max_age=None):
+    if max_age is not None:
+        age = datetime.datetime.today() - datetime.datetime.fromisoformat(catalog.created)
+        if age > datetime.timedelta(hours=max_age):
+            return 'it is older than {0} hours'.format(max_age)
+    if stamp is not None and catalog.schemaStamp is not None and stamp != catalog.schemaStamp:
+        return 'the schema changed'
+    return None
+
+
+#   Function used by the checks to get a catalog
+#   An existing snapshot is read while it is current, otherwise the workspace is walked and the snapshot written if
+#   a path was given. A snapshot is rebuilt when the schema stamp changed, when it is older than max_age hours or
+#   when it was written by an earlier version.
+def open_catalog(conn_file, snapshot_file='', max_age=None):
+    if snapshot_file in [None, '', ' ']:
+        with span('Build catalog', 'catalog'):
+            return build_catalog(conn_file)
+    stamp = schema_stamp(conn_file)
+    if os.path.exists(snapshot_file):
+        try:
+            catalog = load_catalog(snapshot_file)
+            stale = snapshot_staleness(catalog, stamp, max_age)
+        except ValueError as e:
+            catalog, stale = None, 'it could not be read ({0})'.format(e)
+        if stale is None:
+            note('Using the {0} catalog snapshot created at {1}...'.format(snapshot_file, catalog.created))
+            return catalog
+        note('Rebuilding the {0} catalog snapshot, {1}...'.format(snapshot_file, stale))
+    with span('Build catalog', 'catalog'):
+        catalog = build_catalog(conn_file)._replace(schemaStamp=stamp)
+    save_catalog(catalog, snapshot_file)
+    note('Catalog snapshot written to {0}...'.format(snapshot_file))
+    return catalog
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    conn_file = arcpy.GetParameterAsText(0)
+    conn_base = os.path.basename(conn_file)
+    report_loc = arcpy.GetParameterAsText(1)
+
+    #   Start timer
+    start = time.time()
+    start_time = datetime.datetime.today().time()
+    note('Catalog.py beginning at {0}...'.format(str(start_time)))
+
+    snapshot_path = os.path.join(report_loc, '{0}_Catalog.json.gz'.format(conn_base))
+    stamp = schema_stamp(conn_file)
+    save_catalog(build_catalog(conn_file)._replace(schemaStamp=stamp), snapshot_path)
+    note('Catalog snapshot written to {0}. Pass it to the schema checks to skip the catalog walk.'.format(snapshot_path))
+
+    #   End timer
+    end = time.time()
+    end_time = datetime.datetime.today().time()
+    #   Timer math
+    note('Catalog.py completed at {0}...'.format(str(end_time)))
+    note('It took {0} minutes to complete...'.format(str(round(((end - start)/60), 4))))
@@ -0,0 +1,116 @@
+#   ----------------------------------------------------------------
+#   Name:           CatalogModel.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that contains the workspace catalog model,
+#                   the snapshot reader and writer and the domain
+#                   usage index. It does not
+#                   import arcpy so snapshots and catalog providers
+#                   can be used without a workspace connection.
+#   ----------------------------------------------------------------
+
+#   import modules
+import gzip
+import hashlib
+import json
+from collections import namedtuple
+
+
+#   Catalog model
+#   Attribute names follow the arcpy objects they are read from so the checks can use either
+Field = namedtuple('Field', ['name', 'aliasName', 'type', 'length', 'domain', 'isNullable'])
+SpatialRef = namedtuple('SpatialRef', ['name', 'factoryCode', 'wkt', 'XYTolerance', 'XYResolution', 'domain'])
+#   fieldDomains lists [field, domain] for every field the subtype assigns a domain to
+Subtype = namedtuple('Subtype', ['code', 'name', 'fieldDomains'])
+Dataset = namedtuple('Dataset', ['name', 'aliasName', 'datasetType', 'featureDataset', 'spatialReference', 'fields',
+                                 'definitionHash', 'subtypes'])
+FeatureDataset = namedtuple('FeatureDataset', ['name', 'spatialReference', 'featureClasses'])
+Domain = namedtuple('Domain', ['name', 'domainType', 'type', 'codedValues', 'range'])
+#   schemaStamp tells whether the workspace schema changed since the catalog was read, None when it is not known
+Catalog = namedtuple('Catalog', ['workspace', 'created', 'domains', 'featureClasses', 'tables', 'featureDatasets',
+                                 'schemaStamp'])
+#   One use of a domain, subtype is None for the domain of the field itself
+DomainUse = namedtuple('DomainUse', ['featureDataset', 'dataset', 'datasetType', 'field', 'subtype'])
+#   Metadata of a feature class or table, the four elements MetadataCheck reviews, it is not part of the snapshot
+ItemMetadata = namedtuple('ItemMetadata', ['title', 'tags', 'summary', 'credits'])
+
+#   Snapshot format version, bump whenever one of the tuples above changes shape
+SNAPSHOT_VERSION = 4
+
+
+#   defined functions
+#   Function that hashes a dataset definition so changed datasets can be told apart between runs
+def definition_hash(definition):
+    return hashlib.sha1(definition.encode('utf-8')).hexdigest()
+
+
+#   Function that writes the catalog to a gzipped JSON snapshot
+#   The tuples are written as positional arrays which keeps the snapshot compact
+def save_catalog(catalog, snapshot_file):
+    snapshot = {'version': SNAPSHOT_VERSION}
+    snapshot.update(catalog._asdict())
+    with gzip.open(snapshot_file, 'wt', encoding='utf-8') as snapshot_out:
+        json.dump(snapshot, snapshot_out, separators=(',', ':'))
+
+
+#   Function that rebuilds a dataset tuple from its snapshot array
+def _load_dataset(raw):
+    name, alias, dataset_type, feature_dataset, srs, fields, def_hash, subtypes = raw
+    return Dataset(name, alias, dataset_type, feature_dataset, SpatialRef(*srs) if srs else None,
+                   [Field(*fn) for fn in fields], def_hash, [Subtype(*subtype) for subtype in subtypes])
+
+
+#   Function that reads a catalog snapshot written by save_catalog
+def load_catalog(snapshot_file):
+    with gzip.open(snapshot_file, 'rt', encoding='utf-8') as snapshot_in:
+        snapshot = json.load(snapshot_in)
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        raise ValueError('{0} is a version {1} catalog snapshot, expected version {2}. '
+                         'Rebuild it with Catalog.py.'.format(snapshot_file, snapshot.get('version'),
+                                                              SNAPSHOT_VERSION))
+    feature_datasets = []
+    for name, srs, fcs in snapshot['featureDatasets']:
+        feature_datasets.append(FeatureDataset(name, SpatialRef(*srs) if srs else None,
+                                               [_load_dataset(fc) for fc in fcs]))
+    return Catalog(snapshot['workspace'], snapshot['created'],
+                   [Domain(*domain) for domain in snapshot['domains']],
+                   [_load_dataset(fc) for fc in snapshot['featureClasses']],
+                   [_load_dataset(tbl) for tbl in snapshot['tables']],
+                   feature_datasets, snapshot['schemaStamp'])
+
+
+#   Function that yields every feature class and table with its feature dataset in report order
+def iter_datasets(catalog):
+    for fc in catalog.featureClasses:
+        yield None, fc
+    for tbl in catalog.tables:
+        yield None, tbl
+    for ds in catalog.featureDatasets:
+        for fc in ds.featureClasses:
+            yield ds.name, fc
+
+
+#   Function that yields (domain, DomainUse) for every domain assignment of the catalog in report order
+#   A subtype assignment is only yielded where it differs from the domain of the field itself
+def iter_domain_uses(catalog):
+    for fds, dataset in iter_datasets(catalog):
+        field_domains = {}
+        for fn in dataset.fields:
+            field_domains[fn.name] = fn.domain
+            if fn.domain not in [None, '']:
+                yield fn.domain, DomainUse(fds, dataset.name, dataset.datasetType, fn.name, None)
+        for subtype in dataset.subtypes:
+            for field, domain in subtype.fieldDomains:
+                if domain not in [None, ''] and domain != field_domains.get(field):
+                    yield domain, DomainUse(fds, dataset.name, dataset.datasetType, field, subtype.name)
+
+
+#   Function that builds the domain usage index of the catalog, {domain: [DomainUse, ...]}
+#   Domains that nothing uses are not in the index
+def domain_usage(catalog):
+    usage = {}
+    for domain, use in iter_domain_uses(catalog):
+        usage.setdefault(domain, []).append(use)
+    return usage
@@ -0,0 +1,238 @@
+#   ----------------------------------------------------------------
+#   Name:           CheckBenchmark.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Script that writes a synthetic file geodatabase
+#                   of the size given by a spec, see SyntheticData,
+#                   times the catalog read and every check on it and
+#                   records the rows read per second and the peak
+#                   memory. The results are compared with a stored
+#                   baseline, which is written when it does not exist
+#                   yet. Peak memory is traced with tracemalloc in
+#                   every run, so the times include its overhead and
+#                   stay comparable with the baseline. Run it from
+#                   the ArcGIS Pro python environment:
+#                   python CheckBenchmark.py folder report_folder
+#                   [spec.json] [baseline.json] [tolerance percent]
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+from Audit import audit_context, audit_modules, run_checks
+from Catalog import open_catalog
+from Instrument import counters, start_instrumentation, stop_instrumentation
+from SyntheticData import dataset_rows, read_spec, spec_datasets, spec_domains, spec_feature_datasets, spec_hash, \
+    workspace_wkid
+
+
+#   Global variables
+#   rowsPerSecond is None when the case reads no rows, failed holds the error of a check that failed
+BenchmarkResult = namedtuple('BenchmarkResult', ['seconds', 'rows', 'rowsPerSecond', 'peakMemory', 'failed'])
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that returns the benchmark cases, [label, check, options]
+#   Every check runs with its default options, the row checks also run with the engines and modes that change
+#   how rows are read, and the spatial reference check compares with the spatial reference of the layout
+def benchmark_cases():
+    wkt_srs = arcpy.SpatialReference(workspace_wkid).exportToString()
+    return [[name, name, {}] for name in audit_modules] + [
+        ['AttributeCheck', 'AttributeCheck', {}],
+        ['EmptyDataCheck Exact', 'EmptyDataCheck', {'count_mode': 'Exact'}],
+        ['ExtraSpacesCheck Batch', 'ExtraSpacesCheck', {'batch_size': '50000'}],
+        ['ExtraSpacesCheck Hygiene', 'ExtraSpacesCheck',
+         {'hygiene_rules': 'ExtraSpaces;LeadingSpaces;TrailingSpaces;Tabs'}],
+        ['NullBlankCheck Blank', 'NullBlankCheck', {'null_blank': 'Blank'}],
+        ['NullBlankCheck Batch', 'NullBlankCheck', {'batch_size': '50000'}],
+        ['NullBlankCheck Pushdown', 'NullBlankCheck', {'pushdown': 'true'}],
+        ['NullBlankCheck Profile', 'NullBlankCheck', {'report_type': 'Profile'}],
+        ['SpatialReferenceCheck Compare', 'SpatialReferenceCheck', {'wkt_srs': wkt_srs}]]
+
+
+#   Function that writes a dataset of the layout and inserts its rows
+def write_dataset(gdb, spec, dataset, domains):
+    out_path = gdb if dataset.featureDataset is None else os.path.join(gdb, dataset.featureDataset)
+    if dataset.wkid is None:
+        arcpy.CreateTable_management(out_path, dataset.name)
+    else:
+        arcpy.CreateFeatureclass_management(out_path, dataset.name, 'POINT',
+                                            spatial_reference=arcpy.SpatialReference(dataset.wkid))
+    path = os.path.join(out_path, dataset.name)
+    if dataset.aliasName != dataset.name:
+        arcpy.AlterAliasName(path, dataset.aliasName)
+    for field in dataset.fields:
+        arcpy.AddField_management(path, field.name, 'TEXT', field_length=field.length, field_alias=field.aliasName,
+                                  field_is_nullable='NULLABLE', field_domain=field.domain or '')
+    cursor_fields = [field.name for field in dataset.fields] + (['SHAPE@XY'] if dataset.wkid is not None else [])
+    with arcpy.da.InsertCursor(path, cursor_fields) as cursor:
+        for row in dataset_rows(spec, dataset, domains):
+            cursor.insertRow(row)
+
+
+#   Function that writes the synthetic file geodatabase of a spec in the folder and returns its path
+#   A geodatabase written before for the same spec is reused, the spec file beside it marks it complete
+def write_workspace(folder, spec):
+    gdb = os.path.join(folder, 'Benchmark_{0}.gdb'.format(spec_hash(spec)))
+    spec_file = os.path.join(folder, 'Benchmark_{0}.json'.format(spec_hash(spec)))
+    if arcpy.Exists(gdb) and os.path.exists(spec_file):
+        note('Using the {0} benchmark geodatabase...'.format(gdb))
+        return gdb
+    if arcpy.Exists(gdb):
+        arcpy.Delete_management(gdb)
+    note('Writing the {0} benchmark geodatabase...'.format(gdb))
+    arcpy.CreateFileGDB_management(folder, os.path.basename(gdb))
+    domains = spec_domains(spec)
+    for domain in domains:
+        arcpy.CreateDomain_management(gdb, domain.name, domain.name, 'TEXT', 'CODED')
+        for code, description in domain.codedValues:
+            arcpy.AddCodedValueToDomain_management(gdb, domain.name, code, description)
+    for fds in spec_feature_datasets(spec):
+        arcpy.CreateFeatureDataset_management(gdb, fds, arcpy.SpatialReference(workspace_wkid))
+    for dataset in spec_datasets(spec, domains):
+        note('Writing the {0} rows of {1}...'.format(dataset.rowCount, dataset.name))
+        write_dataset(gdb, spec, dataset, domains)
+    with open(spec_file, 'w') as f:
+        json.dump(spec._asdict(), f, indent=2)
+    return gdb
+
+
+#   Function that returns the result of a case from its seconds, rows read and peak memory
+def case_result(seconds, rows, peak_memory, failed=None):
+    return BenchmarkResult(round(seconds, 4), rows, round(rows / seconds, 1) if rows and seconds else None,
+                           peak_memory, failed)
+
+
+#   Function that times the catalog read of the workspace and writes the snapshot the cases read it from
+def benchmark_catalog(gdb, catalog_file):
+    if os.path.exists(catalog_file):
+        os.remove(catalog_file)
+    start_instrumentation(memory=True)
+    begin = time.perf_counter()
+    open_catalog(gdb, catalog_file)
+    seconds = time.perf_counter() - begin
+    return case_result(seconds, 0, stop_instrumentation())
+
+
+#   Function that times one check with its options, its reports are written to a folder of the case
+#   The catalog comes from the snapshot so only the check itself is timed
+def benchmark_case(gdb, report_loc, catalog_file, label, name, options):
+    case_loc = os.path.join(report_loc, label.replace(' ', '_'))
+    os.makedirs(case_loc, exist_ok=True)
+    context = audit_context(gdb, case_loc, catalog_file, options)
+    start_instrumentation(memory=True)
+    timings, failed = run_checks(context, [name])
+    peak_memory = stop_instrumentation()
+    return case_result(sum(timings.values()), counters['Rows read'], peak_memory,
+                       str(failed[name]) if name in failed else None)
+
+
+#   Function that runs the catalog read and every case and returns {label: BenchmarkResult} in case order
+def run_benchmark(gdb, report_loc):
+    catalog_file = os.path.join(report_loc, 'Benchmark_Catalog.json.gz')
+    results = {'Catalog': benchmark_catalog(gdb, catalog_file)}
+    for label, name, options in benchmark_cases():
+        note('Benchmarking {0}...'.format(label))
+        results[label] = benchmark_case(gdb, report_loc, catalog_file, label, name, options)
+    return results
+
+
+#   Function that compares the results with the baseline results
+#   A case is Slower or uses More memory when it is above the baseline by more than tolerance, a fraction.
+#   Returns [label, seconds, baseline seconds, peak memory, baseline peak memory, status] for every case
+def compare_results(results, baseline, tolerance):
+    comparison = []
+    for label, result in results.items():
+        base = baseline.get(label)
+        if result.failed is not None:
+            status = 'Failed'
+        elif base is None:
+            status = 'New'
+        elif result.seconds > base.seconds * (1 + tolerance):
+            status = 'Slower'
+        elif (result.peakMemory or 0) > (base.peakMemory or 0) * (1 + tolerance):
+            status = 'More memory'
+        elif result.seconds < base.seconds * (1 - tolerance):
+            status = 'Faster'
+        else:
+            status = 'Same'
+        comparison.append([label, result.seconds, base.seconds if base else None, result.peakMemory,
+                           base.peakMemory if base else None, status])
+    return comparison
+
+
+#   Function that writes the spec and the results to a JSON file the next runs compare with
+def save_results(results_file, spec, results):
+    with open(results_file, 'w') as f:
+        json.dump({'spec': spec._asdict(), 'results': dict((label, result._asdict())
+                                                           for label, result in results.items())}, f, indent=2)
+
+
+#   Function that reads the spec and {label: BenchmarkResult} of a results file
+def load_results(results_file):
+    with open(results_file) as f:
+        saved = json.load(f)
+    return [read_spec(saved['spec']), dict((label, BenchmarkResult(**result))
+                                           for label, result in saved['results'].items())]
+
+
+#   Function that formats a number of bytes in megabytes for the result table
+def megabytes(size):
+    return '-' if size is None else '{0:.1f} MB'.format(size / 1048576)
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    folder = sys.argv[1]
+    report_loc = sys.argv[2]
+    spec_values = {}
+    if len(sys.argv) > 3 and sys.argv[3] not in ['', ' ']:
+        with open(sys.argv[3]) as f:
+            spec_values = json.load(f)
+    baseline_file = sys.argv[4] if len(sys.argv) > 4 else ''
+    tolerance = float(sys.argv[5]) / 100 if len(sys.argv) > 5 else 0.1
+    spec = read_spec(spec_values)
+
+    os.makedirs(report_loc, exist_ok=True)
+    gdb = write_workspace(folder, spec)
+    results = run_benchmark(gdb, report_loc)
+    save_results(os.path.join(report_loc, 'Benchmark_Results.json'), spec, results)
+
+    baseline = {}
+    if baseline_file not in ['', ' '] and os.path.exists(baseline_file):
+        baseline_spec, baseline = load_results(baseline_file)
+        if baseline_spec != spec:
+            raise ValueError('The baseline was recorded with a different spec.')
+    comparison = compare_results(results, baseline, tolerance)
+
+    print('{0} feature classes, {1} tables, {2} fields, {3} rows per dataset'.format(
+        spec.featureClasses, spec.tables, spec.fields, spec.rows))
+    for label, seconds, base_seconds, peak_memory, base_memory, status in comparison:
+        result = results[label]
+        print('{0:<30}{1:>10.3f} s{2:>12}{3:>14} rows/s{4:>11}{5:>12}  {6}'.format(
+            label, seconds, '-' if base_seconds is None else '{0:.3f} s'.format(base_seconds),
+            '-' if result.rowsPerSecond is None else '{0:,.0f}'.format(result.rowsPerSecond),
+            megabytes(peak_memory), megabytes(base_memory), status))
+
+    if baseline_file not in ['', ' '] and not baseline:
+        save_results(baseline_file, spec, results)
+        print('Baseline written to {0}'.format(baseline_file))
+    #   A regression fails the run so a nightly job can stop on it
+    if any(status in ['Slower', 'More memory', 'Failed'] for label, seconds, base_seconds, peak_memory,
+           base_memory, status in comparison):
+        sys.exit(1)
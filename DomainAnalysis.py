@@ -0,0 +1,122 @@
+#   ----------------------------------------------------------------
+#   Name:           DomainAnalysis.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that compares the coded values of the
+#                   catalog domains in memory. Descriptions are
+#                   compared exactly and by a normalized key, and
+#                   domains with similar coded value sets are found
+#                   with MinHash signatures and locality sensitive
+#                   hashing so the pairs compared stay far below all
+#                   pairs of domains. It does not import arcpy.
+#   ----------------------------------------------------------------
+
+#   import modules
+import hashlib
+import random
+import re
+import unicodedata
+from collections import defaultdict
+
+
+#   Global variables
+#   MinHash permutations are a * x + b modulo a Mersenne prime, with fixed coefficients so runs are repeatable
+MINHASH_PRIME = (1 << 61) - 1
+MINHASH_PERMUTATIONS = 128
+#   Bands of the LSH index, the rows per band are the permutations divided by the bands
+#   32 bands of 4 rows make pairs with a Jaccard score of 0.5 candidates 87% of the time
+LSH_BANDS = 32
+
+
+#   defined functions
+#   Function that groups the coded value descriptions of every coded value domain in one pass
+#   Returns {description: [domain name for every use of the description]} for the descriptions used more
+#   than once, in the order the descriptions first appear
+def duplicate_descriptions(domains):
+    description_domains = {}
+    for domain in domains:
+        if domain.domainType != 'CodedValue':
+            continue
+        for code, description in domain.codedValues:
+            description_domains.setdefault(str(description), []).append(domain.name)
+    return dict((description, names) for description, names in description_domains.items() if len(names) > 1)
+
+
+#   Function that returns the key descriptions are compared by
+#   Compatibility characters are folded, case is ignored and runs of punctuation and spaces become one space
+def normalize_description(description):
+    text = unicodedata.normalize('NFKC', str(description)).casefold()
+    return ' '.join(re.split(r'[\W_]+', text)).strip()
+
+
+#   Function that groups the coded value descriptions by their normalized key
+#   Returns {key: [(description, domain name), ...]} for the keys written more than one way
+def near_duplicate_descriptions(domains):
+    key_uses = defaultdict(list)
+    for domain in domains:
+        if domain.domainType != 'CodedValue':
+            continue
+        for code, description in domain.codedValues:
+            key = normalize_description(description)
+            if key:
+                key_uses[key].append((str(description), domain.name))
+    return dict((key, uses) for key, uses in key_uses.items() if len(set(desc for desc, name in uses)) > 1)
+
+
+#   Function that returns the set of normalized coded values of a domain
+def domain_tokens(domain):
+    return frozenset('{0}={1}'.format(normalize_description(code), normalize_description(description))
+                     for code, description in domain.codedValues)
+
+
+#   Function that returns the fixed permutation coefficients of the MinHash signatures
+def minhash_coefficients(num_perm=MINHASH_PERMUTATIONS):
+    generator = random.Random(0)
+    return [(generator.randrange(1, MINHASH_PRIME), generator.randrange(0, MINHASH_PRIME)) for i in range(num_perm)]
+
+
+#   Function that returns the MinHash signature of a token set
+#   Tokens are hashed with blake2b because the built in string hash changes between runs
+def minhash_signature(tokens, coefficients):
+    hashes = [int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+              for token in tokens]
+    return tuple(min((a * h + b) % MINHASH_PRIME for h in hashes) for a, b in coefficients)
+
+
+#   Function that returns the pairs of keys whose signatures agree on every row of at least one band
+def lsh_candidates(signatures, bands=LSH_BANDS):
+    candidates = set()
+    for band in range(bands):
+        buckets = defaultdict(list)
+        for key, signature in signatures.items():
+            rows = len(signature) // bands
+            buckets[signature[band * rows:(band + 1) * rows]].append(key)
+        for keys in buckets.values():
+            for i, first in enumerate(keys):
+                for second in keys[i + 1:]:
+                    candidates.add((first, second) if first < second else (second, first))
+    return candidates
+
+
+#   Function that returns the Jaccard score of two sets
+def jaccard(first, second):
+    union = len(first | second)
+    return len(first & second) / union if union else 0.0
+
+
+#   Function that finds the coded value domains whose coded value sets are similar
+#   LSH candidates are confirmed with the exact Jaccard score
+#   Returns [(score, domain name, domain name)] at or above the threshold, best scores first
+def similar_domains(domains, threshold=0.8, num_perm=MINHASH_PERMUTATIONS, bands=LSH_BANDS):
+    tokens = dict((domain.name, domain_tokens(domain)) for domain in domains
+                  if domain.domainType == 'CodedValue' and domain.codedValues)
+    coefficients = minhash_coefficients(num_perm)
+    signatures = dict((name, minhash_signature(domain_set, coefficients)) for name, domain_set in tokens.items())
+    pairs = []
+    for first, second in lsh_candidates(signatures, bands):
+        score = jaccard(tokens[first], tokens[second])
+        if score >= threshold:
+            pairs.append((score, first, second))
+    return sorted(pairs, key=lambda pair: (-pair[0], pair[1], pair[2]))
@@ -1,103 +1,61 @@
-#   ----------------------------------------------------------------
-#   Name:           DomainAssociationCheck.py
-#   Created by:     Neil Rose
-#   Created on:     6/24/2021
-#   Modified by:
-#   Modified on:
-#   Description:    Tool that checks domain association
-#   ----------------------------------------------------------------
-
-#   import modules
-import arcpy
-import datetime
-import os
-import time
-
-
-#   defined functions
-#   Function for creating output messages
-def note(message):
-    return arcpy.AddMessage(str(message))
-
-
-#   Set environments
-arcpy.env.overwriteOutput = True
-
-#   Set inputs
-conn_file = arcpy.GetParameterAsText(0)
-conn_base = os.path.basename(conn_file)
-report_loc = arcpy.GetParameterAsText(1)
-
-#   Global variables
-sde_domain_list = []
-fc_domain_list = []
-orphan_domain_list = []
-orphan_domain_count = 0
-
-#   Main script
-#   Start timer
-start = time.time()
-start_time = datetime.datetime.today().time()
-note('ReservedWordCheck.py beginning at {0}...'.format(str(start_time)))
-#   Begin checking reserved words
-arcpy.env.workspace = conn_file
-
-report_file = open(os.path.join(report_loc, '{0}_DomainAssociation_Check.txt'.format(conn_base)), 'w')
-
-note('-------------------')
-note('Reading SDE Domains')
-note('-------------------')
-domains = arcpy.da.ListDomains(conn_file)
-for domain in domains:
-    sde_domain_list.append(domain.name)
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} features...'.format(os.path.basename(conn_base)))
-note('-------------------------------------------------------------------')
-for fc in sorted(arcpy.ListFeatureClasses()):
-    note('Checking the {0} Feature Class...'.format(fc))
-    fc_desc = arcpy.Describe(fc)
-    for fn in (arcpy.ListFields(fc)):
-        if fn.domain not in [None, '']:
-            report_file.write('fc: {0} - '
-                              'Feature Class: {1} - '
-                              'Field Name: {2} '
-                              'uses {3} domain.\n'.format(conn_base, fc, fn.name, fn.domain))
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} tables...'.format(conn_base))
-note('-------------------------------------------------------------------')
-for tbl in sorted(arcpy.ListTables()):
-    note('Checking the {0} Table...'.format(tbl))
-    tbl_desc = arcpy.Describe(tbl)
-    for fn in (arcpy.ListFields(tbl)):
-        if fn.domain not in [None, '']:
-            report_file.write('tbl: {0} - '
-                              'Table: {1} - '
-                              'Field Name: {2} '
-                              'uses {3} domain.\n'.format(conn_base, tbl, fn.name, fn.domain))
-
-datasets = sorted(arcpy.ListDatasets())
-for ds in datasets:
-    note('-------------------------------------------------------------------')
-    note('Checking the {0} Feature Dataset...'.format(ds))
-    note('-------------------------------------------------------------------')
-    for fc in sorted(arcpy.ListFeatureClasses(feature_dataset=ds)):
-        note('Checking the {0} Feature Class...'.format(fc))
-        fc_desc = arcpy.Describe(fc)
-        for fn in (arcpy.ListFields(fc)):
-            if fn.domain not in [None, '']:
-                report_file.write('fds: {0} - '
-                                  'Feature Dataset: {1} - '
-                                  'Feature Class: {2} - '
-                                  'Field Name: {3} '
-                                  'uses {4} domain.\n'.format(conn_base, ds, fc, fn.name, fn.domain))
-
-report_file.close()
-note('All fieldnames and domains have been verified. Please see results in the generated txt file.')
-#   End timer
-end = time.time()
-end_time = datetime.datetime.today().time()
-#   Timer math
-note('DomainAssociationCheck.py completed at {0}...'.format(str(end_time)))
-note('It took {0} minutes to complete...'.format(str(round(((end - start)/60), 4))))
+#   ----------------------------------------------------------------
+#   Name:           DomainAssociationCheck.py
+#   Created by:     Neil Rose
+#   Created on:     6/24/2021
+#   Modified by:    GIS Systems Architecture
+#   Modified on:    10/18/2026
+#   Description:    Tool that checks domain association, including
+#                   the domains subtypes assign
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import datetime
+import os
+from Audit import audit_context, finding_line, register_check, report_finding, run_check
+from CatalogModel import iter_domain_uses
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that writes every use of every domain
+def finish_check(state, context, dataset_results):
+    report_file = open(os.path.join(context.report_loc,
+                                    '{0}_DomainAssociation_Check.txt'.format(context.conn_base)), 'w')
+    note('-------------------------------------------------------------------')
+    note('Checking the {0} domain usage...'.format(context.conn_base))
+    note('-------------------------------------------------------------------')
+    for domain, use in iter_domain_uses(context.catalog):
+        if use.subtype is None:
+            usage = 'uses {0} domain.'.format(domain)
+        else:
+            usage = 'uses {0} domain in the {1} subtype.'.format(domain, use.subtype)
+        report_file.write(finding_line(report_finding(context, 'DomainAssociationCheck', use.featureDataset,
+                                                      use.dataset, use.field, 'DomainAssociation', usage, 'Info'),
+                                       use.datasetType))
+    report_file.close()
+
+
+register_check('DomainAssociationCheck', None, finish=finish_check)
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    conn_file = arcpy.GetParameterAsText(0)
+    report_loc = arcpy.GetParameterAsText(1)
+    catalog_file = arcpy.GetParameterAsText(2)
+
+    start_time = datetime.datetime.today().time()
+    note('DomainAssociationCheck.py beginning at {0}...'.format(str(start_time)))
+    run_check(audit_context(conn_file, report_loc, catalog_file), 'DomainAssociationCheck')
+    note('All fieldnames and domains have been verified. Please see results in the generated txt file.')
+    end_time = datetime.datetime.today().time()
+    note('DomainAssociationCheck.py completed at {0}...'.format(str(end_time)))
@@ -1,71 +1,131 @@
-#   ----------------------------------------------------------------
-#   Name:           DomainDictionary.py
-#   Created by:     Neil Rose
-#   Created on:     5/6/2021
-#   Modified by:
-#   Modified on:
-#   Description:    Tool that generates a domain dictionary
-#   ----------------------------------------------------------------
-
-#   import modules
-import arcpy
-import datetime
-import os
-import time
-
-
-#   defined functions
-#   Function for creating output messages
-def note(message):
-    return arcpy.AddMessage(str(message))
-
-
-#   Set environments
-arcpy.env.overwriteOutput = True
-
-#   Set inputs
-conn_file = arcpy.GetParameterAsText(0)
-conn_base = os.path.basename(conn_file)
-report_loc = arcpy.GetParameterAsText(1)
-
-#   Global variables
-domain_count = 0
-
-#   Main script
-#   Start timer
-start = time.time()
-start_time = datetime.datetime.today().time()
-note('DomainDictionary.py beginning at {0}...'.format(str(start_time)))
-#   Begin domains and domain values
-arcpy.env.workspace = conn_file
-
-report_file = open(os.path.join(report_loc, '{0}_Domain_Dictionary.txt'.format(conn_base)), 'w')
-
-note('-------------------')
-note('Reading SDE Domains')
-note('-------------------')
-domains = arcpy.da.ListDomains(conn_file)
-
-for domain in domains:
-    note('Reading/writing the {0} domain.'.format(domain.name))
-    domain_count += 1
-    report_file.write('________________________________________\n')
-    report_file.write('Domain name: {0}\n'.format(domain.name))
-    if domain.domainType == 'CodedValue':
-        coded_values = domain.codedValues
-        for val, desc in coded_values.items():
-            report_file.write('{0} : {1}\n'.format(str(val), str(desc)))
-    elif domain.domainType == 'Range':
-        report_file.write('Range: {0} - {1}\n'.format(domain.range[0], domain.range[1]))
-
-report_file.write('\n\n{0} has {1} domains.'.format(conn_base, domain_count))
-
-report_file.close()
-
-note('All domains and domain values have been recorded. Please see results in the generated txt file.')
-#   End timer
-end = time.time()
-end_time = datetime.datetime.today().time()
-#   Timer math
-note('DomainDictionary.py completed at {0}...'.format(str(end_time)))
-note('It took {0} minutes to complete...'.format(str(round(((end - start)/60), 4))))
+#   ----------------------------------------------------------------
+#   Name:           DomainDictionary.py
+#   Created by:     Neil Rose
+#   Created on:     5/6/2021
+#   Modified by:    GIS Systems Architecture
+#   Modified on:    10/18/2026
+#   Description:    Tool that generates a domain dictionary with the
+#                   fields and subtypes that use each domain. It can
+#                   also export the domains in a structured format
+#                   and report the drift from a previous export.
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import datetime
+import os
+from Audit import audit_context, option, register_check, run_check
+from CatalogModel import domain_usage
+from DomainExport import diff_exports, export_domains, export_extensions
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that writes the domains added, removed and changed since the previous export
+def write_drift(context, added, removed, changed):
+    drift_file = open(os.path.join(context.report_loc, '{0}_Domain_Drift.txt'.format(context.conn_base)), 'w')
+    for name in added:
+        drift_file.write('Domain {0} was added\n'.format(name))
+    for name in removed:
+        drift_file.write('Domain {0} was removed\n'.format(name))
+    for name, changes in changed.items():
+        drift_file.write('Domain {0} was changed\n'.format(name))
+        for change in changes:
+            drift_file.write('    {0}\n'.format(change))
+    drift_file.write('\n\nAdded Domains: {0}\n'
+                     'Removed Domains: {1}\n'
+                     'Changed Domains: {2}'.format(len(added), len(removed), len(changed)))
+    drift_file.close()
+
+
+#   Function that exports the domains and reports the drift from the previous export
+#   export_format is JSONL, CSV, SQLite or Parquet, previous_export is the export of an earlier run
+def export_check(context, export_format, previous_export):
+    note('---------------------')
+    note('Exporting SDE Domains')
+    note('---------------------')
+    export_base = os.path.join(context.report_loc, '{0}_Domain_Dictionary'.format(context.conn_base))
+    export_path = '{0}.{1}'.format(export_base, export_extensions[export_format])
+    #   A previous export in the place of the new one is kept aside for the comparison
+    if previous_export is not None and os.path.abspath(previous_export) == os.path.abspath(export_path):
+        previous_export = '{0}_Previous.{1}'.format(export_base, export_extensions[export_format])
+        if os.path.exists(export_path):
+            os.replace(export_path, previous_export)
+    #   The first run has nothing to compare with yet
+    if previous_export is not None and not os.path.exists(previous_export):
+        note('There is no previous export at {0} yet, the drift is reported from the next run...'
+             .format(previous_export))
+        previous_export = None
+    export_file = export_domains(context.catalog.domains, export_base, export_format)
+    note('Domains exported to {0}...'.format(export_file))
+    if previous_export is not None:
+        note('Comparing the export with {0}...'.format(previous_export))
+        write_drift(context, *diff_exports(previous_export, export_file))
+
+
+#   Function that writes the domain dictionary, and the export when an export format is given
+def finish_check(state, context, dataset_results):
+    conn_base = context.conn_base
+    usage = domain_usage(context.catalog)
+    domain_count = 0
+
+    report_file = open(os.path.join(context.report_loc, '{0}_Domain_Dictionary.txt'.format(conn_base)), 'w')
+
+    note('-------------------')
+    note('Reading SDE Domains')
+    note('-------------------')
+    for domain in context.catalog.domains:
+        note('Reading/writing the {0} domain.'.format(domain.name))
+        domain_count += 1
+        report_file.write('________________________________________\n')
+        report_file.write('Domain name: {0}\n'.format(domain.name))
+        if domain.domainType == 'CodedValue':
+            for val, desc in domain.codedValues:
+                report_file.write('{0} : {1}\n'.format(str(val), str(desc)))
+        elif domain.domainType == 'Range':
+            report_file.write('Range: {0} - {1}\n'.format(domain.range[0], domain.range[1]))
+        for use in usage.get(domain.name, []):
+            if use.subtype is None:
+                report_file.write('Used by: {0}.{1}\n'.format(use.dataset, use.field))
+            else:
+                report_file.write('Used by: {0}.{1} in the {2} subtype\n'.format(use.dataset, use.field,
+                                                                                use.subtype))
+        if domain.name not in usage:
+            report_file.write('Not used by any field\n')
+
+    report_file.write('\n\n{0} has {1} domains.'.format(conn_base, domain_count))
+
+    report_file.close()
+
+    if option(context, 'export_format') is not None:
+        export_check(context, option(context, 'export_format'), option(context, 'previous_export'))
+
+
+register_check('DomainDictionary', None, finish=finish_check)
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    conn_file = arcpy.GetParameterAsText(0)
+    report_loc = arcpy.GetParameterAsText(1)
+    catalog_file = arcpy.GetParameterAsText(2)
+    #   JSONL, CSV, SQLite or Parquet, the text dictionary is always written
+    export_format = arcpy.GetParameterAsText(3)
+    #   Export of an earlier run to report the domain drift against
+    previous_export = arcpy.GetParameterAsText(4)
+
+    start_time = datetime.datetime.today().time()
+    note('DomainDictionary.py beginning at {0}...'.format(str(start_time)))
+    run_check(audit_context(conn_file, report_loc, catalog_file,
+                            {'export_format': export_format, 'previous_export': previous_export}), 'DomainDictionary')
+    note('All domains and domain values have been recorded. Please see results in the generated txt file.')
+    end_time = datetime.datetime.today().time()
+    note('DomainDictionary.py completed at {0}...'.format(str(end_time)))
@@ -0,0 +1,212 @@
+#   ----------------------------------------------------------------
+#   Name:           DomainExport.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that exports the catalog domains to JSONL,
+#                   CSV, SQLite or Parquet with a content hash per
+#                   domain, and diffs two exports. The diff compares
+#                   the hashes first and reads the coded values of
+#                   the changed domains only. Parquet needs pyarrow.
+#                   It does not import arcpy.
+#   ----------------------------------------------------------------
+
+#   import modules
+import csv
+import json
+import os
+import sqlite3
+from CatalogModel import definition_hash
+
+
+#   Global variables
+#   Columns of the flat CSV and Parquet exports, one row per coded value and one row per range domain or coded
+#   value domain without values, so every domain has at least one row
+flat_columns = ['name', 'domainType', 'type', 'code', 'description', 'rangeMin', 'rangeMax', 'hash']
+#   File extension of each export format
+export_extensions = {'JSONL': 'jsonl', 'CSV': 'csv', 'SQLite': 'sqlite', 'Parquet': 'parquet'}
+
+
+#   defined functions
+#   Function that returns the content hash of a domain, the name is not part of it so a renamed domain keeps its hash
+def domain_hash(domain):
+    return definition_hash(json.dumps([domain.domainType, domain.type, domain.codedValues, domain.range],
+                                      default=str))
+
+
+#   Function that yields one export record per domain
+def domain_records(domains):
+    for domain in domains:
+        yield {'name': domain.name, 'domainType': domain.domainType, 'type': domain.type,
+               'codedValues': domain.codedValues, 'range': domain.range, 'hash': domain_hash(domain)}
+
+
+#   Function that yields the flat rows of a record
+def flat_rows(record):
+    if not record['codedValues']:
+        range_min, range_max = record['range'] or [None, None]
+        yield [record['name'], record['domainType'], record['type'], None, None, range_min, range_max, record['hash']]
+        return
+    for code, description in record['codedValues']:
+        yield [record['name'], record['domainType'], record['type'], code, description, None, None, record['hash']]
+
+
+#   Function that writes one JSON record per line
+def write_jsonl(records, export_file):
+    with open(export_file, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, default=str) + '\n')
+
+
+#   Function that writes the flat rows to a CSV file
+def write_csv(records, export_file):
+    with open(export_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(flat_columns)
+        for record in records:
+            writer.writerows(flat_rows(record))
+
+
+#   Function that writes the domains and coded values to two SQLite tables
+#   The domains table holds the hashes so a diff reads the coded values of changed domains only
+def write_sqlite(records, export_file):
+    if os.path.exists(export_file):
+        os.remove(export_file)
+    conn = sqlite3.connect(export_file)
+    conn.execute('CREATE TABLE domains (name TEXT PRIMARY KEY, domainType TEXT, type TEXT, rangeMin TEXT, '
+                 'rangeMax TEXT, hash TEXT)')
+    conn.execute('CREATE TABLE codedValues (name TEXT, code TEXT, description TEXT)')
+    for record in records:
+        range_min, range_max = record['range'] or [None, None]
+        conn.execute('INSERT INTO domains VALUES (?, ?, ?, ?, ?, ?)',
+                     [record['name'], record['domainType'], record['type'], range_min, range_max, record['hash']])
+        conn.executemany('INSERT INTO codedValues VALUES (?, ?, ?)',
+                         [[record['name'], str(code), str(description)]
+                          for code, description in record['codedValues'] or []])
+    conn.execute('CREATE INDEX codedValues_name ON codedValues (name)')
+    conn.commit()
+    conn.close()
+
+
+#   Function that writes the flat rows to a Parquet file with pyarrow
+def write_parquet(records, export_file):
+    import pyarrow
+    import pyarrow.parquet
+    columns = [[] for column in flat_columns]
+    for record in records:
+        for row in flat_rows(record):
+            for values, value in zip(columns, row):
+                values.append(None if value is None else str(value))
+    pyarrow.parquet.write_table(pyarrow.table(dict(zip(flat_columns, columns))), export_file)
+
+
+#   Function that exports the domains in a format and returns the export path
+def export_domains(domains, export_base, export_format):
+    export_file = '{0}.{1}'.format(export_base, export_extensions[export_format])
+    export_writers[export_format](domain_records(domains), export_file)
+    return export_file
+
+
+#   Function that yields the records of a JSONL export
+def read_jsonl(export_file):
+    with open(export_file, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+#   Function that yields the rows of a flat CSV or Parquet export as dicts
+def read_flat_rows(export_file):
+    if export_file.endswith('.parquet'):
+        import pyarrow.parquet
+        for row in pyarrow.parquet.read_table(export_file).to_pylist():
+            yield row
+        return
+    with open(export_file, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            yield dict((k, v if v != '' else None) for k, v in row.items())
+
+
+#   Function that returns {domain name: hash} of an export
+def read_hashes(export_file):
+    if export_file.endswith('.sqlite'):
+        conn = sqlite3.connect(export_file)
+        hashes = dict(conn.execute('SELECT name, hash FROM domains'))
+        conn.close()
+        return hashes
+    if export_file.endswith('.jsonl'):
+        return dict((record['name'], record['hash']) for record in read_jsonl(export_file))
+    return dict((row['name'], row['hash']) for row in read_flat_rows(export_file))
+
+
+#   Function that returns {domain name: [domain type, field type, {code: description}, range]} for some domains
+#   Codes and range values are compared as text since CSV and SQLite exports keep no types
+def read_domain_values(export_file, names):
+    values = {}
+    if export_file.endswith('.sqlite'):
+        conn = sqlite3.connect(export_file)
+        for name in names:
+            row = conn.execute('SELECT domainType, type, rangeMin, rangeMax FROM domains WHERE name = ?',
+                               [name]).fetchone()
+            codes = dict(conn.execute('SELECT code, description FROM codedValues WHERE name = ?', [name]))
+            values[name] = [row[0], row[1], codes, [row[2], row[3]] if row[2] is not None else None]
+        conn.close()
+    elif export_file.endswith('.jsonl'):
+        for record in read_jsonl(export_file):
+            if record['name'] in names:
+                codes = dict((str(code), str(description)) for code, description in record['codedValues'] or [])
+                domain_range = [str(value) for value in record['range']] if record['range'] else None
+                values[record['name']] = [record['domainType'], record['type'], codes, domain_range]
+    else:
+        for row in read_flat_rows(export_file):
+            if row['name'] not in names:
+                continue
+            domain_values = values.setdefault(row['name'], [row['domainType'], row['type'], {}, None])
+            if row['code'] is not None:
+                domain_values[2][str(row['code'])] = str(row['description'])
+            elif row['rangeMin'] is not None:
+                domain_values[3] = [str(row['rangeMin']), str(row['rangeMax'])]
+    return values
+
+
+#   Function that describes how a changed domain differs between two exports
+def domain_changes(old_values, new_values):
+    old_type, old_field_type, old_codes, old_range = old_values
+    new_type, new_field_type, new_codes, new_range = new_values
+    changes = []
+    if [old_type, old_field_type] != [new_type, new_field_type]:
+        changes.append('Type changed from {0} {1} to {2} {3}'.format(old_field_type, old_type, new_field_type,
+                                                                    new_type))
+    for code in new_codes:
+        if code not in old_codes:
+            changes.append('Code {0} added : {1}'.format(code, new_codes[code]))
+        elif old_codes[code] != new_codes[code]:
+            changes.append('Code {0} changed from {1} to {2}'.format(code, old_codes[code], new_codes[code]))
+    for code in old_codes:
+        if code not in new_codes:
+            changes.append('Code {0} removed : {1}'.format(code, old_codes[code]))
+    if old_range != new_range:
+        changes.append('Range changed from {0} to {1}'.format(' - '.join(old_range or ['None']),
+                                                              ' - '.join(new_range or ['None'])))
+    if not changes:
+        changes.append('Coded value order or code types changed')
+    return changes
+
+
+#   Function that diffs two exports, the coded values are read for the domains whose hash changed only
+#   Returns [added names, removed names, {changed name: [change, ...]}]
+def diff_exports(old_file, new_file):
+    old_hashes = read_hashes(old_file)
+    new_hashes = read_hashes(new_file)
+    added = sorted(name for name in new_hashes if name not in old_hashes)
+    removed = sorted(name for name in old_hashes if name not in new_hashes)
+    changed_names = set(name for name in new_hashes if name in old_hashes and new_hashes[name] != old_hashes[name])
+    old_values = read_domain_values(old_file, changed_names)
+    new_values = read_domain_values(new_file, changed_names)
+    changed = dict((name, domain_changes(old_values[name], new_values[name])) for name in sorted(changed_names))
+    return [added, removed, changed]
+
+
+#   Writer of each export format
+export_writers = {'JSONL': write_jsonl, 'CSV': write_csv, 'SQLite': write_sqlite, 'Parquet': write_parquet}
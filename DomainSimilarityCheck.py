@@ -0,0 +1,101 @@
+#   ----------------------------------------------------------------
+#   Name:           DomainSimilarityCheck.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Tool that checks for near duplicate domain
+#                   descriptions and for domains with similar coded
+#                   value sets, as candidates for consolidation
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import datetime
+import os
+from Audit import audit_context, finding_line, option, register_check, report_finding, run_check
+from DomainAnalysis import near_duplicate_descriptions, similar_domains
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that returns the score group of a Jaccard score, groups are 10 percent wide
+def score_group(score):
+    if score == 1:
+        return 'Identical coded values'
+    low = int(score * 10) * 10
+    return 'Jaccard {0}% - {1}%'.format(low, low + 9)
+
+
+#   Function that writes the near duplicate descriptions and similar domains to the report
+def write_similarity(context, near_dict, domain_pairs):
+    report_file = open(os.path.join(context.report_loc,
+                                    '{0}_DomainSimilarity_Check.txt'.format(context.conn_base)), 'w')
+    report_file.write('Near Duplicate Domain Descriptions\n')
+    for k, v in near_dict.items():
+        descriptions = sorted(set(desc for desc, name in v))
+        domain_names = [name for desc, name in v]
+        report_file.write(finding_line(report_finding(
+            context, 'DomainSimilarityCheck', None, None, None, 'NearDuplicateDescription',
+            'Domain descriptions {0} normalize to "{1}" in the following domains {2}'
+            .format(descriptions, k, domain_names))))
+
+    report_file.write('\n\nSimilar Domains\n')
+    group = None
+    for score, first, second in domain_pairs:
+        if score_group(score) != group:
+            group = score_group(score)
+            report_file.write('{0}\n'.format(group))
+        report_file.write(finding_line(report_finding(
+            context, 'DomainSimilarityCheck', None, None, None, 'SimilarDomains',
+            'Domain {0} and domain {1} share {2}% of their coded values'
+            .format(first, second, round(score * 100, 2)), 'Info')))
+
+    report_file.write('\n\nNear Duplicate Description Count: {0}\n'
+                      'Similar Domain Pair Count: {1}'.format(str(len(near_dict)), str(len(domain_pairs))))
+    report_file.close()
+
+
+#   Function that finds and reports near duplicate descriptions and similar domains
+#   The threshold option is the minimum Jaccard score of a similar domain pair, in percent
+def finish_check(state, context, dataset_results):
+    if len(context.catalog.domains) == 0:
+        note('This database has no domains...')
+        return
+    note('----------------------------------------------')
+    note('Identifying Near Duplicate Domain Descriptions')
+    note('----------------------------------------------')
+    near_dict = near_duplicate_descriptions(context.catalog.domains)
+
+    note('---------------------------')
+    note('Identifying Similar Domains')
+    note('---------------------------')
+    domain_pairs = similar_domains(context.catalog.domains, float(option(context, 'threshold', 80)) / 100)
+    write_similarity(context, near_dict, domain_pairs)
+
+
+register_check('DomainSimilarityCheck', None, finish=finish_check)
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    conn_file = arcpy.GetParameterAsText(0)
+    report_loc = arcpy.GetParameterAsText(1)
+    catalog_file = arcpy.GetParameterAsText(2)
+    #   Minimum Jaccard score of a similar domain pair, in percent
+    threshold = arcpy.GetParameterAsText(3)
+
+    start_time = datetime.datetime.today().time()
+    note('DomainSimilarityCheck.py beginning at {0}...'.format(str(start_time)))
+    run_check(audit_context(conn_file, report_loc, catalog_file, {'threshold': threshold}), 'DomainSimilarityCheck')
+    note('All domain similarities have been analyzed. Please see results in the generated txt file.')
+    end_time = datetime.datetime.today().time()
+    note('DomainSimilarityCheck.py completed at {0}...'.format(str(end_time)))
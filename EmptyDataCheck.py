@@ -1,100 +1,122 @@
-#   ----------------------------------------------------------------
-#   Name:           EmptyDataCheckCheck.py
-#   Created by:     Neil Rose
-#   Created on:     5/3/2021
-#   Modified by:
-#   Modified on:
-#   Description:    Tool that checks for empty datasets
-#   ----------------------------------------------------------------
-
-#   import modules
-import arcpy
-import datetime
-import os
-import time
-
-
-#   defined functions
-#   Function for creating output messages
-def note(message):
-    return arcpy.AddMessage(str(message))
-
-
-#   Set environments
-unc_path = "//app-gisdata/gisdata/"
-prj_dir = r'{0}\GIS\SystemsArchitecture\DataAudit2021\DataAuditTools\Dependencies'
-arcpy.env.workspace = prj_dir
-arcpy.env.overwriteOutput = True
-
-#   Set inputs
-conn_file = arcpy.GetParameterAsText(0)
-conn_base = os.path.basename(conn_file)
-report_loc = arcpy.GetParameterAsText(1)
-
-#   Set global lists
-fc_count = 0
-fc_errors = 0
-tbl_count = 0
-tbl_errors = 0
-
-#   Main script
-#   Start timer
-start = time.time()
-start_time = datetime.datetime.today().time()
-note('SpatialReferenceCheck.py beginning at {0}...'.format(str(start_time)))
-#   Begin checking spatial reference systems
-arcpy.env.workspace = conn_file
-
-report_file = open(os.path.join(report_loc, '{0}_EmptyData_Check.txt'.format(conn_base)), 'w')
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} features...'.format(os.path.basename(conn_base)))
-note('-------------------------------------------------------------------')
-for fc in sorted(arcpy.ListFeatureClasses()):
-    fc_count += 1
-    note('Checking the {0} Feature Class...'.format(fc))
-    results = arcpy.GetCount_management(fc)[0]
-    if int(results) < 1:
-        fc_errors += 1
-        report_file.write('fc: {0} - Feature Class: {1} contains no data.\n'.format(conn_base, fc))
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} tables...'.format(conn_base))
-note('-------------------------------------------------------------------')
-for tbl in sorted(arcpy.ListTables()):
-    tbl_count += 1
-    note('Checking the {0} Feature Class...'.format(tbl))
-    results = arcpy.GetCount_management(tbl)[0]
-    if int(results) < 1:
-        tbl_errors += 1
-        report_file.write('tbl: {0} - Table: {1} contains no data.\n'.format(conn_base, tbl))
-
-datasets = sorted(arcpy.ListDatasets())
-for ds in datasets:
-    note('-------------------------------------------------------------------')
-    note('Checking the {0} Feature Dataset...'.format(ds))
-    note('-------------------------------------------------------------------')
-    for fc in sorted(arcpy.ListFeatureClasses(feature_dataset=ds)):
-        fc_count += 1
-        note('Checking the {0} Feature Class...'.format(fc))
-        results = arcpy.GetCount_management(fc)[0]
-        if int(results) < 1:
-            fc_errors += 1
-            report_file.write('fds: {0} - Feature Dataset: {1} - Feature Class: {2} contains no data.\n'.format(conn_base, ds, fc))
-
-report_file.write('\n\nFeature Classes With No Data: {0}\n'
-                  'Feature Class Count: {1}\n'
-                  'Percent Empty Feature Classes: {2}%\n\n'.format(str(fc_errors), str(fc_count), str(round((fc_errors/fc_count)*100, 2))))
-
-report_file.write('Tables With No Data: {0}\n'
-                  'Table Count: {1}\n'
-                  'Percent Empty Tables: {2}%\n\n'.format(str(tbl_errors), str(tbl_count), str(round((tbl_errors/tbl_count)*100, 2))))
-
-report_file.close()
-note('All datasets have been verified. Please see results in the generated txt file.')
-#   End timer
-end = time.time()
-end_time = datetime.datetime.today().time()
-#   Timer math
-note('EmptyDataCheck.py completed at {0}...'.format(str(end_time)))
-note('It took {0} minutes to complete...'.format(str(round(((end - start)/60), 4))))
+#   ----------------------------------------------------------------
+#   Name:           EmptyDataCheckCheck.py
+#   Created by:     Neil Rose
+#   Created on:     5/3/2021
+#   Modified by:    GIS Systems Architecture
+#   Modified on:    10/18/2026
+#   Description:    Tool and audit check that checks for empty
+#                   datasets. Emptiness is answered by reading one
+#                   row, and the row counts and sizes can be reported
+#                   from DBMS statistics or exact counts.
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import datetime
+import os
+from Audit import audit_context, finding_line, option, register_check, report_finding, run_check
+from Catalog import iter_datasets
+from RowCounts import row_counts
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that writes the row count and size of every dataset and the totals
+def write_row_counts(report_file, catalog, counts):
+    total_rows = 0
+    total_size = 0
+    report_file.write('Dataset Row Counts\n')
+    for fds, dataset in iter_datasets(catalog):
+        count = counts[dataset.name]
+        if count.rows is None:
+            rows = 'unknown'
+        elif count.source == 'Statistics':
+            rows = '{0} (estimate)'.format(count.rows)
+        else:
+            rows = str(count.rows)
+        size = 'unknown' if count.sizeBytes is None else '{0} MB'.format(round(count.sizeBytes / 1048576, 2))
+        report_file.write('{0} - Rows: {1} - Size: {2}\n'.format(dataset.name, rows, size))
+        total_rows += count.rows or 0
+        total_size += count.sizeBytes or 0
+    report_file.write('\n\nTotal Rows: {0}\n'
+                      'Total Size: {1} MB'.format(str(total_rows), str(round(total_size / 1048576, 2))))
+
+
+#   Function that reads the row counts of all datasets up front and opens the report
+#   count_mode Probe answers emptiness only, Statistics adds approximate counts and sizes, Exact counts every row
+def start_check(context):
+    count_mode = option(context, 'count_mode', 'Probe')
+    counts = row_counts(context.conn_file, [dataset.name for fds, dataset in iter_datasets(context.catalog)],
+                        count_mode)
+    report_file = open(os.path.join(context.report_loc, '{0}_EmptyData_Check.txt'.format(context.conn_base)), 'w')
+    return {'report_file': report_file, 'count_mode': count_mode, 'counts': counts, 'fc_count': 0, 'fc_errors': 0,
+            'tbl_count': 0, 'tbl_errors': 0}
+
+
+#   Function that checks whether a feature class or table contains data
+def visit_dataset(state, context, fds, dataset):
+    report_file = state['report_file']
+    if dataset.datasetType == 'Table':
+        state['tbl_count'] += 1
+        if not state['counts'][dataset.name].hasRows:
+            state['tbl_errors'] += 1
+            report_file.write(finding_line(report_finding(context, 'EmptyDataCheck', fds, dataset.name, None,
+                                                          'EmptyData', 'contains no data.'), dataset.datasetType))
+        return
+    state['fc_count'] += 1
+    if state['counts'][dataset.name].hasRows:
+        return
+    state['fc_errors'] += 1
+    report_file.write(finding_line(report_finding(context, 'EmptyDataCheck', fds, dataset.name, None, 'EmptyData',
+                                                  'contains no data.'), dataset.datasetType))
+
+
+#   Function that writes the totals, the row counts when they were asked for, and closes the report
+def finish_check(state, context, dataset_results):
+    report_file = state['report_file']
+    fc_errors, fc_count = state['fc_errors'], state['fc_count']
+    tbl_errors, tbl_count = state['tbl_errors'], state['tbl_count']
+    report_file.write('\n\nFeature Classes With No Data: {0}\n'
+                      'Feature Class Count: {1}\n'
+                      'Percent Empty Feature Classes: {2}%\n\n'.format(str(fc_errors), str(fc_count),
+                                                                       str(round((fc_errors/fc_count)*100, 2))))
+
+    report_file.write('Tables With No Data: {0}\n'
+                      'Table Count: {1}\n'
+                      'Percent Empty Tables: {2}%\n\n'.format(str(tbl_errors), str(tbl_count),
+                                                              str(round((tbl_errors/tbl_count)*100, 2))))
+
+    if state['count_mode'] != 'Probe':
+        write_row_counts(report_file, context.catalog, state['counts'])
+
+    report_file.close()
+
+
+register_check('EmptyDataCheck', start_check, visit_dataset, finish=finish_check)
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    unc_path = "//app-gisdata/gisdata/"
+    prj_dir = r'{0}\GIS\SystemsArchitecture\DataAudit2021\DataAuditTools\Dependencies'
+    arcpy.env.workspace = prj_dir
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    conn_file = arcpy.GetParameterAsText(0)
+    report_loc = arcpy.GetParameterAsText(1)
+    catalog_file = arcpy.GetParameterAsText(2)
+    #   Probe answers emptiness only, Statistics adds approximate counts and sizes, Exact counts every row
+    count_mode = arcpy.GetParameterAsText(3) or 'Probe'
+
+    start_time = datetime.datetime.today().time()
+    note('EmptyDataCheck.py beginning at {0}...'.format(str(start_time)))
+    run_check(audit_context(conn_file, report_loc, catalog_file, {'count_mode': count_mode}), 'EmptyDataCheck')
+    note('All datasets have been verified. Please see results in the generated txt file.')
+    end_time = datetime.datetime.today().time()
+    note('EmptyDataCheck.py completed at {0}...'.format(str(end_time)))
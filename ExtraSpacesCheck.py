@@ -1,129 +1,72 @@
-#   ----------------------------------------------------------------
-#   Name:           ExtraSpacesCheck.py
-#   Created by:     Neil Rose
-#   Created on:     6/29/2021
-#   Modified by:
-#   Modified on:
-#   Description:    Tool that checks whether a field has any
-#                   spurious leading, internal, or trailing spaces
-#   ----------------------------------------------------------------
-
-#   import modules
-import arcpy
-import datetime
-import os
-import re
-import time
-
-
-#   defined functions
-#   Function for creating output messages
-def note(message):
-    return arcpy.AddMessage(str(message))
-
-
-#   Set environments
-arcpy.env.overwriteOutput = True
-
-#   Set inputs
-conn_file = arcpy.GetParameterAsText(0)
-conn_base = os.path.basename(conn_file)
-report_loc = arcpy.GetParameterAsText(1)
-
-#   Global variables
-error_count = 0
-
-#   Main script
-#   Start timer
-start = time.time()
-start_time = datetime.datetime.today().time()
-note('ExtraSpacesCheck.py beginning at {0}...'.format(str(start_time)))
-#   Begin checking reserved words
-arcpy.env.workspace = conn_file
-
-report_file = open(os.path.join(report_loc, '{0}_ExtraSpaces_Check.txt'.format(conn_base)), 'w')
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} features...'.format(os.path.basename(conn_base)))
-note('-------------------------------------------------------------------')
-for fc in sorted(arcpy.ListFeatureClasses()):
-    note('Checking the {0} Feature Class.'.format(fc))
-    field_list = arcpy.ListFields(fc)
-    fields = []
-    for field in field_list:
-        fields.append(field.name)
-    with arcpy.da.SearchCursor(fc, fields) as cursor:
-        tfc_oid_list = []
-        for row in cursor:
-            field_len = len(fields)
-            row_counter = 0
-            while row_counter < field_len:
-                if type(row[row_counter]) == str:
-                    if row[row_counter] != re.sub(' +', ' ', row[row_counter]):
-                        tfc_oid_list.append(row[0])
-                        error_count += 1
-                row_counter += 1
-        tfc_oid_errors = set(tfc_oid_list)
-        for oid in tfc_oid_errors:
-            report_file.write('fc - {0} - OID {1} contains extra whitespace\n'.format(fc, oid))
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} tables...'.format(conn_base))
-note('-------------------------------------------------------------------')
-for tbl in sorted(arcpy.ListTables()):
-    note('Checking the {0} Table.'.format(tbl))
-    field_list = arcpy.ListFields(tbl)
-    fields = []
-    for field in field_list:
-        fields.append(field.name)
-    with arcpy.da.SearchCursor(tbl, fields) as cursor:
-        tfc_oid_list = []
-        for row in cursor:
-            field_len = len(fields)
-            row_counter = 0
-            while row_counter < field_len:
-                if type(row[row_counter]) == str:
-                    if row[row_counter] != re.sub(' +', ' ', row[row_counter]):
-                        tfc_oid_list.append(row[0])
-                        error_count += 1
-                row_counter += 1
-        tfc_oid_errors = set(tfc_oid_list)
-        for oid in tfc_oid_errors:
-            report_file.write('tbl - {0} - OID {1} contains extra whitespace\n'.format(tbl, oid))
-
-datasets = sorted(arcpy.ListDatasets())
-for ds in datasets:
-    note('-------------------------------------------------------------------')
-    note('Checking the {0} Feature Dataset...'.format(ds))
-    note('-------------------------------------------------------------------')
-    for fc in sorted(arcpy.ListFeatureClasses(feature_dataset=ds)):
-        note('Checking the {0} Feature Class.'.format(fc))
-        field_list = arcpy.ListFields(fc)
-        fields = []
-        for field in field_list:
-            fields.append(field.name)
-        with arcpy.da.SearchCursor(fc, fields) as cursor:
-            tfc_oid_list = []
-            for row in cursor:
-                field_len = len(fields)
-                row_counter = 0
-                while row_counter < field_len:
-                    if type(row[row_counter]) == str:
-                        if row[row_counter] != re.sub(' +', ' ', row[row_counter]):
-                            tfc_oid_list.append(row[0])
-                            error_count += 1
-                    row_counter += 1
-            tfc_oid_errors = set(tfc_oid_list)
-            for oid in tfc_oid_errors:
-                report_file.write('fc - {0} - OID {1} contains extra whitespace\n'.format(fc, oid))
-
-report_file.write('\n\nExtra Spaces Instances: {0}\n'.format(error_count))
-
-report_file.close()
-note('All attributes have been verified. Please see results in the generated txt file.')
-#   End timer
-end = time.time()
-end_time = datetime.datetime.today().time()
-#   Timer math
-note('ExtraSpacesCheck.py completed at {0}...'.format(str(end_time)))
-note('It took {0} minutes to complete...'.format(str(round(((end - start)/60), 4))))
+#   ----------------------------------------------------------------
+#   Name:           ExtraSpacesCheck.py
+#   Created by:     Neil Rose
+#   Created on:     6/29/2021
+#   Modified by:    GIS Systems Architecture
+#   Modified on:    10/18/2026
+#   Description:    Tool and audit check that checks whether a field
+#                   has any spurious leading, internal, or trailing
+#                   spaces and, when a rule set is given, the other
+#                   text hygiene rules
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import datetime
+import os
+from Audit import audit_context, finding_emitter, option, option_list, register_check, run_check
+from AttributeScan import write_field_summary, write_rule_report
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that returns the row rules of the check, ExtraSpaces when hygiene_rules is not given
+def check_rules(context):
+    return option_list(context, 'hygiene_rules', ['ExtraSpaces'])
+
+
+#   Function that writes the report of each rule and, when a rule set was given, the field summary
+def finish_check(state, context, dataset_results):
+    rules = check_rules(context)
+    for rule in rules:
+        report_file = open(os.path.join(context.report_loc, '{0}_{1}_Check.txt'.format(context.conn_base, rule)), 'w')
+        write_rule_report(report_file, context.catalog, rule, dataset_results, 'ExtraSpacesCheck',
+                          finding_emitter(context))
+        report_file.close()
+    if option(context, 'hygiene_rules') is not None:
+        report_file = open(os.path.join(context.report_loc, '{0}_TextHygiene_Check.txt'.format(context.conn_base)),
+                           'w')
+        write_field_summary(report_file, context.catalog, rules, dataset_results)
+        report_file.close()
+
+
+register_check('ExtraSpacesCheck', None, rules=check_rules, finish=finish_check)
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    conn_file = arcpy.GetParameterAsText(0)
+    report_loc = arcpy.GetParameterAsText(1)
+    catalog_file = arcpy.GetParameterAsText(2)
+    state_file = arcpy.GetParameterAsText(3)
+    workers = arcpy.GetParameterAsText(4)
+    batch_size = arcpy.GetParameterAsText(5)
+    rule_input = arcpy.GetParameterAsText(6)
+    pushdown = arcpy.GetParameterAsText(7)
+
+    start_time = datetime.datetime.today().time()
+    note('ExtraSpacesCheck.py beginning at {0}...'.format(str(start_time)))
+    run_check(audit_context(conn_file, report_loc, catalog_file,
+                            {'hygiene_rules': rule_input, 'state_file': state_file, 'workers': workers,
+                             'batch_size': batch_size, 'pushdown': pushdown}), 'ExtraSpacesCheck')
+    note('All attributes have been verified. Please see results in the generated txt file.')
+    end_time = datetime.datetime.today().time()
+    note('ExtraSpacesCheck.py completed at {0}...'.format(str(end_time)))
@@ -0,0 +1,193 @@
+#   ----------------------------------------------------------------
+#   Name:           Findings.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that streams the findings of the checks as
+#                   typed records. Findings are buffered and handed
+#                   in batches to a background writer thread that
+#                   writes them to a registered sink, JSONL, CSV,
+#                   SQLite or Parquet, gzip compressed on request.
+#                   Parquet needs pyarrow. It does not import arcpy.
+#   ----------------------------------------------------------------
+
+#   import modules
+import csv
+import gzip
+import json
+import os
+import queue
+import sqlite3
+import threading
+from collections import namedtuple
+
+
+#   Global variables
+#   One finding, container is the feature dataset, oidStart and oidEnd the OID run of a row rule finding
+#   Every attribute that does not apply to a finding is None
+Finding = namedtuple('Finding', ['workspace', 'container', 'dataset', 'field', 'oidStart', 'oidEnd', 'check',
+                                 'rule', 'severity', 'message'])
+
+#   Sink registry
+#   open(path, compress) returns the sink handle, write(handle, findings) writes a batch, close(handle) finishes
+FindingsSink = namedtuple('FindingsSink', ['name', 'extension', 'open', 'write', 'close'])
+findings_sinks = {}
+
+#   An open findings stream, buffer collects findings until a batch is handed to the writer thread
+#   errors holds the exception of a writer thread that failed
+FindingsStream = namedtuple('FindingsStream', ['path', 'sink', 'buffer', 'batch_size', 'queue', 'thread',
+                                               'errors'])
+
+
+#   defined functions
+#   Function that registers a findings sink so a stream can write to it
+def register_sink(name, extension, open_sink, write_sink, close_sink):
+    findings_sinks[name] = FindingsSink(name, extension, open_sink, write_sink, close_sink)
+
+
+#   Function that opens a text file, through gzip when compress is True
+def open_text(path, compress, newline=None):
+    if compress:
+        return gzip.open(path, 'wt', encoding='utf-8', newline=newline)
+    return open(path, 'w', encoding='utf-8', newline=newline)
+
+
+#   Function that writes one JSON finding per line
+def write_jsonl(handle, findings):
+    handle.write(''.join(json.dumps(finding._asdict(), default=str) + '\n' for finding in findings))
+
+
+#   Function that opens a CSV findings file and writes the header, the handle is [file, writer]
+def open_csv(path, compress):
+    csv_file = open_text(path, compress, newline='')
+    writer = csv.writer(csv_file)
+    writer.writerow(Finding._fields)
+    return [csv_file, writer]
+
+
+#   Function that writes a batch of findings as CSV rows
+def write_csv(handle, findings):
+    handle[1].writerows(findings)
+
+
+#   Function that opens a SQLite findings database with an empty findings table
+#   SQLite pages are not compressed, compress does not apply
+def open_sqlite(path, compress):
+    if os.path.exists(path):
+        os.remove(path)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute('CREATE TABLE findings ({0})'.format(', '.join('"{0}"'.format(name) for name in Finding._fields)))
+    return conn
+
+
+#   Function that inserts a batch of findings in one transaction
+def write_sqlite(conn, findings):
+    conn.executemany('INSERT INTO findings VALUES ({0})'.format(', '.join('?' * len(Finding._fields))),
+                     [[value if value is None or isinstance(value, (int, float)) else str(value)
+                       for value in finding] for finding in findings])
+    conn.commit()
+
+
+#   Function that indexes the findings by check and dataset and closes the database
+def close_sqlite(conn):
+    conn.execute('CREATE INDEX findings_check ON findings ("check", dataset)')
+    conn.commit()
+    conn.close()
+
+
+#   Function that opens a Parquet findings file with pyarrow, every batch becomes a row group
+def open_parquet(path, compress):
+    import pyarrow
+    import pyarrow.parquet
+    schema = pyarrow.schema([(name, pyarrow.int64() if name in ['oidStart', 'oidEnd'] else pyarrow.string())
+                             for name in Finding._fields])
+    return [pyarrow.parquet.ParquetWriter(path, schema, compression='gzip' if compress else 'snappy'), schema]
+
+
+#   Function that writes a batch of findings as a Parquet row group
+def write_parquet(handle, findings):
+    import pyarrow
+    writer, schema = handle
+    columns = dict((name, [value if value is None or name in ['oidStart', 'oidEnd'] else str(value)
+                           for value in column]) for name, column in zip(Finding._fields, zip(*findings)))
+    writer.write_table(pyarrow.Table.from_pydict(columns, schema=schema))
+
+
+register_sink('JSONL', 'jsonl', open_text, write_jsonl, lambda handle: handle.close())
+register_sink('CSV', 'csv', open_csv, write_csv, lambda handle: handle[0].close())
+register_sink('SQLite', 'sqlite', open_sqlite, write_sqlite, close_sqlite)
+register_sink('Parquet', 'parquet', open_parquet, write_parquet, lambda handle: handle[0].close())
+
+
+#   Function that returns the path of a findings file, gzip compressed text files get a .gz suffix
+def findings_path(findings_base, sink_name, compress=False):
+    path = '{0}.{1}'.format(findings_base, findings_sinks[sink_name].extension)
+    if compress and sink_name in ['JSONL', 'CSV']:
+        path += '.gz'
+    return path
+
+
+#   Function run on the writer thread, it writes the batches of the queue until it receives None
+#   A failed sink keeps draining the queue so the checks never block on a full queue
+def write_batches(sink, handle, batches, errors):
+    while True:
+        findings = batches.get()
+        if findings is None:
+            break
+        if errors:
+            continue
+        try:
+            sink.write(handle, findings)
+        except Exception as e:
+            errors.append(e)
+    try:
+        sink.close(handle)
+    except Exception as e:
+        errors.append(e)
+
+
+#   Function that starts the writer thread of a sink handle and returns the stream
+#   batch_size findings are handed over at a time, at most max_batches batches wait for the writer
+def start_stream(path, sink, handle, batch_size=1000, max_batches=16):
+    batches = queue.Queue(max_batches)
+    errors = []
+    thread = threading.Thread(target=write_batches, args=(sink, handle, batches, errors), daemon=True)
+    thread.start()
+    return FindingsStream(path, sink, [], batch_size, batches, thread, errors)
+
+
+#   Function that opens a findings file of a registered sink and starts its writer thread
+def open_findings(findings_base, sink_name, compress=False, batch_size=1000, max_batches=16):
+    sink = findings_sinks[sink_name]
+    path = findings_path(findings_base, sink_name, compress)
+    return start_stream(path, sink, sink.open(path, compress), batch_size, max_batches)
+
+
+#   Function that adds a finding to a stream, a full buffer is handed to the writer thread
+def emit(stream, finding):
+    stream.buffer.append(finding)
+    if len(stream.buffer) >= stream.batch_size:
+        stream.queue.put(list(stream.buffer))
+        del stream.buffer[:]
+
+
+#   Function that hands the rest of the buffer to the writer, waits for it to finish and returns the path
+#   The error of a failed writer is raised here
+def close_findings(stream):
+    if stream.buffer:
+        stream.queue.put(list(stream.buffer))
+        del stream.buffer[:]
+    stream.queue.put(None)
+    stream.thread.join()
+    if stream.errors:
+        raise stream.errors[0]
+    return stream.path
+
+
+#   Function that yields the findings of a JSONL findings file, gzip compressed or not
+def read_findings(path):
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            yield Finding(**json.loads(line))
@@ -0,0 +1,263 @@
+#   ----------------------------------------------------------------
+#   Name:           FindingsHistory.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that keeps the findings of every run in a
+#                   local SQLite store. Findings are identified by a
+#                   64 bit key of what they are about, so a run is
+#                   compared with the previous run of each check
+#                   through the primary key index. The OID runs of a
+#                   row rule are not part of the key, the findings of
+#                   a field and rule are stored once with the OID
+#                   span of all their runs, so rows that shift do not
+#                   read as new and resolved findings. Their text is
+#                   stored once as labels. The finding counts of each
+#                   run are kept aside so trends never read the
+#                   findings themselves. It does not import arcpy.
+#   ----------------------------------------------------------------
+
+#   import modules
+import datetime
+import hashlib
+import sqlite3
+from Findings import Finding, FindingsSink, start_stream
+from OidRuns import format_run
+
+
+#   Global variables
+#   Findings are clustered by run, check and key so one run and check is a range of the primary key
+#   The text of a finding is stored once in labels and referred to by its id
+history_schema = ['CREATE TABLE IF NOT EXISTS runs (runId INTEGER PRIMARY KEY, workspace TEXT, startedAt TEXT)',
+                  'CREATE INDEX IF NOT EXISTS runs_workspace ON runs (workspace, runId)',
+                  'CREATE TABLE IF NOT EXISTS runChecks (runId INTEGER, "check" TEXT, '
+                  'PRIMARY KEY (runId, "check")) WITHOUT ROWID',
+                  'CREATE TABLE IF NOT EXISTS labels (labelId INTEGER PRIMARY KEY, label TEXT UNIQUE)',
+                  'CREATE TABLE IF NOT EXISTS findings (runId INTEGER, checkId INTEGER, findingKey INTEGER, '
+                  'ruleId INTEGER, severityId INTEGER, containerId INTEGER, datasetId INTEGER, fieldId INTEGER, '
+                  'oidStart INTEGER, oidEnd INTEGER, messageId INTEGER, '
+                  'PRIMARY KEY (runId, checkId, findingKey)) WITHOUT ROWID',
+                  'CREATE TABLE IF NOT EXISTS runCounts (runId INTEGER, "check" TEXT, rule TEXT, severity TEXT, '
+                  'findings INTEGER, PRIMARY KEY (runId, "check", rule, severity)) WITHOUT ROWID']
+
+#   Label columns of a stored finding after the check, in Finding order
+label_columns = ['ruleId', 'severityId', 'containerId', 'datasetId', 'fieldId', 'messageId']
+
+
+#   defined functions
+#   Function that opens the store and creates its tables when they do not exist
+#   The store can be shared by the processes of a batch, a writer waits up to timeout seconds for another
+def open_store(store_file, timeout=60):
+    conn = sqlite3.connect(store_file, timeout=timeout, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    for statement in history_schema:
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+
+#   Function that returns the key of a finding, a signed 64 bit integer that is the same in every run
+#   The workspace, check, severity and OID run are not part of the key, the message is
+def finding_key(finding):
+    identity = repr((finding.container, finding.dataset, finding.field, finding.rule, finding.message))
+    return int.from_bytes(hashlib.blake2b(identity.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+
+
+#   Function that returns the id of a label, adding it to the store and the cache when it is new
+#   None has no id
+def label_id(conn, labels, label):
+    if label is None:
+        return None
+    label = str(label)
+    if label not in labels:
+        conn.execute('INSERT OR IGNORE INTO labels (label) VALUES (?)', [label])
+        labels[label] = conn.execute('SELECT labelId FROM labels WHERE label = ?', [label]).fetchone()[0]
+    return labels[label]
+
+
+#   Function that returns {label id: label} of every label in the store
+def read_labels(conn):
+    return dict(conn.execute('SELECT labelId, label FROM labels'))
+
+
+#   Function that records the start of a run of the checks over a workspace and returns its id
+def start_run(conn, workspace, checks, started_at=None):
+    started_at = started_at or datetime.datetime.today().isoformat(timespec='seconds')
+    run_id = conn.execute('INSERT INTO runs (workspace, startedAt) VALUES (?, ?)', [workspace, started_at]).lastrowid
+    conn.executemany('INSERT OR IGNORE INTO runChecks VALUES (?, ?)', [[run_id, check] for check in checks])
+    conn.commit()
+    return run_id
+
+
+#   Function that inserts a batch of findings of a run in one transaction
+#   labels caches the label ids and the batch is inserted in key order. A finding reported twice is stored once,
+#   the OID runs of a field and rule widen its OID span.
+def insert_findings(conn, labels, run_id, findings):
+    rows = sorted([run_id, label_id(conn, labels, finding.check), finding_key(finding),
+                   label_id(conn, labels, finding.rule), label_id(conn, labels, finding.severity),
+                   label_id(conn, labels, finding.container), label_id(conn, labels, finding.dataset),
+                   label_id(conn, labels, finding.field), finding.oidStart, finding.oidEnd,
+                   label_id(conn, labels, finding.message)] for finding in findings)
+    conn.executemany('INSERT INTO findings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) '
+                     'ON CONFLICT (runId, checkId, findingKey) DO UPDATE SET '
+                     'oidStart = MIN(oidStart, excluded.oidStart), oidEnd = MAX(oidEnd, excluded.oidEnd)', rows)
+    conn.commit()
+
+
+#   Function that counts the findings of a run by check, rule and severity once all of them are stored
+def finish_run(conn, run_id):
+    conn.execute('INSERT OR REPLACE INTO runCounts SELECT f.runId, c.label, r.label, s.label, COUNT(*) '
+                 'FROM findings f JOIN labels c ON c.labelId = f.checkId JOIN labels r ON r.labelId = f.ruleId '
+                 'JOIN labels s ON s.labelId = f.severityId WHERE f.runId = ? '
+                 'GROUP BY f.runId, f.checkId, f.ruleId, f.severityId', [run_id])
+    conn.commit()
+
+
+#   Function that drops checks from a run, a check that failed is not compared with the next run
+def drop_run_checks(conn, run_id, checks):
+    conn.executemany('DELETE FROM runChecks WHERE runId = ? AND "check" = ?', [[run_id, check] for check in checks])
+    conn.commit()
+
+
+#   Function that finishes a run and closes the store, the close of a history stream
+def close_run(conn, run_id):
+    finish_run(conn, run_id)
+    conn.close()
+
+
+#   Function that opens a findings stream into the store for a new run and returns [run id, stream]
+#   The run is finished and the store closed when the stream is closed
+def open_history(store_file, workspace, checks, batch_size=10000):
+    conn = open_store(store_file)
+    run_id = start_run(conn, workspace, checks)
+    labels = dict((label, labelId) for labelId, label in read_labels(conn).items())
+    sink = FindingsSink('History', 'sqlite', None,
+                        lambda handle, findings: insert_findings(handle, labels, run_id, findings),
+                        lambda handle: close_run(handle, run_id))
+    return [run_id, start_stream(store_file, sink, conn, batch_size)]
+
+
+#   Function that returns the workspace of a run
+def run_workspace(conn, run_id):
+    return conn.execute('SELECT workspace FROM runs WHERE runId = ?', [run_id]).fetchone()[0]
+
+
+#   Function that returns the previous run of a check over the same workspace, or None for its first run
+def previous_run(conn, run_id, check):
+    row = conn.execute('SELECT MAX(c.runId) FROM runChecks c JOIN runs r ON r.runId = c.runId '
+                       'WHERE c."check" = ? AND c.runId < ? AND r.workspace = '
+                       '(SELECT workspace FROM runs WHERE runId = ?)', [check, run_id, run_id]).fetchone()
+    return row[0]
+
+
+#   Function that returns the checks a run completed
+def completed_checks(conn, run_id):
+    return [row[0] for row in conn.execute('SELECT "check" FROM runChecks WHERE runId = ? ORDER BY "check"',
+                                           [run_id])]
+
+
+#   Function that returns the label id of a check, None when no finding of the check was ever stored
+def check_id(conn, check):
+    row = conn.execute('SELECT labelId FROM labels WHERE label = ?', [check]).fetchone()
+    return None if row is None else row[0]
+
+
+#   Function that yields the findings of a check in a run, as Findings, that are not in another run
+def findings_not_in(conn, workspace, run_id, other_run_id, check):
+    labels = read_labels(conn)
+    rows = conn.execute('SELECT {0} FROM findings f WHERE f.runId = ? AND f.checkId = ? AND NOT EXISTS '
+                        '(SELECT 1 FROM findings p WHERE p.runId = ? AND p.checkId = f.checkId '
+                        'AND p.findingKey = f.findingKey)'
+                        .format(', '.join('f.' + column for column in label_columns + ['oidStart', 'oidEnd'])),
+                        [run_id, check_id(conn, check), other_run_id])
+    findings = []
+    for rule, severity, container, dataset, field, message, oid_start, oid_end in rows:
+        findings.append(Finding(workspace, labels.get(container), labels.get(dataset), labels.get(field), oid_start,
+                                oid_end, check, labels.get(rule), labels.get(severity), labels.get(message)))
+    findings.sort(key=lambda finding: (finding.container or '', finding.dataset or '', finding.field or '',
+                                       finding.oidStart or 0, finding.message or ''))
+    return findings
+
+
+#   Function that returns the findings of a check that are new since its previous run
+#   Every finding of the first run of a check is new
+def new_findings(conn, run_id, check):
+    workspace = run_workspace(conn, run_id)
+    return findings_not_in(conn, workspace, run_id, previous_run(conn, run_id, check), check)
+
+
+#   Function that returns the findings of the previous run of a check that this run no longer reports
+def resolved_findings(conn, run_id, check):
+    previous = previous_run(conn, run_id, check)
+    if previous is None:
+        return []
+    workspace = run_workspace(conn, run_id)
+    return findings_not_in(conn, workspace, previous, run_id, check)
+
+
+#   Function that counts the findings of a check reported by both this run and its previous run
+def persisting_count(conn, run_id, check):
+    previous = previous_run(conn, run_id, check)
+    if previous is None:
+        return 0
+    return conn.execute('SELECT COUNT(*) FROM findings f JOIN findings p ON p.runId = ? AND p.checkId = f.checkId '
+                        'AND p.findingKey = f.findingKey WHERE f.runId = ? AND f.checkId = ?',
+                        [previous, run_id, check_id(conn, check)]).fetchone()[0]
+
+
+#   Function that returns the finding count of each check in the last runs of a workspace, oldest run first
+#   Returns [(run id, started at, check, findings), ...] from the run counts only
+def trend_counts(conn, workspace, check=None, runs=30):
+    sql = ('SELECT r.runId, r.startedAt, c."check", COALESCE(SUM(n.findings), 0) FROM '
+           '(SELECT runId, startedAt FROM runs WHERE workspace = ? ORDER BY runId DESC LIMIT ?) r '
+           'JOIN runChecks c ON c.runId = r.runId '
+           'LEFT JOIN runCounts n ON n.runId = c.runId AND n."check" = c."check" ')
+    parameters = [workspace, runs]
+    if check is not None:
+        sql += 'WHERE c."check" = ? '
+        parameters.append(check)
+    sql += 'GROUP BY r.runId, r.startedAt, c."check" ORDER BY r.runId, c."check"'
+    return conn.execute(sql, parameters).fetchall()
+
+
+#   Function that returns where a finding is, as the report lines of the delta show it
+def finding_location(finding):
+    location = finding.dataset or finding.workspace
+    if finding.container is not None:
+        location = '{0}/{1}'.format(finding.container, location)
+    if finding.field is not None:
+        location = '{0}.{1}'.format(location, finding.field)
+    if finding.oidStart is not None:
+        location = '{0} - OID span {1}'.format(location, format_run((finding.oidStart, finding.oidEnd)))
+    return location
+
+
+#   Function that writes the findings of a run that are new or resolved since the previous run of each check
+def write_delta(report_file, conn, run_id):
+    totals = [0, 0, 0]
+    for check in completed_checks(conn, run_id):
+        previous = previous_run(conn, run_id, check)
+        report_file.write('________________________________________\n')
+        report_file.write('{0} - {1}\n'.format(check, 'First run' if previous is None
+                                               else 'Compared with run {0}'.format(previous)))
+        counts = [0, 0, persisting_count(conn, run_id, check)]
+        for finding in new_findings(conn, run_id, check):
+            counts[0] += 1
+            report_file.write('New: {0} - {1}\n'.format(finding_location(finding), finding.message))
+        for finding in resolved_findings(conn, run_id, check):
+            counts[1] += 1
+            report_file.write('Resolved: {0} - {1}\n'.format(finding_location(finding), finding.message))
+        report_file.write('New: {0} - Resolved: {1} - Persisting: {2}\n'.format(*counts))
+        totals = [total + count for total, count in zip(totals, counts)]
+    report_file.write('\n\nNew Findings: {0}\n'
+                      'Resolved Findings: {1}\n'
+                      'Persisting Findings: {2}'.format(*[str(total) for total in totals]))
+
+
+#   Function that writes the finding count of each check over the last runs of a workspace
+def write_trend(report_file, conn, workspace, runs=10):
+    report_file.write('Finding Trend\n')
+    for run_id, started_at, check, findings in trend_counts(conn, workspace, runs=runs):
+        report_file.write('Run {0} - {1} - {2}: {3}\n'.format(run_id, started_at, check, findings))
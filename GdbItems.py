@@ -0,0 +1,255 @@
+#   ----------------------------------------------------------------
+#   Name:           GdbItems.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that reads the catalog of an enterprise
+#                   geodatabase from the sde.GDB_Items tables in a
+#                   few bulk queries instead of one Describe per
+#                   dataset. Queries go through an execute function
+#                   so the module can run against ArcSDESQLExecute
+#                   or a local SQLite stand-in. The item metadata is
+#                   read from the Documentation XML in one query.
+#   ----------------------------------------------------------------
+
+#   import modules
+import datetime
+import hashlib
+import io
+import re
+import sqlite3
+import xml.etree.ElementTree as ET
+from CatalogModel import Catalog, Dataset, Domain, FeatureDataset, Field, ItemMetadata, SpatialRef, Subtype, \
+    definition_hash
+
+
+#   Global variables
+#   Expression that returns the Definition XML as text for each DBMS
+definition_sql = {'SQL Server': 'CAST(i.Definition AS NVARCHAR(MAX))',
+                  'Oracle': 'i.Definition.getClobVal()',
+                  'PostgreSQL': 'i.Definition::text',
+                  'SQLite': 'i.Definition'}
+
+#   Character column lengths, the GDB_Items field definitions do not carry them
+columns_sql = {'SQL Server': 'SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, CHARACTER_MAXIMUM_LENGTH '
+                             'FROM INFORMATION_SCHEMA.COLUMNS WHERE CHARACTER_MAXIMUM_LENGTH IS NOT NULL',
+               'Oracle': 'SELECT OWNER, TABLE_NAME, COLUMN_NAME, CHAR_LENGTH '
+                         'FROM ALL_TAB_COLUMNS WHERE CHAR_LENGTH > 0',
+               'PostgreSQL': 'SELECT table_schema, table_name, column_name, character_maximum_length '
+                             'FROM information_schema.columns WHERE character_maximum_length IS NOT NULL',
+               'SQLite': 'SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, CHARACTER_MAXIMUM_LENGTH '
+                         'FROM INFORMATION_SCHEMA.COLUMNS WHERE CHARACTER_MAXIMUM_LENGTH IS NOT NULL'}
+
+items_sql = ("SELECT i.UUID, t.Name, i.Name, i.PhysicalName, {0} "
+             "FROM sde.GDB_ITEMS i JOIN sde.GDB_ITEMTYPES t ON i.Type = t.UUID "
+             "WHERE t.Name IN ('Feature Dataset', 'Feature Class', 'Table', 'Coded Value Domain', 'Range Domain')")
+
+#   ObjectID and Definition XML of every item, hashed into the schema stamp
+stamp_sql = 'SELECT i.ObjectID, {0} FROM sde.GDB_ITEMS i ORDER BY i.ObjectID'
+
+#   Expression that returns the Documentation XML as text for each DBMS
+documentation_sql = {'SQL Server': 'CAST(i.Documentation AS NVARCHAR(MAX))',
+                     'Oracle': 'i.Documentation.getClobVal()',
+                     'PostgreSQL': 'i.Documentation::text',
+                     'SQLite': 'i.Documentation'}
+
+documentation_items_sql = ("SELECT i.Name, {0} "
+                           "FROM sde.GDB_ITEMS i JOIN sde.GDB_ITEMTYPES t ON i.Type = t.UUID "
+                           "WHERE t.Name IN ('Feature Class', 'Table')")
+
+#   Documentation elements below the metadata root to the ItemMetadata attribute they fill
+metadata_paths = {('dataIdInfo', 'idCitation', 'resTitle'): 'title',
+                  ('dataIdInfo', 'searchKeys', 'keyword'): 'tags',
+                  ('dataIdInfo', 'idPurp'): 'summary',
+                  ('dataIdInfo', 'idCredit'): 'credits'}
+
+members_sql = ("SELECT r.OriginID, r.DestID "
+               "FROM sde.GDB_ITEMRELATIONSHIPS r JOIN sde.GDB_ITEMRELATIONSHIPTYPES rt ON r.Type = rt.UUID "
+               "WHERE rt.Name = 'DatasetInFeatureDataset'")
+
+#   esri field types to the names arcpy.ListFields reports
+field_types = {'esriFieldTypeSmallInteger': 'SmallInteger', 'esriFieldTypeInteger': 'Integer',
+               'esriFieldTypeBigInteger': 'BigInteger', 'esriFieldTypeSingle': 'Single',
+               'esriFieldTypeDouble': 'Double', 'esriFieldTypeString': 'String', 'esriFieldTypeDate': 'Date',
+               'esriFieldTypeOID': 'OID', 'esriFieldTypeGeometry': 'Geometry', 'esriFieldTypeBlob': 'Blob',
+               'esriFieldTypeRaster': 'Raster', 'esriFieldTypeGUID': 'Guid', 'esriFieldTypeGlobalID': 'GlobalID',
+               'esriFieldTypeXML': 'XML'}
+field_lengths = {'SmallInteger': 2, 'Integer': 4, 'BigInteger': 8, 'Single': 4, 'Double': 8, 'Date': 8, 'OID': 4,
+                 'Guid': 38, 'GlobalID': 38}
+
+#   esri field types to the names arcpy.da.ListDomains reports
+domain_types = {'esriFieldTypeSmallInteger': 'Short', 'esriFieldTypeInteger': 'Long',
+                'esriFieldTypeBigInteger': 'BigInteger', 'esriFieldTypeSingle': 'Float',
+                'esriFieldTypeDouble': 'Double', 'esriFieldTypeString': 'Text', 'esriFieldTypeDate': 'Date'}
+
+xsi_type = '{http://www.w3.org/2001/XMLSchema-instance}type'
+
+
+#   defined functions
+#   Function that returns an execute function over a SQLite stand-in of the GDB_Items tables
+#   The stand-in is attached as sde and INFORMATION_SCHEMA so the enterprise queries run unchanged
+def sqlite_executor(db_path):
+    conn = sqlite3.connect(':memory:')
+    conn.execute('ATTACH DATABASE ? AS sde', (db_path,))
+    conn.execute('ATTACH DATABASE ? AS INFORMATION_SCHEMA', (db_path,))
+
+    def execute(sql):
+        return conn.execute(sql).fetchall()
+    return execute
+
+
+#   Function that converts a coded value or range value to the python type its xsi:type names
+def _typed_value(element):
+    value_type = element.get(xsi_type, '')
+    if value_type in ['xs:short', 'xs:int', 'xs:long']:
+        return int(element.text)
+    if value_type in ['xs:double', 'xs:float']:
+        return float(element.text)
+    return element.text or ''
+
+
+#   Function that reads a SpatialReference element
+def read_spatial_ref(element):
+    if element is None or element.findtext('WKT') in [None, '']:
+        return SpatialRef('Unknown', 0, '', None, None, None)
+    wkt = element.findtext('WKT')
+    name = re.search(r'"([^"]*)"', wkt).group(1)
+    factory_code = int(element.findtext('LatestWKID') or element.findtext('WKID') or 0)
+    tolerance = float(element.findtext('XYTolerance') or 0)
+    scale = float(element.findtext('XYScale') or 0)
+    resolution = 1 / scale if scale else None
+    domain = None
+    if scale:
+        x_origin = float(element.findtext('XOrigin'))
+        y_origin = float(element.findtext('YOrigin'))
+        extent = 9007199254740990 / scale
+        domain = '{0} {1} {2} {3}'.format(x_origin, y_origin, x_origin + extent, y_origin + extent)
+    return SpatialRef(name, factory_code, wkt, tolerance, resolution, domain)
+
+
+#   Function that reads the field list of a feature class or table definition
+def read_fields(definition, physical_name, column_lengths):
+    fields = []
+    owner_table = '.'.join(physical_name.upper().split('.')[-2:])
+    for field_info in definition.iter('GPFieldInfoEx'):
+        name = field_info.findtext('Name')
+        field_type = field_types.get(field_info.findtext('FieldType'), field_info.findtext('FieldType'))
+        if field_type == 'String':
+            length = column_lengths.get((owner_table, name.upper()), int(field_info.findtext('Length') or 0))
+        else:
+            length = field_lengths.get(field_type, 0)
+        fields.append(Field(name, field_info.findtext('AliasName') or name, field_type, length,
+                            field_info.findtext('DomainName') or '',
+                            field_info.findtext('IsNullable') == 'true'))
+    return fields
+
+
+#   Function that reads the subtypes of a feature class or table definition and the domains they assign
+def read_subtypes(definition):
+    subtypes = []
+    for subtype in definition.iter('Subtype'):
+        field_domains = [[field_info.findtext('FieldName'), field_info.findtext('DomainName')]
+                         for field_info in subtype.iter('SubtypeFieldInfo') if field_info.findtext('DomainName')]
+        subtypes.append(Subtype(int(subtype.findtext('SubtypeCode')), subtype.findtext('SubtypeName'), field_domains))
+    return sorted(subtypes)
+
+
+#   Function that reads a coded value or range domain definition
+def read_domain(definition, item_type):
+    field_type = domain_types.get(definition.findtext('FieldType'), definition.findtext('FieldType'))
+    if item_type == 'Coded Value Domain':
+        coded_values = [[_typed_value(cv.find('Code')), cv.findtext('Name')]
+                        for cv in definition.iter('CodedValue')]
+        return Domain(definition.findtext('DomainName'), 'CodedValue', field_type, coded_values, None)
+    domain_range = [_typed_value(definition.find('MinValue')), _typed_value(definition.find('MaxValue'))]
+    return Domain(definition.findtext('DomainName'), 'Range', field_type, None, domain_range)
+
+
+#   Function that reads the title, tags, summary and credits of a Documentation XML with a streaming parser
+#   Elements are cleared once read, tags are joined with commas like arcpy.metadata reports them
+def read_documentation(documentation_xml):
+    if not documentation_xml:
+        return ItemMetadata(None, None, None, None)
+    values = {'title': None, 'tags': [], 'summary': None, 'credits': None}
+    path = []
+    for event, element in ET.iterparse(io.BytesIO(documentation_xml.encode('utf-8')), events=('start', 'end')):
+        if event == 'start':
+            path.append(element.tag)
+            continue
+        attribute = metadata_paths.get(tuple(path[1:]))
+        text = (element.text or '').strip()
+        if attribute == 'tags':
+            if text:
+                values['tags'].append(text)
+        elif attribute is not None:
+            values[attribute] = text or None
+        path.pop()
+        element.clear()
+    return ItemMetadata(values['title'], ', '.join(values['tags']) or None, values['summary'], values['credits'])
+
+
+#   Function that reads the metadata of every feature class and table in one query
+#   Returns {upper case item name: ItemMetadata}
+def read_metadata(execute, dialect):
+    return dict((name.upper(), read_documentation(documentation_xml))
+                for name, documentation_xml in execute(documentation_items_sql.format(documentation_sql[dialect])))
+
+
+#   Function that returns the schema stamp of GDB_Items, its item count and a hash of every ObjectID and definition
+#   Adding, deleting or redefining an item changes the hash, even when the new definition has the same length
+def read_schema_stamp(execute, dialect):
+    items = execute(stamp_sql.format(definition_sql[dialect]))
+    items_hash = hashlib.sha1()
+    for oid, definition_xml in items:
+        items_hash.update('{0}\t{1}\n'.format(oid, definition_xml or '').encode('utf-8'))
+    return '{0}/{1}'.format(len(items), items_hash.hexdigest())
+
+
+#   Function that reads the whole catalog in three queries
+#   Datasets that are not registered with the geodatabase have no GDB_Items row and are not returned
+def read_catalog(execute, dialect, workspace):
+    column_lengths = {}
+    for owner, table, column, length in execute(columns_sql[dialect]):
+        column_lengths[('{0}.{1}'.format(owner, table).upper(), column.upper())] = int(length)
+
+    feature_dataset_of = {}
+    for origin_id, dest_id in execute(members_sql):
+        feature_dataset_of[dest_id] = origin_id
+
+    domains = []
+    datasets = []
+    feature_datasets = {}
+    for uuid, item_type, name, physical_name, definition_xml in execute(items_sql.format(definition_sql[dialect])):
+        definition = ET.fromstring(definition_xml)
+        if item_type in ['Coded Value Domain', 'Range Domain']:
+            domains.append(read_domain(definition, item_type))
+        elif item_type == 'Feature Dataset':
+            feature_datasets[uuid] = FeatureDataset(name, read_spatial_ref(definition.find('SpatialReference')), [])
+        else:
+            datasets.append((uuid, item_type, name, physical_name, definition, definition_hash(definition_xml)))
+
+    feature_classes = []
+    tables = []
+    for uuid, item_type, name, physical_name, definition, def_hash in datasets:
+        fields = read_fields(definition, physical_name or name, column_lengths)
+        alias = definition.findtext('AliasName') or name
+        fds = feature_datasets.get(feature_dataset_of.get(uuid))
+        if item_type == 'Table':
+            tables.append(Dataset(name, alias, 'Table', None, None, fields, def_hash, read_subtypes(definition)))
+            continue
+        dataset = Dataset(name, alias, 'FeatureClass', fds.name if fds else None,
+                          read_spatial_ref(definition.find('SpatialReference')), fields, def_hash,
+                          read_subtypes(definition))
+        if fds:
+            fds.featureClasses.append(dataset)
+        else:
+            feature_classes.append(dataset)
+
+    for fds in feature_datasets.values():
+        fds.featureClasses.sort(key=lambda dataset: dataset.name)
+    return Catalog(workspace, datetime.datetime.today().isoformat(timespec='seconds'),
+                   domains,
+                   sorted(feature_classes, key=lambda dataset: dataset.name),
+                   sorted(tables, key=lambda dataset: dataset.name),
+                   sorted(feature_datasets.values(), key=lambda fds: fds.name), None)
@@ -0,0 +1,118 @@
+#   ----------------------------------------------------------------
+#   Name:           Incremental.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that fingerprints datasets and keeps the
+#                   per-dataset results of a check between runs so
+#                   that only new or changed datasets are scanned
+#                   again. A fingerprint is the definition hash, the
+#                   field list hash, the row count of the count
+#                   provider, the max OID and the latest edit date.
+#                   Edits are seen through editor tracking or the
+#                   GDB_FROM_DATE of branch versioned and archived
+#                   data, a dataset with neither is scanned every run.
+#                   Only the row scans are incremental, the catalog
+#                   is read in full every run and the schema checks
+#                   audit all of it.
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import json
+import os
+from CatalogModel import definition_hash
+from RowCounts import row_counts
+
+
+#   defined functions
+#   Function that reads the highest OID of a feature class or table, None without rows or an OID field
+def read_max_oid(dataset):
+    oid_fields = [fn.name for fn in dataset.fields if fn.type == 'OID']
+    if not oid_fields:
+        return None
+    sql_clause = (None, 'ORDER BY {0} DESC'.format(oid_fields[0]))
+    with arcpy.da.SearchCursor(dataset.name, ['OID@'], sql_clause=sql_clause) as cursor:
+        for row in cursor:
+            return row[0]
+    return None
+
+
+#   Function that returns the field holding the edit dates of a dataset, the last edited field of editor
+#   tracking or the GDB_FROM_DATE of branch versioned and archived data, None when it has neither
+def edit_date_field(dataset):
+    desc = arcpy.Describe(dataset.name)
+    if getattr(desc, 'editorTrackingEnabled', False) and getattr(desc, 'lastEditedAtFieldName', ''):
+        return desc.lastEditedAtFieldName
+    from_dates = [fn.name for fn in dataset.fields if fn.name.upper() == 'GDB_FROM_DATE']
+    return from_dates[0] if from_dates else None
+
+
+#   Function that reads the latest edit date of a dataset as text, an empty string when no row has one
+def read_last_edit(dataset, edit_field):
+    sql_clause = (None, 'ORDER BY {0} DESC'.format(edit_field))
+    with arcpy.da.SearchCursor(dataset.name, [edit_field], '{0} IS NOT NULL'.format(edit_field),
+                               sql_clause=sql_clause) as cursor:
+        for row in cursor:
+            return str(row[0])
+    return ''
+
+
+#   Function that returns the fingerprint of every dataset, in dataset order
+#   A dataset without edit dates gets None, an in place edit would not change its fingerprint so it is dirty
+def dataset_fingerprints(datasets, conn_file):
+    counts = row_counts(conn_file, [dataset.name for dataset in datasets], 'Statistics')
+    fingerprints = []
+    for dataset in datasets:
+        edit_field = edit_date_field(dataset)
+        if edit_field is None:
+            fingerprints.append(None)
+            continue
+        count = counts[dataset.name]
+        fingerprints.append([dataset.definitionHash, definition_hash(json.dumps(dataset.fields)), count.hasRows,
+                             count.rows, read_max_oid(dataset) if count.hasRows else None,
+                             read_last_edit(dataset, edit_field)])
+    return fingerprints
+
+
+#   Function that opens the incremental state file, a missing file starts an empty state
+def open_state(state_file):
+    previous = {}
+    if os.path.exists(state_file):
+        with open(state_file, 'r') as state_in:
+            previous = json.load(state_in)
+    return {'path': state_file, 'previous': previous, 'current': {}}
+
+
+#   Function that writes the state back, results of checks that did not run are kept as they were
+#   Datasets a check did not see this run are dropped from that check
+def save_state(state):
+    checks = dict(state['previous'])
+    checks.update(state['current'])
+    with open(state['path'], 'w') as state_out:
+        json.dump(checks, state_out, separators=(',', ':'))
+
+
+#   Function that returns the results of a check for every dataset, in dataset order
+#   Results of datasets whose fingerprint did not change come from the state, the rest are passed to
+#   scan_many(datasets) which returns their results in order. Results must be JSON serializable
+def cached_scans(state, check, datasets, scan_many, conn_file):
+    if state is None:
+        return scan_many(datasets)
+    fingerprints = dataset_fingerprints(datasets, conn_file)
+    previous = state['previous'].get(check, {})
+    results = [None] * len(datasets)
+    stale = []
+    for i, dataset in enumerate(datasets):
+        cached = previous.get(dataset.name)
+        if fingerprints[i] is not None and cached is not None and cached[0] == fingerprints[i]:
+            results[i] = cached[1]
+        else:
+            stale.append(i)
+    for i, result in zip(stale, scan_many([datasets[i] for i in stale])):
+        results[i] = result
+    current = state['current'].setdefault(check, {})
+    for dataset, fingerprint, result in zip(datasets, fingerprints, results):
+        current[dataset.name] = [fingerprint, result]
+    return results
@@ -0,0 +1,126 @@
+#   ----------------------------------------------------------------
+#   Name:           Instrument.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that records timing spans and counters
+#                   around the catalog calls, cursors, row batches,
+#                   checks and report writes, with the peak memory
+#                   from tracemalloc on request. The records export
+#                   to Chrome trace JSON and OpenMetrics text. While
+#                   it is off a span is a shared empty context and a
+#                   counter a single check. It does not import arcpy.
+#   ----------------------------------------------------------------
+
+#   import modules
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+
+#   Global variables
+#   enabled is read by every span and counter, the other entries only matter while it is True
+instrumentation = {'enabled': False, 'memory': False, 'origin': 0.0}
+#   Recorded spans, [name, category, start seconds, duration seconds, process id, thread id, args]
+spans = []
+counters = Counter()
+#   The span returned while instrumentation is off
+null_span = contextlib.nullcontext()
+
+
+#   defined functions
+#   Function that clears the records and turns instrumentation on, memory also traces the peak memory
+def start_instrumentation(memory=False):
+    del spans[:]
+    counters.clear()
+    instrumentation.update(enabled=True, memory=memory, origin=time.perf_counter())
+    if memory:
+        tracemalloc.start()
+
+
+#   Function that turns instrumentation off and returns the peak traced memory in bytes, None without memory
+def stop_instrumentation():
+    instrumentation['enabled'] = False
+    if not instrumentation['memory']:
+        return None
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+#   Function that records a span around the body of a with statement
+@contextlib.contextmanager
+def timed_span(name, category, args):
+    begin = time.perf_counter()
+    try:
+        yield
+    finally:
+        spans.append([name, category, begin - instrumentation['origin'], time.perf_counter() - begin, os.getpid(),
+                      threading.get_ident(), args])
+
+
+#   Function that returns a span to time a with statement body, args are kept with the span in the trace
+def span(name, category='audit', **args):
+    if not instrumentation['enabled']:
+        return null_span
+    return timed_span(name, category, args)
+
+
+#   Function that adds to a counter, rows read for instance
+def count(name, amount=1):
+    if instrumentation['enabled']:
+        counters[name] += amount
+
+
+#   Function that returns {(category, name): [span count, total seconds]} of the recorded spans
+def span_totals():
+    totals = {}
+    for name, category, start, duration, pid, tid, args in spans:
+        total = totals.setdefault((category, name), [0, 0.0])
+        total[0] += 1
+        total[1] += duration
+    return totals
+
+
+#   Function that writes the spans as Chrome trace events, they open in chrome://tracing and Perfetto
+def write_chrome_trace(trace_file):
+    events = [{'name': name, 'cat': category, 'ph': 'X', 'ts': round(start * 1000000, 3),
+               'dur': round(duration * 1000000, 3), 'pid': pid, 'tid': tid, 'args': args}
+              for name, category, start, duration, pid, tid, args in spans]
+    with open(trace_file, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, default=str)
+
+
+#   Function that returns a label value escaped for OpenMetrics
+def metric_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+#   Function that writes the span totals, counters, rows per second and peak memory as OpenMetrics text
+#   Rows per second is the Rows read counter over the time spent scanning datasets, rows read by worker
+#   processes are counted in their own process so it is only written for scans in this process
+def write_openmetrics(metrics_file, peak_memory=None):
+    totals = span_totals()
+    with open(metrics_file, 'w', encoding='utf-8') as f:
+        f.write('# TYPE audit_span_seconds summary\n')
+        f.write('# HELP audit_span_seconds Time spent in each instrumented call.\n')
+        for (category, name), (calls, seconds) in sorted(totals.items()):
+            labels = 'category="{0}",name="{1}"'.format(metric_label(category), metric_label(name))
+            f.write('audit_span_seconds_count{{{0}}} {1}\n'.format(labels, calls))
+            f.write('audit_span_seconds_sum{{{0}}} {1}\n'.format(labels, round(seconds, 6)))
+        f.write('# TYPE audit_events counter\n')
+        for name, value in sorted(counters.items()):
+            f.write('audit_events_total{{name="{0}"}} {1}\n'.format(metric_label(name), value))
+        scan_seconds = sum(seconds for (category, name), (calls, seconds) in totals.items() if category == 'scan')
+        if scan_seconds and counters['Rows read']:
+            f.write('# TYPE audit_rows_per_second gauge\n')
+            f.write('audit_rows_per_second {0}\n'.format(round(counters['Rows read'] / scan_seconds, 2)))
+        if peak_memory is not None:
+            f.write('# TYPE audit_peak_memory_bytes gauge\n')
+            f.write('audit_peak_memory_bytes {0}\n'.format(peak_memory))
+        f.write('# EOF\n')
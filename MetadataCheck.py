@@ -1,150 +1,99 @@
-#   ----------------------------------------------------------------
-#   Name:           MetadataCheck.py
-#   Created by:     Neil Rose
-#   Created on:     5/28/2021
-#   Modified by:
-#   Modified on:
-#   Description:    Tool that checks metadata for feature classes
-#   ----------------------------------------------------------------
-
-#   import modules
-import arcpy
-from arcpy import metadata as md
-import datetime
-import os
-import time
-
-
-#   defined functions
-#   Function for creating output messages
-def note(message):
-    return arcpy.AddMessage(str(message))
-
-
-#   Set environments
-arcpy.env.overwriteOutput = True
-
-#   Set inputs
-conn_file = arcpy.GetParameterAsText(0)
-conn_base = os.path.basename(conn_file)
-report_loc = arcpy.GetParameterAsText(1)
-
-#   Global variables
-empty_list = [None, '', ' ']
-md_count = 0
-md_errors = 0
-
-#   Main script
-#   Start timer
-start = time.time()
-start_time = datetime.datetime.today().time()
-note('MetadataCheck.py beginning at {0}...'.format(str(start_time)))
-#   Begin checking metadata
-arcpy.env.workspace = conn_file
-
-report_file = open(os.path.join(report_loc, '{0}_Metadata_Check.txt'.format(conn_base)), 'w')
-
-report_file.write('MetadataCheck tool reviews the Title, Tags, Summary, and Credits fields of metadata.\n')
-report_file.write('If any field is missing, the feature class or table will be flagged as having errors.\n\n\n')
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} features...'.format(os.path.basename(conn_base)))
-note('-------------------------------------------------------------------')
-for fc in sorted(arcpy.ListFeatureClasses()):
-    fc_errors = 0
-    item_md = md.Metadata(fc)
-    md_count += 4
-    note('Checking the {0} Feature Class.'.format(fc))
-    if item_md.title == os.path.basename(fc) or item_md.title in empty_list:
-        md_errors += 1
-        fc_errors += 1
-    if item_md.tags in empty_list:
-        md_errors += 1
-        fc_errors += 1
-    if item_md.summary in empty_list:
-        md_errors += 1
-        fc_errors += 1
-    if item_md.credits in empty_list:
-        md_errors += 1
-        fc_errors += 1
-    if fc_errors > 0:
-        report_file.write('fc: {0} - '
-                          'Feature Class: {1} - '
-                          'There are metadata errors.\n'.format(conn_base, fc))
-    else:
-        report_file.write('fc: {0} - '
-                          'Feature Class: {1} - '
-                          'Metadata is complete.\n'.format(conn_base, fc))
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} tables...'.format(conn_base))
-note('-------------------------------------------------------------------')
-for tbl in sorted(arcpy.ListTables()):
-    tbl_errors = 0
-    item_md = md.Metadata(tbl)
-    md_count += 4
-    note('Checking the {0} Table.'.format(tbl))
-    if item_md.title == os.path.basename(tbl) or item_md.title in empty_list:
-        md_errors += 1
-        tbl_errors += 1
-    if item_md.tags in empty_list:
-        md_errors += 1
-        tbl_errors += 1
-    if item_md.summary in empty_list:
-        md_errors += 1
-        tbl_errors += 1
-    if item_md.credits in empty_list:
-        md_errors += 1
-        tbl_errors += 1
-    if tbl_errors > 0:
-        report_file.write('tbl: {0} - '
-                          'Table: {1} - '
-                          'There are metadata errors.\n'.format(conn_base, tbl))
-    else:
-        report_file.write('tbl: {0} - '
-                          'Table: {1} - '
-                          'Metadata is complete.\n'.format(conn_base, tbl))
-
-datasets = sorted(arcpy.ListDatasets())
-for ds in datasets:
-    note('-------------------------------------------------------------------')
-    note('Checking the {0} Feature Dataset...'.format(ds))
-    note('-------------------------------------------------------------------')
-    for fc in sorted(arcpy.ListFeatureClasses(feature_dataset=ds)):
-        fc_errors = 0
-        item_md = md.Metadata(fc)
-        md_count += 4
-        note('Checking the {0} Feature Class.'.format(fc))
-        if item_md.title == os.path.basename(fc) or item_md.title in empty_list:
-            md_errors += 1
-            fc_errors += 1
-        if item_md.tags in empty_list:
-            md_errors += 1
-            fc_errors += 1
-        if item_md.summary in empty_list:
-            md_errors += 1
-            fc_errors += 1
-        if item_md.credits in empty_list:
-            md_errors += 1
-            fc_errors += 1
-        if fc_errors > 0:
-            report_file.write('fc: {0} - '
-                              'Feature Class: {1} - '
-                              'There are metadata errors.\n'.format(conn_base, fc))
-        else:
-            report_file.write('fc: {0} - '
-                              'Feature Class: {1} - '
-                              'Metadata is complete.\n'.format(conn_base, fc))
-
-report_file.write('\n\nMetadata Input Issues: {0}\n'
-                  'Metadata Field Count: {1}\n'
-                  'Percent Metadata Issues: {2}%'.format(str(md_errors), str(md_count), str(round((md_errors/md_count)*100, 2))))
-
-report_file.close()
-note('All feature class and table metadata has been checked. Please see results in the generated txt file.')
-#   End timer
-end = time.time()
-end_time = datetime.datetime.today().time()
-#   Timer math
-note('MetadataCheck.py completed at {0}...'.format(str(end_time)))
-note('It took {0} minutes to complete...'.format(str(round(((end - start)/60), 4))))
+#   ----------------------------------------------------------------
+#   Name:           MetadataCheck.py
+#   Created by:     Neil Rose
+#   Created on:     5/28/2021
+#   Modified by:    GIS Systems Architecture
+#   Modified on:    10/18/2026
+#   Description:    Tool and audit check that checks metadata for
+#                   feature classes. The metadata of all items is
+#                   read up front, from GDB_Items on enterprise
+#                   geodatabases.
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import datetime
+import os
+from Audit import audit_context, finding_line, location_label, option, register_check, report_finding, run_check
+from Catalog import iter_datasets
+from MetadataProvider import open_metadata
+
+
+#   Global variables
+empty_list = [None, '', ' ']
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that reads the metadata of all datasets up front and opens the report
+#   metadata_threads is the number of threads reading metadata through arcpy.metadata when GDB_Items cannot be read
+def start_check(context):
+    metadata = open_metadata(context.conn_file, [dataset.name for fds, dataset in iter_datasets(context.catalog)],
+                             int(option(context, 'metadata_threads', 1)))
+    report_file = open(os.path.join(context.report_loc, '{0}_Metadata_Check.txt'.format(context.conn_base)), 'w')
+    report_file.write('MetadataCheck tool reviews the Title, Tags, Summary, and Credits fields of metadata.\n')
+    report_file.write('If any field is missing, the feature class or table will be flagged as having errors.\n\n\n')
+    return {'report_file': report_file, 'metadata': metadata, 'md_count': 0, 'md_errors': 0}
+
+
+#   Function that checks the title, tags, summary and credits of a feature class or table
+def visit_dataset(state, context, fds, dataset):
+    item_md = state['metadata'][dataset.name]
+    errors = 0
+    state['md_count'] += 4
+    if item_md.title == os.path.basename(dataset.name) or item_md.title in empty_list:
+        errors += 1
+    if item_md.tags in empty_list:
+        errors += 1
+    if item_md.summary in empty_list:
+        errors += 1
+    if item_md.credits in empty_list:
+        errors += 1
+    state['md_errors'] += errors
+    if errors > 0:
+        state['report_file'].write(finding_line(report_finding(
+            context, 'MetadataCheck', fds, dataset.name, None, 'IncompleteMetadata',
+            'There are metadata errors, {0} of the Title, Tags, Summary and Credits are missing.'.format(errors)),
+            dataset.datasetType, ' - '))
+    else:
+        state['report_file'].write('{0} - Metadata is complete.\n'.format(
+            location_label(context.conn_base, fds, dataset.name, dataset.datasetType)))
+
+
+#   Function that writes the totals and closes the report
+def finish_check(state, context, dataset_results):
+    report_file = state['report_file']
+    md_errors, md_count = state['md_errors'], state['md_count']
+    report_file.write('\n\nMetadata Input Issues: {0}\n'
+                      'Metadata Field Count: {1}\n'
+                      'Percent Metadata Issues: {2}%'.format(str(md_errors), str(md_count),
+                                                            str(round((md_errors/md_count)*100, 2))))
+    report_file.close()
+
+
+register_check('MetadataCheck', start_check, visit_dataset, finish=finish_check)
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    conn_file = arcpy.GetParameterAsText(0)
+    report_loc = arcpy.GetParameterAsText(1)
+    catalog_file = arcpy.GetParameterAsText(2)
+    #   Threads reading metadata through arcpy.metadata when GDB_Items cannot be read
+    metadata_threads = arcpy.GetParameterAsText(3)
+
+    start_time = datetime.datetime.today().time()
+    note('MetadataCheck.py beginning at {0}...'.format(str(start_time)))
+    run_check(audit_context(conn_file, report_loc, catalog_file, {'metadata_threads': metadata_threads}),
+              'MetadataCheck')
+    note('All feature class and table metadata has been checked. Please see results in the generated txt file.')
+    end_time = datetime.datetime.today().time()
+    note('MetadataCheck.py completed at {0}...'.format(str(end_time)))
@@ -0,0 +1,61 @@
+#   ----------------------------------------------------------------
+#   Name:           MetadataProvider.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that reads the metadata of the catalog
+#                   feature classes and tables. Enterprise
+#                   geodatabases are read from the GDB_Items
+#                   Documentation XML in one query, other workspaces
+#                   and unregistered items through arcpy.metadata on
+#                   a pool of threads.
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+from arcpy import metadata as md
+from concurrent.futures import ThreadPoolExecutor
+from Catalog import sde_executor, workspace_dialect
+from CatalogModel import ItemMetadata
+from GdbItems import read_metadata
+from Instrument import span
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that reads the metadata of one item through arcpy.metadata
+def read_item_metadata(name):
+    with span('Metadata', 'arcpy', dataset=name):
+        item_md = md.Metadata(name)
+        return ItemMetadata(item_md.title, item_md.tags, item_md.summary, item_md.credits)
+
+
+#   Function that reads the metadata of the items through arcpy.metadata, on a pool of threads if workers is above 1
+def read_items_metadata(names, workers=1):
+    if workers <= 1 or len(names) < 2:
+        return dict((name, read_item_metadata(name)) for name in names)
+    workers = min(workers, len(names))
+    note('Reading the metadata of {0} items with {1} threads...'.format(len(names), workers))
+    with ThreadPoolExecutor(workers) as pool:
+        return dict(zip(names, pool.map(read_item_metadata, names)))
+
+
+#   Function used by the checks to get {item name: ItemMetadata} for the items
+#   GDB_Items is read when it can be, the items it does not hold are read through arcpy.metadata
+def open_metadata(conn_file, names, workers=1):
+    metadata = {}
+    dialect = workspace_dialect(conn_file)
+    if dialect is not None:
+        try:
+            items = read_metadata(sde_executor(conn_file), dialect)
+            metadata = dict((name, items[name.upper()]) for name in names if name.upper() in items)
+        except Exception as e:
+            note('GDB_Items documentation could not be read ({0}), reading the metadata of each item instead...'
+                 .format(e))
+    metadata.update(read_items_metadata([name for name in names if name not in metadata], workers))
+    return metadata
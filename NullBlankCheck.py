@@ -1,133 +1,92 @@
-#   ----------------------------------------------------------------
-#   Name:           NullBlankCheck.py
-#   Created by:     Neil Rose
-#   Created on:     6/29/2021
-#   Modified by:
-#   Modified on:
-#   Description:    Tool that checks whether a field uses NULL or
-#                   a blank for no attribute data
-#   ----------------------------------------------------------------
-
-#   import modules
-import arcpy
-import datetime
-import os
-import time
-
-
-#   defined functions
-#   Function for creating output messages
-def note(message):
-    return arcpy.AddMessage(str(message))
-
-
-#   Set environments
-arcpy.env.overwriteOutput = True
-
-#   Set inputs
-conn_file = arcpy.GetParameterAsText(0)
-conn_base = os.path.basename(conn_file)
-report_loc = arcpy.GetParameterAsText(1)
-var_check = arcpy.GetParameterAsText(2)
-if var_check == 'Blank':
-    if_type = ''
-    var_type = 'Blank'
-else:
-    if_type = None
-    var_type = 'Null'
-
-
-#   Global variables
-error_count = 0
-
-#   Main script
-#   Start timer
-start = time.time()
-start_time = datetime.datetime.today().time()
-note('NullBlankCheck.py beginning at {0}...'.format(str(start_time)))
-#   Begin checking reserved words
-arcpy.env.workspace = conn_file
-
-report_file = open(os.path.join(report_loc, '{0}_{1}_Check.txt'.format(conn_base, var_type)), 'w')
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} features...'.format(os.path.basename(conn_base)))
-note('-------------------------------------------------------------------')
-for fc in sorted(arcpy.ListFeatureClasses()):
-    note('Checking the {0} Feature Class.'.format(fc))
-    field_list = arcpy.ListFields(fc)
-    fields = []
-    for field in field_list:
-        fields.append(field.name)
-    with arcpy.da.SearchCursor(fc, fields) as cursor:
-        tfc_oid_list = []
-        for row in cursor:
-            field_len = len(fields)
-            row_counter = 0
-            while row_counter < field_len:
-                if row[row_counter] == if_type:
-                    tfc_oid_list.append(row[0])
-                    error_count += 1
-                row_counter += 1
-        tfc_oid_errors = set(tfc_oid_list)
-        for oid in tfc_oid_errors:
-            report_file.write('fc - {0} - OID {1} contains 1 or more {2} values\n'.format(fc, oid, var_type))
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} tables...'.format(conn_base))
-note('-------------------------------------------------------------------')
-for tbl in sorted(arcpy.ListTables()):
-    note('Checking the {0} Table.'.format(tbl))
-    field_list = arcpy.ListFields(tbl)
-    fields = []
-    for field in field_list:
-        fields.append(field.name)
-    with arcpy.da.SearchCursor(tbl, fields) as cursor:
-        tbl_oid_list = []
-        for row in cursor:
-            field_len = len(fields)
-            row_counter = 0
-            while row_counter < field_len:
-                if row[row_counter] == if_type:
-                    tbl_oid_list.append(row[0])
-                    error_count += 1
-                row_counter += 1
-        tbl_oid_errors = set(tbl_oid_list)
-        for oid in tbl_oid_errors:
-            report_file.write('fc - {0} - OID {1} contains 1 or more {2} values\n'.format(tbl, oid, var_type))
-
-datasets = sorted(arcpy.ListDatasets())
-for ds in datasets:
-    note('-------------------------------------------------------------------')
-    note('Checking the {0} Feature Dataset...'.format(ds))
-    note('-------------------------------------------------------------------')
-    for fc in sorted(arcpy.ListFeatureClasses(feature_dataset=ds)):
-        note('Checking the {0} Feature Class.'.format(fc))
-        field_list = arcpy.ListFields(fc)
-        fields = []
-        for field in field_list:
-            fields.append(field.name)
-        with arcpy.da.SearchCursor(fc, fields) as cursor:
-            fc_oid_list = []
-            for row in cursor:
-                field_len = len(fields)
-                row_counter = 0
-                while row_counter < field_len:
-                    if row[row_counter] == if_type:
-                        fc_oid_list.append(row[0])
-                        error_count += 1
-                    row_counter += 1
-            fc_oid_errors = set(fc_oid_list)
-            for oid in fc_oid_errors:
-                report_file.write('fc - {0} - OID {1} contains 1 or more {2} values\n'.format(fc, oid, var_type))
-
-report_file.write('\n\n{0} Instances: {1}\n'.format(var_type, error_count))
-
-report_file.close()
-note('All attributes have been verified. Please see results in the generated txt file.')
-#   End timer
-end = time.time()
-end_time = datetime.datetime.today().time()
-#   Timer math
-note('NullBlankCheck.py completed at {0}...'.format(str(end_time)))
-note('It took {0} minutes to complete...'.format(str(round(((end - start)/60), 4))))
+#   ----------------------------------------------------------------
+#   Name:           NullBlankCheck.py
+#   Created by:     Neil Rose
+#   Created on:     6/29/2021
+#   Modified by:    GIS Systems Architecture
+#   Modified on:    10/18/2026
+#   Description:    Tool and audit check that checks whether a field
+#                   uses NULL or a blank for no attribute data. The
+#                   Profile report type writes the Null and Blank
+#                   counts, fill rate and example OIDs of every field
+#                   instead of every offending OID
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import datetime
+import os
+from Audit import audit_context, finding_emitter, option, register_check, run_check
+from AttributeScan import scan_catalog, write_profile_report, write_rule_report
+from Incremental import open_state, save_state
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that returns the rule the check reports, Null unless null_blank is Blank
+def check_type(context):
+    return 'Blank' if option(context, 'null_blank') == 'Blank' else 'Null'
+
+
+#   Function that returns the row rule of the check
+#   A profile keeps samples of every field so it runs its own scan instead of the shared one
+def check_rules(context):
+    if option(context, 'report_type') == 'Profile':
+        return []
+    return [check_type(context)]
+
+
+#   Function that writes the rule report, or scans and writes the profile of every field
+def finish_check(state, context, dataset_results):
+    if option(context, 'report_type') == 'Profile':
+        state_file = option(context, 'state_file')
+        scan_state = open_state(state_file) if state_file is not None else None
+        dataset_profiles = scan_catalog(context.catalog, ['Null', 'Blank'], context.conn_file, scan_state,
+                                        int(option(context, 'workers', 1)), int(option(context, 'batch_size', 0)),
+                                        int(option(context, 'sample_size', 5)))
+        report_file = open(os.path.join(context.report_loc, '{0}_NullBlank_Profile.txt'.format(context.conn_base)),
+                           'w')
+        write_profile_report(report_file, context.catalog, ['Null', 'Blank'], dataset_profiles)
+        report_file.close()
+        if scan_state is not None:
+            save_state(scan_state)
+        return
+    var_type = check_type(context)
+    report_file = open(os.path.join(context.report_loc, '{0}_{1}_Check.txt'.format(context.conn_base, var_type)), 'w')
+    write_rule_report(report_file, context.catalog, var_type, dataset_results, 'NullBlankCheck',
+                      finding_emitter(context))
+    report_file.close()
+
+
+register_check('NullBlankCheck', None, rules=check_rules, finish=finish_check)
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    conn_file = arcpy.GetParameterAsText(0)
+    report_loc = arcpy.GetParameterAsText(1)
+    var_check = arcpy.GetParameterAsText(2)
+    catalog_file = arcpy.GetParameterAsText(3)
+    state_file = arcpy.GetParameterAsText(4)
+    workers = arcpy.GetParameterAsText(5)
+    batch_size = arcpy.GetParameterAsText(6)
+    report_type = arcpy.GetParameterAsText(7)
+    sample_size = arcpy.GetParameterAsText(8)
+    pushdown = arcpy.GetParameterAsText(9)
+
+    start_time = datetime.datetime.today().time()
+    note('NullBlankCheck.py beginning at {0}...'.format(str(start_time)))
+    run_check(audit_context(conn_file, report_loc, catalog_file,
+                            {'null_blank': var_check, 'report_type': report_type, 'sample_size': sample_size,
+                             'state_file': state_file, 'workers': workers, 'batch_size': batch_size,
+                             'pushdown': pushdown}), 'NullBlankCheck')
+    note('All attributes have been verified. Please see results in the generated txt file.')
+    end_time = datetime.datetime.today().time()
+    note('NullBlankCheck.py completed at {0}...'.format(str(end_time)))
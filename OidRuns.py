@@ -0,0 +1,51 @@
+#   ----------------------------------------------------------------
+#   Name:           OidRuns.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that stores sets of OIDs as sorted runs of
+#                   consecutive OIDs, [first, last], so a table that
+#                   is blank from end to end costs one run instead of
+#                   one list entry per row. Runs are formatted for
+#                   the reports. It does not import arcpy.
+#   ----------------------------------------------------------------
+
+#   defined functions
+#   Function that adds an OID to a list of runs, extending the last run when the OID follows it
+#   OIDs added out of order leave the runs unsorted until merge_runs is called
+def append_oid(runs, oid):
+    if runs:
+        last = runs[-1]
+        if last[0] <= oid <= last[1]:
+            return
+        if oid == last[1] + 1:
+            last[1] = oid
+            return
+    runs.append([oid, oid])
+
+
+#   Function that sorts runs and merges the ones that overlap or touch
+def merge_runs(runs):
+    merged = []
+    for first, last in sorted(runs):
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], last)
+        else:
+            merged.append([first, last])
+    return merged
+
+
+#   Function that turns any iterable of OIDs into sorted runs
+def compress_oids(oids):
+    runs = []
+    for oid in sorted(set(oids)):
+        append_oid(runs, oid)
+    return runs
+
+
+#   Function that formats a run for a report, 5 or 1-250000
+def format_run(run):
+    if run[0] == run[1]:
+        return str(run[0])
+    return '{0}-{1}'.format(run[0], run[1])
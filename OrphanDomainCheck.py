@@ -1,115 +1,69 @@
-#   ----------------------------------------------------------------
-#   Name:           OrphanDomainCheck.py
-#   Created by:     Neil Rose
-#   Created on:     4/28/2021
-#   Modified by:
-#   Modified on:
-#   Description:    Tool that reports orphaned domains
-#   ----------------------------------------------------------------
-
-#   import modules
-import arcpy
-import datetime
-import os
-import time
-
-
-#   defined functions
-#   Function for creating output messages
-def note(message):
-    return arcpy.AddMessage(str(message))
-
-
-#   Set environments
-arcpy.env.overwriteOutput = True
-
-#   Set inputs
-conn_file = arcpy.GetParameterAsText(0)
-conn_base = os.path.basename(conn_file)
-report_loc = arcpy.GetParameterAsText(1)
-
-#   Global variables
-sde_domain_list = []
-fc_domain_list = []
-orphan_domain_list = []
-orphan_domain_count = 0
-
-#   Main script
-#   Start timer
-start = time.time()
-start_time = datetime.datetime.today().time()
-note('OrphanDomainCheck.py beginning at {0}...'.format(str(start_time)))
-#   Begin checking reserved words
-arcpy.env.workspace = conn_file
-
-report_file = open(os.path.join(report_loc, '{0}_OrphanDomains_Check.txt'.format(conn_base)), 'w')
-
-note('-------------------')
-note('Reading SDE Domains')
-note('-------------------')
-domains = arcpy.da.ListDomains(conn_file)
-for domain in domains:
-    sde_domain_list.append(domain.name)
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} features...'.format(os.path.basename(conn_base)))
-note('-------------------------------------------------------------------')
-for fc in sorted(arcpy.ListFeatureClasses()):
-    note('Checking the {0} Feature Class...'.format(fc))
-    fc_desc = arcpy.Describe(fc)
-    for fn in (arcpy.ListFields(fc)):
-        if fn.domain not in [None, '']:
-            fc_domain_list.append(fn.domain)
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} tables...'.format(conn_base))
-note('-------------------------------------------------------------------')
-for tbl in sorted(arcpy.ListTables()):
-    note('Checking the {0} Table...'.format(tbl))
-    tbl_desc = arcpy.Describe(tbl)
-    for fn in (arcpy.ListFields(tbl)):
-        if fn.domain not in [None, '']:
-            fc_domain_list.append(fn.domain)
-
-datasets = sorted(arcpy.ListDatasets())
-for ds in datasets:
-    note('-------------------------------------------------------------------')
-    note('Checking the {0} Feature Dataset...'.format(ds))
-    note('-------------------------------------------------------------------')
-    for fc in sorted(arcpy.ListFeatureClasses(feature_dataset=ds)):
-        note('Checking the {0} Feature Class...'.format(fc))
-        fc_desc = arcpy.Describe(fc)
-        for fn in (arcpy.ListFields(fc)):
-            if fn.domain not in [None, '']:
-                fc_domain_list.append(fn.domain)
-
-note('----------------------------------------------')
-note('Comparing GDB Domain list to FC Domain list...')
-note('----------------------------------------------')
-
-for domain in sde_domain_list:
-    if domain not in fc_domain_list:
-        orphan_domain_list.append(domain)
-        orphan_domain_count += 1
-
-sde_domain_count = len(sde_domain_list)
-
-for domain in orphan_domain_list:
-    report_file.write('{0} is an orphan domain\n'.format(domain))
-
-
-report_file.write('\n\nOrphaned Domains Errors: {0}\n'
-                  'SDE Domain Count: {1}\n'
-                  'Percent Orphan Error: {2}%\n\n'.format(str(orphan_domain_count),
-                                                          str(sde_domain_count),
-                                                          str(round((orphan_domain_count/sde_domain_count)*100, 2))))
-
-
-report_file.close()
-note('All domains have been verified. Please see results in the generated txt file.')
-#   End timer
-end = time.time()
-end_time = datetime.datetime.today().time()
-#   Timer math
-note('OrphanDomainCheck.py completed at {0}...'.format(str(end_time)))
-note('It took {0} minutes to complete...'.format(str(round(((end - start)/60), 4))))
+#   ----------------------------------------------------------------
+#   Name:           OrphanDomainCheck.py
+#   Created by:     Neil Rose
+#   Created on:     4/28/2021
+#   Modified by:    GIS Systems Architecture
+#   Modified on:    10/18/2026
+#   Description:    Tool that reports orphaned domains, a domain used
+#                   only by a subtype is not an orphan
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import datetime
+import os
+from Audit import audit_context, finding_line, register_check, report_finding, run_check
+from CatalogModel import domain_usage
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that writes the domains no field or subtype uses
+def finish_check(state, context, dataset_results):
+    report_file = open(os.path.join(context.report_loc, '{0}_OrphanDomains_Check.txt'.format(context.conn_base)), 'w')
+    sde_domain_list = [domain.name for domain in context.catalog.domains]
+
+    note('-------------------------------------------------------------------')
+    note('Indexing the {0} domain usage...'.format(context.conn_base))
+    note('-------------------------------------------------------------------')
+    usage = domain_usage(context.catalog)
+
+    orphan_domain_list = [domain for domain in sde_domain_list if domain not in usage]
+    orphan_domain_count = len(orphan_domain_list)
+    sde_domain_count = len(sde_domain_list)
+
+    for domain in orphan_domain_list:
+        report_file.write(finding_line(report_finding(context, 'OrphanDomainCheck', None, None, None, 'OrphanDomain',
+                                                      '{0} is an orphan domain'.format(domain))))
+
+    percent = round((orphan_domain_count/sde_domain_count)*100, 2)
+    report_file.write('\n\nOrphaned Domains Errors: {0}\n'
+                      'SDE Domain Count: {1}\n'
+                      'Percent Orphan Error: {2}%\n\n'.format(str(orphan_domain_count), str(sde_domain_count),
+                                                              str(percent)))
+    report_file.close()
+
+
+register_check('OrphanDomainCheck', None, finish=finish_check)
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    conn_file = arcpy.GetParameterAsText(0)
+    report_loc = arcpy.GetParameterAsText(1)
+    catalog_file = arcpy.GetParameterAsText(2)
+
+    start_time = datetime.datetime.today().time()
+    note('OrphanDomainCheck.py beginning at {0}...'.format(str(start_time)))
+    run_check(audit_context(conn_file, report_loc, catalog_file), 'OrphanDomainCheck')
+    note('All domains have been verified. Please see results in the generated txt file.')
+    end_time = datetime.datetime.today().time()
+    note('OrphanDomainCheck.py completed at {0}...'.format(str(end_time)))
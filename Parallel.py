@@ -0,0 +1,50 @@
+#   ----------------------------------------------------------------
+#   Name:           Parallel.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that fans feature classes and tables out
+#                   to a pool of worker processes. Each worker opens
+#                   its own workspace connection and the results
+#                   come back in the order the datasets were given.
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import multiprocessing
+import os
+import sys
+from Instrument import span
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function run once in every worker process to open its own workspace connection
+def _init_worker(conn_file):
+    arcpy.env.workspace = conn_file
+
+
+#   Function that runs scan_function over every dataset and returns the results in dataset order
+#   scan_function must be importable by the workers, a function defined in a tool script is not
+def scan_datasets(datasets, scan_function, conn_file, workers=1):
+    if workers <= 1 or len(datasets) < 2:
+        results = []
+        for dataset in datasets:
+            note('Checking the {0} {1}.'.format(dataset.name, 'Table' if dataset.datasetType == 'Table'
+                                                 else 'Feature Class'))
+            with span('Scan', 'scan', dataset=dataset.name):
+                results.append(scan_function(dataset))
+        return results
+    #   Inside ArcGIS Pro sys.executable is the application, the workers need the python interpreter
+    if not os.path.basename(sys.executable).lower().startswith('python'):
+        multiprocessing.set_executable(os.path.join(sys.exec_prefix, 'python.exe'))
+    workers = min(workers, len(datasets))
+    note('Checking {0} datasets with {1} worker processes...'.format(len(datasets), workers))
+    with multiprocessing.Pool(workers, _init_worker, (conn_file,)) as pool:
+        with span('Scan', 'scan', datasets=len(datasets), workers=workers):
+            return pool.map(scan_function, datasets, chunksize=1)
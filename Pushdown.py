@@ -0,0 +1,99 @@
+#   ----------------------------------------------------------------
+#   Name:           Pushdown.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that pushes the row rules down to the
+#                   database. One aggregate query counts the matches
+#                   of every rule and column, and OIDs are fetched
+#                   only for the columns that have matches. Queries
+#                   go through an execute function so the module can
+#                   run against ArcSDESQLExecute or a local SQLite
+#                   stand-in. It does not import arcpy.
+#   ----------------------------------------------------------------
+
+#   import modules
+from OidRuns import append_oid, merge_runs
+
+
+#   Global variables
+#   Where clause of each rule that can be pushed down, by dialect, {0} is the column
+#   On the rows of a base table the clauses match exactly what the rule matches in python. SQL Server compares
+#   strings padded with spaces so lengths are compared instead, and Oracle stores an empty string as a Null so it
+#   has no Blanks. Leading and trailing whitespace is any Unicode whitespace, which LIKE cannot match, so those
+#   rules are always scanned.
+#   File Geodatabase clauses are used as arcpy where clauses.
+#   The base table is only the rows a cursor reads when the dataset is neither versioned nor archived, see
+#   pushdown_applies
+rule_sql = {'SQL Server': {'Null': '{0} IS NULL',
+                           'Blank': 'DATALENGTH({0}) = 0',
+                           'ExtraSpaces': "{0} LIKE '%  %'"},
+            'Oracle': {'Null': '{0} IS NULL',
+                       'Blank': '1 = 0',
+                       'ExtraSpaces': "{0} LIKE '%  %'"},
+            'PostgreSQL': {'Null': '{0} IS NULL',
+                           'Blank': "{0} = ''",
+                           'ExtraSpaces': "{0} LIKE '%  %'"},
+            'SQLite': {'Null': '{0} IS NULL',
+                       'Blank': "{0} = ''",
+                       'ExtraSpaces': "{0} LIKE '%  %'"},
+            'File Geodatabase': {'Null': '{0} IS NULL',
+                                 'Blank': "{0} = ''",
+                                 'ExtraSpaces': "{0} LIKE '%  %'"}}
+
+
+#   defined functions
+#   Function that returns the table name to query for a dataset name, the database part is dropped
+#   The base table is queried, so it only holds the rows a cursor reads when pushdown_applies to the dataset
+def table_name(dataset_name):
+    return '.'.join(dataset_name.split('.')[-2:])
+
+
+#   Function that tells whether the rules of a dataset can be pushed down to its base table
+#   A traditional versioned dataset keeps its edits in the delta tables, and a branch versioned or archived one
+#   keeps historical and deleted rows in the base table, so those are left to the cursor scan.
+#   File Geodatabase clauses run as arcpy where clauses on what the cursor reads and always apply
+def pushdown_applies(dialect, is_versioned, is_archived):
+    return dialect == 'File Geodatabase' or not (is_versioned or is_archived)
+
+
+#   Function that returns (rule, field, where clause) for every field of every rule
+#   rule_fields is a list of (rule, fields it applies to)
+def rule_predicates(dialect, rule_fields):
+    return [(rule, field, rule_sql[dialect][rule].format(field)) for rule, fields in rule_fields for field in fields]
+
+
+#   Function that builds the query that counts the matches of every predicate in one pass over the table
+def count_sql(table, predicates):
+    return 'SELECT {0} FROM {1}'.format(', '.join('SUM(CASE WHEN {0} THEN 1 ELSE 0 END)'.format(where)
+                                                  for rule, field, where in predicates), table)
+
+
+#   Function that builds the query that returns the OIDs matching a predicate in ascending order
+def oid_sql(table, oid_field, where):
+    return 'SELECT {0} FROM {1} WHERE {2} ORDER BY {0}'.format(oid_field, table, where)
+
+
+#   Function that evaluates the rules in the database, count first and OIDs only for columns with matches
+#   Returns {rule: [runs of OIDs with a match, instance count, {field: instance count}, {field: runs of OIDs}]}
+#   like scan_rules
+def pushdown_rules(execute, dialect, table, oid_field, rule_fields):
+    predicates = rule_predicates(dialect, rule_fields)
+    results = dict((rule, [[], 0, {}, {}]) for rule, fields in rule_fields)
+    if not predicates:
+        return results
+    counts = execute(count_sql(table, predicates))
+    for (rule, field, where), count in zip(predicates, counts[0] if counts else []):
+        if not count:
+            continue
+        results[rule][1] += int(count)
+        results[rule][2][field] = int(count)
+        field_runs = []
+        for row in execute(oid_sql(table, oid_field, where)):
+            append_oid(field_runs, row[0])
+        results[rule][0].extend(field_runs)
+        results[rule][3][field] = field_runs
+    for rule in results:
+        results[rule][0] = merge_runs(results[rule][0])
+    return results
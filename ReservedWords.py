@@ -1,353 +1,383 @@
-#   ----------------------------------------------------------------
-#   Name:           ReservedWords.py
-#   Created by:     Neil Rose
-#   Created on:     4/30/2021
-#   Modified by:
-#   Modified on:
-#   Description:    Module that contains the different reserved word
-#                   lists for different database types
-#   ----------------------------------------------------------------
-
-#   Reserved word lists
-sql_rsv = ['A', 'ABORT', 'ABS', 'ABSOLUTE', 'ACCESS', 'ACTION', 'ADA', 'ADD', 'ADMIN', 'AFTER', 'AGGREGATE', 'ALIAS',
-           'ALL', 'ALLOCATE', 'ALSO', 'ALTER', 'ALWAYS', 'ANALYSE', 'ANALYZE', 'AND', 'ANY', 'ARE', 'ARRAY', 'AS',
-           'ASC', 'ASENSITIVE', 'ASSERTION', 'ASSIGNMENT', 'ASYMMETRIC', 'AT', 'ATOMIC', 'ATTRIBUTE', 'ATTRIBUTES',
-           'AUDIT', 'AUTHORIZATION', 'AUTO_INCREMENT', 'AVG', 'AVG_ROW_LENGTH', 'BACKUP', 'BACKWARD', 'BEFORE',
-           'BEGIN', 'BERNOULLI', 'BETWEEN', 'BIGINT', 'BINARY', 'BIT', 'BIT_LENGTH', 'BITVAR', 'BLOB', 'BOOL',
-           'BOOLEAN', 'BOTH', 'BREADTH', 'BREAK', 'BROWSE', 'BULK', 'BY', 'C', 'CACHE', 'CALL', 'CALLED',
-           'CARDINALITY', 'CASCADE', 'CASCADED', 'CASE', 'CAST', 'CATALOG', 'CATALOG_NAME', 'CEIL', 'CEILING',
-           'CHAIN', 'CHANGE', 'CHAR', 'CHAR_LENGTH', 'CHARACTER', 'CHARACTER_LENGTH', 'CHARACTER_SET_CATALOG',
-           'CHARACTER_SET_NAME', 'CHARACTER_SET_SCHEMA', 'CHARACTERISTICS', 'CHARACTERS', 'CHECK', 'CHECKED',
-           'CHECKPOINT', 'CHECKSUM', 'CLASS', 'CLASS_ORIGIN', 'CLOB', 'CLOSE', 'CLUSTER', 'CLUSTERED', 'COALESCE',
-           'COBOL', 'COLLATE', 'COLLATION', 'COLLATION_CATALOG', 'COLLATION_NAME', 'COLLATION_SCHEMA', 'COLLECT',
-           'COLUMN', 'COLUMN_NAME', 'COLUMNS', 'COMMAND_FUNCTION', 'COMMAND_FUNCTION_CODE', 'COMMENT', 'COMMIT',
-           'COMMITTED', 'COMPLETION', 'COMPRESS', 'COMPUTE', 'CONDITION', 'CONDITION_NUMBER', 'CONNECT', 'CONNECTION',
-           'CONNECTION_NAME', 'CONSTRAINT', 'CONSTRAINT_CATALOG', 'CONSTRAINT_NAME', 'CONSTRAINT_SCHEMA',
-           'CONSTRAINTS', 'CONSTRUCTOR', 'CONTAINS', 'CONTAINSTABLE', 'CONTINUE', 'CONVERSION', 'CONVERT', 'COPY',
-           'CORR', 'CORRESPONDING', 'COUNT', 'COVAR_POP', 'COVAR_SAMP', 'CREATE', 'CREATEDB', 'CREATEROLE',
-           'CREATEUSER', 'CROSS', 'CSV', 'CUBE', 'CUME_DIST', 'CURRENT', 'CURRENT_DATE',
-           'CURRENT_DEFAULT_TRANSFORM_GROUP', 'CURRENT_PATH', 'CURRENT_ROLE', 'CURRENT_TIME', 'CURRENT_TIMESTAMP',
-           'CURRENT_TRANSFORM_GROUP_FOR_TYPE', 'CURRENT_USER', 'CURSOR', 'CURSOR_NAME', 'CYCLE', 'DATA', 'DATABASE',
-           'DATABASES', 'DATE', 'DATETIME', 'DATETIME_INTERVAL_CODE', 'DATETIME_INTERVAL_PRECISION', 'DAY',
-           'DAY_HOUR', 'DAY_MICROSECOND', 'DAY_MINUTE', 'DAY_SECOND', 'DAYOFMONTH', 'DAYOFWEEK', 'DAYOFYEAR', 'DBCC',
-           'DEALLOCATE', 'DEC', 'DECIMAL', 'DECLARE', 'DEFAULT', 'DEFAULTS', 'DEFERRABLE', 'DEFERRED', 'DEFINED',
-           'DEFINER', 'DEGREE', 'DELAY_KEY_WRITE', 'DELAYED', 'DELETE', 'DELIMITER', 'DELIMITERS', 'DENSE_RANK',
-           'DENY', 'DEPTH', 'DEREF', 'DERIVED', 'DESC', 'DESCRIBE', 'DESCRIPTOR', 'DESTROY', 'DESTRUCTOR',
-           'DETERMINISTIC', 'DIAGNOSTICS', 'DICTIONARY', 'DISABLE', 'DISCONNECT', 'DISK', 'DISPATCH', 'DISTINCT',
-           'DISTINCTROW', 'DISTRIBUTED', 'DIV', 'DO', 'DOMAIN', 'DOUBLE', 'DROP', 'DUAL', 'DUMMY', 'DUMP', 'DYNAMIC',
-           'DYNAMIC_FUNCTION', 'DYNAMIC_FUNCTION_CODE', 'EACH', 'ELEMENT', 'ELSE', 'ELSEIF', 'ENABLE', 'ENCLOSED',
-           'ENCODING', 'ENCRYPTED', 'END', 'END-EXEC', 'ENUM', 'EQUALS', 'ERRLVL', 'ESCAPE', 'ESCAPED', 'EVERY',
-           'EXCEPT', 'EXCEPTION', 'EXCLUDE', 'EXCLUDING', 'EXCLUSIVE', 'EXEC', 'EXECUTE', 'EXISTING', 'EXISTS',
-           'EXIT', 'EXP', 'EXPLAIN', 'EXTERNAL', 'EXTRACT', 'FALSE', 'FETCH', 'FIELDS', 'FILE', 'FILLFACTOR',
-           'FILTER', 'FINAL', 'FIRST', 'FLOAT', 'FLOAT4', 'FLOAT8', 'FLOOR', 'FLUSH', 'FOLLOWING', 'FOR', 'FORCE',
-           'FOREIGN', 'FORTRAN', 'FORWARD', 'FOUND', 'FREE', 'FREETEXT', 'FREETEXTTABLE', 'FREEZE', 'FROM', 'FULL',
-           'FULLTEXT', 'FUNCTION', 'FUSION', 'G', 'GENERAL', 'GENERATED', 'GET', 'GLOBAL', 'GO', 'GOTO', 'GRANT',
-           'GRANTED', 'GRANTS', 'GREATEST', 'GROUP', 'GROUPING', 'HANDLER', 'HAVING', 'HEADER', 'HEAP', 'HIERARCHY',
-           'HIGH_PRIORITY', 'HOLD', 'HOLDLOCK', 'HOST', 'HOSTS', 'HOUR', 'HOUR_MICROSECOND', 'HOUR_MINUTE',
-           'HOUR_SECOND', 'IDENTIFIED', 'IDENTITY', 'IDENTITY_INSERT', 'IDENTITYCOL', 'IF', 'IGNORE', 'ILIKE',
-           'IMMEDIATE', 'IMMUTABLE', 'IMPLEMENTATION', 'IMPLICIT', 'IN', 'INCLUDE', 'INCLUDING', 'INCREMENT', 'INDEX',
-           'INDICATOR', 'INFILE', 'INFIX', 'INHERIT', 'INHERITS', 'INITIAL', 'INITIALIZE', 'INITIALLY', 'INNER',
-           'INOUT', 'INPUT', 'INSENSITIVE', 'INSERT', 'INSERT_ID', 'INSTANCE', 'INSTANTIABLE', 'INSTEAD', 'INT',
-           'INT1', 'INT2', 'INT3', 'INT4', 'INT8', 'INTEGER', 'INTERSECT', 'INTERSECTION', 'INTERVAL', 'INTO',
-           'INVOKER', 'IS', 'ISAM', 'ISNULL', 'ISOLATION', 'ITERATE', 'JOIN', 'K', 'KEY', 'KEY_MEMBER', 'KEY_TYPE',
-           'KEYS', 'KILL', 'LANCOMPILER', 'LANGUAGE', 'LARGE', 'LAST', 'LAST_INSERT_ID', 'LATERAL', 'LEADING',
-           'LEAST', 'LEAVE', 'LEFT', 'LENGTH', 'LESS', 'LEVEL', 'LIKE', 'LIMIT', 'LINENO', 'LINES', 'LISTEN', 'LN',
-           'LOAD', 'LOCAL', 'LOCALTIME', 'LOCALTIMESTAMP', 'LOCATION', 'LOCATOR', 'LOCK', 'LOGIN', 'LOGS', 'LONG',
-           'LONGBLOB', 'LONGTEXT', 'LOOP', 'LOW_PRIORITY', 'LOWER', 'M', 'MAP', 'MATCH', 'MATCHED', 'MAX', 'MAX_ROWS',
-           'MAXEXTENTS', 'MAXVALUE', 'MEDIUMBLOB', 'MEDIUMINT', 'MEDIUMTEXT', 'MEMBER', 'MERGE', 'MESSAGE_LENGTH',
-           'MESSAGE_OCTET_LENGTH', 'MESSAGE_TEXT', 'METHOD', 'MIDDLEINT', 'MIN', 'MIN_ROWS', 'MINUS', 'MINUTE',
-           'MINUTE_MICROSECOND', 'MINUTE_SECOND', 'MINVALUE', 'MLSLABEL', 'MOD', 'MODE', 'MODIFIES', 'MODIFY',
-           'MODULE', 'MONTH', 'MONTHNAME', 'MORE', 'MOVE', 'MULTISET', 'MUMPS', 'MYISAM', 'NAME', 'NAMES',
-           'NATIONAL', 'NATURAL', 'NCHAR', 'NCLOB', 'NESTING', 'NEW', 'NEXT', 'NO', 'NO_WRITE_TO_BINLOG', 'NOAUDIT',
-           'NOCHECK', 'NOCOMPRESS', 'NOCREATEDB', 'NOCREATEROLE', 'NOCREATEUSER', 'NOINHERIT', 'NOLOGIN',
-           'NONCLUSTERED', 'NONE', 'NORMALIZE', 'NORMALIZED', 'NOSUPERUSER', 'NOT', 'NOTHING', 'NOTIFY', 'NOTNULL',
-           'NOWAIT', 'NULL', 'NULLABLE', 'NULLIF', 'NULLS', 'NUMBER', 'NUMERIC', 'OBJECT', 'OCTET_LENGTH', 'OCTETS',
-           'OF', 'OFF', 'OFFLINE', 'OFFSET', 'OFFSETS', 'OIDS', 'OLD', 'ON', 'ONLINE', 'ONLY', 'OPEN',
-           'OPENDATASOURCE', 'OPENQUERY', 'OPENROWSET', 'OPENXML', 'OPERATION', 'OPERATOR', 'OPTIMIZE', 'OPTION',
-           'OPTIONALLY', 'OPTIONS', 'OR', 'ORDER', 'ORDERING', 'ORDINALITY', 'OTHERS', 'OUT', 'OUTER', 'OUTFILE',
-           'OUTPUT', 'OVER', 'OVERLAPS', 'OVERLAY', 'OVERRIDING', 'OWNER', 'PACK_KEYS', 'PAD', 'PARAMETER',
-           'PARAMETER_MODE', 'PARAMETER_NAME', 'PARAMETER_ORDINAL_POSITION', 'PARAMETER_SPECIFIC_CATALOG',
-           'PARAMETER_SPECIFIC_NAME', 'PARAMETER_SPECIFIC_SCHEMA', 'PARAMETERS', 'PARTIAL', 'PARTITION', 'PASCAL',
-           'PASSWORD', 'PATH', 'PCTFREE', 'PERCENT', 'PERCENT_RANK', 'PERCENTILE_CONT', 'PERCENTILE_DISC', 'PLACING',
-           'PLAN', 'PLI', 'POSITION', 'POSTFIX', 'POWER', 'PRECEDING', 'PRECISION', 'PREFIX', 'PREORDER', 'PREPARE',
-           'PREPARED', 'PRESERVE', 'PRIMARY', 'PRINT', 'PRIOR', 'PRIVILEGES', 'PROC', 'PROCEDURAL', 'PROCEDURE',
-           'PROCESS', 'PROCESSLIST', 'PUBLIC', 'PURGE', 'QUOTE', 'RAID0', 'RAISERROR', 'RANGE', 'RANK', 'RAW', 'READ',
-           'READS', 'READTEXT', 'REAL', 'RECHECK', 'RECONFIGURE', 'RECURSIVE', 'REF', 'REFERENCES', 'REFERENCING',
-           'REGEXP', 'REGR_AVGX', 'REGR_AVGY', 'REGR_COUNT', 'REGR_INTERCEPT', 'REGR_R2', 'REGR_SLOPE', 'REGR_SXX',
-           'REGR_SXY', 'REGR_SYY', 'REINDEX', 'RELATIVE', 'RELEASE', 'RELOAD', 'RENAME', 'REPEAT', 'REPEATABLE',
-           'REPLACE', 'REPLICATION', 'REQUIRE', 'RESET', 'RESIGNAL', 'RESOURCE', 'RESTART', 'RESTORE', 'RESTRICT',
-           'RESULT', 'RETURN', 'RETURNED_CARDINALITY', 'RETURNED_LENGTH', 'RETURNED_OCTET_LENGTH',
-           'RETURNED_SQLSTATE', 'RETURNS', 'REVOKE', 'RIGHT', 'RLIKE', 'ROLE', 'ROLLBACK', 'ROLLUP', 'ROUTINE',
-           'ROUTINE_CATALOG', 'ROUTINE_NAME', 'ROUTINE_SCHEMA', 'ROW', 'ROW_COUNT', 'ROW_NUMBER', 'ROWCOUNT',
-           'ROWGUIDCOL', 'ROWID', 'ROWNUM', 'ROWS', 'RULE', 'SAVE', 'SAVEPOINT', 'SCALE', 'SCHEMA', 'SCHEMA_NAME',
-           'SCHEMAS', 'SCOPE', 'SCOPE_CATALOG', 'SCOPE_NAME', 'SCOPE_SCHEMA', 'SCROLL', 'SEARCH', 'SECOND',
-           'SECOND_MICROSECOND', 'SECTION', 'SECURITY', 'SELECT', 'SELF', 'SENSITIVE', 'SEPARATOR', 'SEQUENCE',
-           'SERIALIZABLE', 'SERVER_NAME', 'SESSION', 'SESSION_USER', 'SET', 'SETOF', 'SETS', 'SETUSER', 'SHARE',
-           'SHOW', 'SHUTDOWN', 'SIGNAL', 'SIMILAR', 'SIMPLE', 'SIZE', 'SMALLINT', 'SOME', 'SONAME', 'SOURCE',
-           'SPACE', 'SPATIAL', 'SPECIFIC', 'SPECIFIC_NAME', 'SPECIFICTYPE', 'SQL', 'SQL_BIG_RESULT',
-           'SQL_BIG_SELECTS', 'SQL_BIG_TABLES', 'SQL_CALC_FOUND_ROWS', 'SQL_LOG_OFF', 'SQL_LOG_UPDATE',
-           'SQL_LOW_PRIORITY_UPDATES', 'SQL_SELECT_LIMIT', 'SQL_SMALL_RESULT', 'SQL_WARNINGS', 'SQLCA', 'SQLCODE',
-           'SQLERROR', 'SQLEXCEPTION', 'SQLSTATE', 'SQLWARNING', 'SQRT', 'SSL', 'STABLE', 'START', 'STARTING',
-           'STATE', 'STATEMENT', 'STATIC', 'STATISTICS', 'STATUS', 'STDDEV_POP', 'STDDEV_SAMP', 'STDIN', 'STDOUT',
-           'STORAGE', 'STRAIGHT_JOIN', 'STRICT', 'STRING', 'STRUCTURE', 'STYLE', 'SUBCLASS_ORIGIN', 'SUBLIST',
-           'SUBMULTISET', 'SUBSTRING', 'SUCCESSFUL', 'SUM', 'SUPERUSER', 'SYMMETRIC', 'SYNONYM', 'SYSDATE', 'SYSID',
-           'SYSTEM', 'SYSTEM_USER', 'TABLE', 'TABLE_NAME', 'TABLES', 'TABLESAMPLE', 'TABLESPACE', 'TEMP', 'TEMPLATE',
-           'TEMPORARY', 'TERMINATE', 'TERMINATED', 'TEXT', 'TEXTSIZE', 'THAN', 'THEN', 'TIES', 'TIME', 'TIMESTAMP',
-           'TIMEZONE_HOUR', 'TIMEZONE_MINUTE', 'TINYBLOB', 'TINYINT', 'TINYTEXT', 'TO', 'TOAST', 'TOP',
-           'TOP_LEVEL_COUNT', 'TRAILING', 'TRAN', 'TRANSACTION', 'TRANSACTION_ACTIVE', 'TRANSACTIONS_COMMITTED',
-           'TRANSACTIONS_ROLLED_BACK', 'TRANSFORM', 'TRANSFORMS', 'TRANSLATE', 'TRANSLATION', 'TREAT', 'TRIGGER',
-           'TRIGGER_CATALOG', 'TRIGGER_NAME', 'TRIGGER_SCHEMA', 'TRIM', 'TRUE', 'TRUNCATE', 'TRUSTED', 'TSEQUAL',
-           'TYPE', 'UESCAPE', 'UID', 'UNBOUNDED', 'UNCOMMITTED', 'UNDER', 'UNDO', 'UNENCRYPTED', 'UNION', 'UNIQUE',
-           'UNKNOWN', 'UNLISTEN', 'UNLOCK', 'UNNAMED', 'UNNEST', 'UNSIGNED', 'UNTIL', 'UPDATE', 'UPDATETEXT', 'UPPER',
-           'USAGE', 'USE', 'USER', 'USER_DEFINED_TYPE_CATALOG', 'USER_DEFINED_TYPE_CODE', 'USER_DEFINED_TYPE_NAME',
-           'USER_DEFINED_TYPE_SCHEMA', 'USING', 'UTC_DATE', 'UTC_TIME', 'UTC_TIMESTAMP', 'VACUUM', 'VALID', 'VALIDATE',
-           'VALIDATOR', 'VALUE', 'VALUES', 'VAR_POP', 'VAR_SAMP', 'VARBINARY', 'VARCHAR', 'VARCHAR2', 'VARCHARACTER',
-           'VARIABLE', 'VARIABLES', 'VARYING', 'VERBOSE', 'VIEW', 'VOLATILE', 'WAITFOR', 'WHEN', 'WHENEVER', 'WHERE',
-           'WHILE', 'WIDTH_BUCKET', 'WINDOW', 'WITH', 'WITHIN', 'WITHOUT', 'WORK', 'WRITE', 'WRITETEXT', 'X509', 'XOR',
-           'YEAR', 'YEAR_MONTH', 'ZEROFILL', 'ZONE']
-altibase_rsv = ['_PROWID', 'ACCESS(O)', 'ADD', 'AFTER(O)', 'AGER(O)', 'ALL', 'ALTER', 'AND', 'ANY', 'APPLY',
-                'ARCHIVE(O)', 'ARCHIVELOG(O)', 'AS', 'ASC', 'AT(O)', 'AUDIT(O)', 'AUTOEXTEND(O)', 'BACKUP(O)',
-                'BEFORE(O)', 'BEGIN(O)', 'BETWEEN', 'BODY(O)', 'BULK', 'BY', 'CASCADE(O)', 'CASE', 'CAST(O)',
-                'CHECKPOINT(O)', 'CLOSE(O)', 'COALESCE(O)', 'COLUMN', 'COMMENT(O)', 'COMMIT(O)', 'COMPILE(O)',
-                'COMPRESS', 'COMPRESSED(O)', 'CONJOIN(O)', 'CONNECT', 'CONSTANT', 'CONSTRAINTS(O)', 'CONTINUE(O)',
-                'CREATE', 'CROSS', 'CUBE(O)', 'CURSOR(O)', 'CYCLE(O)', 'DATABASE(O)', 'DECLARE(O)', 'DECRYPT(O)',
-                'DEFAULT', 'DELAUDIT(O)', 'DELETE', 'DEQUEUE(O)', 'DESC', 'DETERMINISTIC(O)', 'DIRECTORY(O)',
-                'DISABLE(O)', 'DISASTER(O)', 'DISCONNECT(O)', 'DISJOIN(O)', 'DISTINCT', 'DROP', 'EACH(O)', 'ELSE',
-                'ELSEIF(O)', 'ELSIF(O)', 'ENABLE(O)', 'END(O)', 'ENQUEUE(O)', 'ESCAPE(O)', 'EXCEPTION', 'EXEC(O)',
-                'EXECUTE(O)', 'EXISTS', 'EXIT(O)', 'EXTENT(O)', 'EXTENTSIZE(O)', 'FETCH(O)', 'FIFO(O)', 'FIXED(O)',
-                'FLASHBACK(O)', 'FLUSH(O)', 'FLUSHER(O)', 'FOLLOWING(O)', 'FOR', 'FOREIGN', 'FROM', 'FULL(O)',
-                'FUNCTION(O)', 'GOTO(O)', 'GRANT', 'GROUP', 'HAVING', 'IF(O)', 'IN', 'INDEX', 'INITRANS(O)', 'INNER(O)',
-                'INSERT', 'INSTEAD', 'INTERSECT', 'INTO', 'IS', 'ISOLATION(O)', 'JOIN(O)', 'KEY(O)', 'LANGUAGE(O)',
-                'LATERAL', 'LEFT(O)', 'LESS(O)', 'LEVEL', 'LIBRARY(O)', 'LIFO(O)', 'LIKE', 'LIMIT(O)', 'LINK', 'LINKER',
-                'LOB', 'LOCAL', 'LOCK', 'LOGANCHOR', 'LOGGING', 'LOOP', 'MAXROWS', 'MAXTRANS', 'MERGE', 'MINUS', 'MODE',
-                'MODIFY', 'MOVE', 'MOVEMENT', 'NEW', 'NOAUDIT', 'NOCOPY', 'NOCYCLE', 'NOLOGGING', 'NOT', 'NULL',
-                'NULLS', 'OF', 'OFF', 'OFFLINE', 'OLD', 'ON', 'ONLINE', 'OPEN', 'OR', 'ORDER', 'OTHERS', 'OUT', 'OUTER',
-                'OVER', 'PACKAGE', 'PARALLEL', 'PARTITION', 'PIVOT', 'PRECEDING', 'PRIMARY', 'PRIOR', 'PROCEDURE',
-                'PURGE', 'QUEUE', 'RAISE', 'READ', 'REBUILD', 'RECOVER', 'REMOVE', 'RENAME', 'REPLACE', 'RETURN',
-                'RETURNING', 'REVOKE', 'RIGHT', 'ROLLBACK', 'ROLLUP', 'ROW', 'ROWCOUNT', 'ROWNUM', 'ROWTYPE',
-                'SAVEPOINT', 'SEGMENT', 'SELECT', 'SEQUENCE', 'SESSION', 'SET', 'SHARD', 'SOME', 'SPLIT', 'SQLCODE',
-                'SQLERRM', 'START', 'STEP', 'STORAGE', 'STORE', 'SYNONYM', 'TABLE', 'THAN', 'THEN', 'TO', 'TOP',
-                'TRIGGER', 'TRUNCATE', 'TYPE', 'TYPESET', 'UNION', 'UNIQUE', 'UNLOCK', 'UNPIVOT', 'UNTIL', 'UPDATE',
-                'USING', 'VALUES', 'VARIABLE', 'VC2COLL', 'VIEW', 'VOLATILE', 'WAIT', 'WHEN', 'WHENEVER', 'WHERE',
-                'WHILE', 'WITH', 'WITHIN', 'WORK', 'WRAPPED', 'WRITE', 'FALSE', 'TRUE']
-dameng_rsv = []
-db2_rsv = ['ADD', 'AFTER', 'ALL', 'ALLOCATE', 'ALLOW', 'ALTERAND', 'ANY', 'AS', 'ARRAY1', 'ARRAY_EXISTS1', 'ASENSITIVE',
-           'ASSOCIATE', 'ASUTIME', 'AT', 'AUDIT', 'AUX', 'AUXILIARY', 'BEFORE', 'BEGIN', 'BETWEEN', 'BUFFERPOOL', 'BY',
-           'CALL', 'CAPTURE', 'CASCADED', 'CASE', 'CAST', 'CCSID', 'CHAR', 'CHARACTER', 'CHECK', 'CLONE', 'CLOSE',
-           'CLUSTER', 'COLLECTION', 'COLLID', 'COLUMN', 'COMMENT', 'COMMIT', 'CONCAT', 'CONDITION', 'CONNECT',
-           'CONNECTION', 'CONSTRAINT', 'CONTAINS', 'CONTENT', 'CONTINUE', 'CREATE', 'CUBE', 'CURRENT', 'CURRENT_DATE',
-           'CURRENT_LC_CTYPE', 'CURRENT_PATH', 'CURRENT_SCHEMA', 'CURRENT_TIME', 'CURRENT_TIMESTAMP', 'CURRVAL',
-           'CURSOR', 'DATA', 'DATABASE', 'DAY', 'DAYS', 'DBINFO', 'DECLARE', 'DEFAULT', 'DELETE', 'DESCRIPTOR',
-           'DETERMINISTIC', 'DISABLE', 'DISALLOW', 'DISTINCT', 'DO', 'DOCUMENT', 'DOUBLE', 'DROP', 'DSSIZE', 'DYNAMIC',
-           'EDITPROC', 'ELSE', 'ELSEIF', 'ENCODING', 'ENCRYPTION', 'END', 'ENDING', 'END-EXEC2', 'ERASE', 'ESCAPE',
-           'EXCEPT', 'EXCEPTION', 'EXECUTE', 'EXISTS', 'EXIT', 'EXPLAIN', 'EXTERNAL', 'FENCED', 'FETCH', 'FIELDPROC',
-           'FINAL', 'FIRST', 'FOR', 'FREE', 'FROM', 'FULL', 'FUNCTION', 'GENERATED', 'GET', 'GLOBAL', 'GO', 'GOTO',
-           'GRANT', 'GROUP', 'HANDLER', 'HAVING', 'HOLD', 'HOUR', 'HOURS', 'IF', 'IMMEDIATE', 'IN', 'INCLUSIVE',
-           'INDEX', 'INHERIT', 'INNER', 'INOUT', 'INSENSITIVE', 'INSERT', 'INTERSECT', 'INTO', 'IS', 'ISOBID',
-           'ITERATE', 'JAR', 'JOIN', 'KEEP', 'KEY', 'LABEL', 'LANGUAGE', 'LAST', 'LC_CTYPE', 'LEAVE', 'LEFT', 'LIKE',
-           'LOCAL', 'LOCALE', 'LOCATOR', 'LOCATORS', 'LOCK', 'LOCKMAX', 'LOCKSIZE', 'LONG', 'LOOP', 'MAINTAINED',
-           'MATERIALIZED', 'MICROSECOND', 'MICROSECONDS', 'MINUTEMINUTES', 'MODIFIES', 'MONTH', 'MONTHS', 'NEXT',
-           'NEXTVAL', 'NO', 'NONE', 'NOT', 'NULL', 'NULLS', 'NUMPARTS', 'OBID', 'OF', 'OLD', 'ON', 'OPEN',
-           'OPTIMIZATION', 'OPTIMIZE', 'OR', 'ORDER', 'ORGANIZATION', 'OUT', 'OUTER', 'PACKAGE', 'PARAMETER', 'PART',
-           'PADDED', 'PARTITION', 'PARTITIONED', 'PARTITIONING', 'PATH', 'PIECESIZE', 'PERIOD', 'PLAN', 'PRECISION',
-           'PREPARE', 'PREVVAL', 'PRIOR', 'PRIQTY', 'PRIVILEGES', 'PROCEDURE', 'PROGRAM', 'PSID', 'PUBLIC', 'QUERY',
-           'QUERYNO', 'READS', 'REFERENCES', 'REFRESH', 'RESIGNAL', 'RELEASE', 'RENAME', 'REPEAT', 'RESTRICT', 'RESULT',
-           'RESULT_SET_LOCATOR', 'RETURN', 'RETURNS', 'REVOKE', 'RIGHT', 'ROLE', 'ROLLBACK', 'ROLLUP1', 'ROUND_CEILING',
-           'ROUND_DOWN', 'ROUND_FLOOR', 'ROUND_HALF_DOWN', 'ROUND_HALF_EVEN', 'ROUND_HALF_UP', 'ROUND_UP', 'ROW',
-           'ROWSET', 'RUN', 'SAVEPOINT', 'SCHEMA', 'SCRATCHPAD', 'SECOND', 'SECONDS', 'SECQTY', 'SECURITY', 'SEQUENCE',
-           'SELECT', 'SENSITIVE', 'SESSION_USER', 'SET', 'SIGNAL', 'SIMPLE', 'SOME', 'SOURCE', 'SPECIFIC', 'STANDARD',
-           'STATIC', 'STATEMENT', 'STAY', 'STOGROUP', 'STORES', 'STYLE', 'SUMMARY', 'SYNONYM', 'SYSDATE', 'SYSTEM',
-           'SYSTIMESTAMP', 'TABLE', 'TABLESPACE', 'THEN', 'TO', 'TRIGGER', 'TRUNCATE', 'TYPE', 'UNDO', 'UNION',
-           'UNIQUE', 'UNTIL', 'UPDATE', 'USER', 'USING', 'VALIDPROC', 'VALUE', 'VALUES', 'VARIABLE', 'VARIANT', 'VCAT',
-           'VERSIONING1', 'VIEW', 'VOLATILE', 'VOLUMES', 'WHEN', 'WHENEVER', 'WHERE', 'WHILE', 'WITH', 'WLM',
-           'XMLEXISTS', 'XMLNAMESPACES', 'XMLCAST', 'YEAR', 'YEARS', 'ZONE']
-oracle_rsv = ['ACCESS', 'ACCOUNT', 'ACTIVATE', 'ADD', 'ADMIN', 'ADVISE', 'AFTER', 'ALL', 'ALL_ROWS', 'ALLOCATE',
-              'ALTER', 'ANALYZE', 'AND', 'ANY', 'ARCHIVE', 'ARCHIVELOG', 'ARRAY', 'AS', 'ASC', 'AT', 'AUDIT',
-              'AUTHENTICATED', 'AUTHORIZATION', 'AUTOEXTEND', 'AUTOMATIC', 'BACKUP', 'BECOME', 'BEFORE', 'BEGIN',
-              'BETWEEN', 'BFILE', 'BITMAP', 'BLOB', 'BLOCK', 'BODY', 'BY', 'CACHE', 'CACHE_INSTANCES', 'CANCEL',
-              'CASCADE', 'CAST', 'CFILE', 'CHAINED', 'CHANGE', 'CHAR', 'CHAR_CS', 'CHARACTER', 'CHECK', 'CHECKPOINT',
-              'CHOOSE', 'CHUNK', 'CLEAR', 'CLOB', 'CLONE', 'CLOSE', 'CLOSE_CACHED_OPEN_CURSORS', 'CLUSTER', 'COALESCE',
-              'COLUMN', 'COLUMNS', 'COMMENT', 'COMMIT', 'COMMITTED', 'COMPATIBILITY', 'COMPILE', 'COMPLETE',
-              'COMPOSITE_LIMIT', 'COMPRESS', 'COMPUTE', 'CONNECT', 'CONNECT_TIME', 'CONSTRAINT', 'CONSTRAINTS',
-              'CONTENTS', 'CONTINUE', 'CONTROLFILE', 'CONVERT', 'COST', 'CPU_PER_CALL', 'CPU_PER_SESSION',
-              'CREATE', 'CURRENT', 'CURRENT_SCHEMA', 'CURREN_USER', 'CURSOR', 'CYCLE', ' ', 'ANGLING', 'DATABASE',
-              'DATAFILE', 'DATAFILES', 'DATAOBJNO', 'DATE', 'DBA', 'DBHIGH', 'DBLOW', 'DBMAC', 'DEALLOCATE', 'DEBUG',
-              'DEC', 'DECIMAL', 'DECLARE', 'DEFAULT', 'DEFERRABLE', 'DEFERRED', 'DEGREE', 'DELETE', 'DEREF', 'DESC',
-              'DIRECTORY', 'DISABLE', 'DISCONNECT', 'DISMOUNT', 'DISTINCT', 'DISTRIBUTED', 'DML', 'DOUBLE', 'DROP',
-              'DUMP', 'EACH', 'ELSE', 'ENABLE', 'END', 'ENFORCE', 'ENTRY', 'ESCAPE', 'EXCEPT', 'EXCEPTIONS', 'EXCHANGE',
-              'EXCLUDING', 'EXCLUSIVE', 'EXECUTE', 'EXISTS', 'EXPIRE', 'EXPLAIN', 'EXTENT', 'EXTENTS', 'EXTERNALLY',
-              'FAILED_LOGIN_ATTEMPTS', 'FALSE', 'FAST', 'FILE', 'FIRST_ROWS', 'FLAGGER', 'FLOAT', 'FLOB', 'FLUSH',
-              'FOR', 'FORCE', 'FOREIGN', 'FREELIST', 'FREELISTS', 'FROM', 'FULL', 'FUNCTION', 'GLOBAL', 'GLOBALLY',
-              'GLOBAL_NAME', 'GRANT', 'GROUP', 'GROUPS', 'HASH', 'HASHKEYS', 'HAVING', 'HEADER', 'HEAP', 'IDENTIFIED',
-              'IDGENERATORS', 'IDLE_TIME', 'IF', 'IMMEDIATE', 'IN', 'INCLUDING', 'INCREMENT', 'INDEX', 'INDEXED',
-              'INDEXES', 'INDICATOR', 'IND_PARTITION', 'INITIAL', 'INITIALLY', 'INITRANS', 'INSERT', 'INSTANCE',
-              'INSTANCES', 'INSTEAD', 'INT', 'INTEGER', 'INTERMEDIATE', 'INTERSECT', 'INTO', 'IS', 'ISOLATION',
-              'ISOLATION_LEVEL', 'KEEP', 'KEY', 'KILL', 'LABEL', 'LAYER', 'LESS', 'LEVEL', 'LIBRARY', 'LIKE', 'LIMIT',
-              'LINK', 'LIST', 'LOB', 'LOCAL', 'LOCK', 'LOCKED', 'LOG', 'LOGFILE', 'LOGGING', 'LOGICAL_READS_PER_CALL',
-              'LOGICAL_READS_PER_SESSION', 'LONG', 'MANAGE', 'MASTER', 'MAX', 'MAXARCHLOGS', 'MAXDATAFILES',
-              'MAXEXTENTS', 'MAXINSTANCES', 'MAXLOGFILES', 'MAXLOGHISTORY', 'MAXLOGMEMBERS', 'MAXSIZE', 'MAXTRANS',
-              'MAXVALUE', 'MIN', 'MEMBER', 'MINIMUM', 'MINEXTENTS', 'MINUS', 'MINVALUE', 'MLSLABEL', 'MLS_LABEL_FORMAT',
-              'MODE', 'MODIFY', 'MOUNT', 'MOVE', 'MTS_DISPATCHERS', 'MULTISET', 'NATIONAL', 'NCHAR', 'NCHAR_CS',
-              'NCLOB', 'NEEDED', 'NESTED', 'NETWORK', 'NEW', 'NEXT', 'NOARCHIVELOG', 'NOAUDIT', 'NOCACHE', 'NOCOMPRESS',
-              'NOCYCLE', 'NOFORCE', 'NOLOGGING', 'NOMAXVALUE', 'NOMINVALUE', 'NONE', 'NOORDER', 'NOOVERRIDE',
-              'NOPARALLEL', 'NOPARALLEL', 'NOREVERSE', 'NORMAL', 'NOSORT', 'NOT', 'NOTHING', 'NOWAIT', 'NULL', 'NUMBER',
-              'NUMERIC', 'NVARCHAR2', 'OBJECT', 'OBJNO', 'OBJNO_REUSE', 'OF', 'OFF', 'OFFLINE', 'OID', 'OIDINDEX',
-              'OLD', 'ON', 'ONLINE', 'ONLY', 'OPCODE', 'OPEN', 'OPTIMAL', 'OPTIMIZER_GOAL', 'OPTION', 'OR', 'ORDER',
-              'ORGANIZATION', 'OSLABEL', 'OVERFLOW', 'OWN', 'PACKAGE', 'PARALLEL', 'PARTITION', 'PASSWORD',
-              'PASSWORD_GRACE_TIME', 'PASSWORD_LIFE_TIME', 'PASSWORD_LOCK_TIME', 'PASSWORD_REUSE_MAX',
-              'PASSWORD_REUSE_TIME', 'PASSWORD_VERIFY_FUNCTION', 'PCTFREE', 'PCTINCREASE', 'PCTTHRESHOLD', 'PCTUSED',
-              'PCTVERSION', 'PERCENT', 'PERMANENT', 'PLAN', 'PLSQL_DEBUG', 'POST_TRANSACTION', 'PRECISION', 'PRESERVE',
-              'PRIMARY', 'PRIOR', 'PRIVATE', 'PRIVATE_SGA', 'PRIVILEGE', 'PRIVILEGES', 'PROCEDURE', 'PROFILE', 'PUBLIC',
-              'PURGE', 'QUEUE', 'QUOTA', 'RANGE', 'RAW', 'RBA', 'READ', 'READUP', 'REAL', 'REBUILD', 'RECOVER',
-              'RECOVERABLE', 'RECOVERY', 'REF', 'REFERENCES', 'REFERENCING', 'REFRESH', 'RENAME', 'REPLACE', 'RESET',
-              'RESETLOGS', 'RESIZE', 'RESOURCE', 'RESTRICTED', 'RETURN', 'RETURNING', 'REUSE', 'REVERSE', 'REVOKE',
-              'ROLE', 'ROLES', 'ROLLBACK', 'ROW', 'ROWID', 'ROWNUM', 'ROWS', 'RULE', 'SAMPLE', 'SAVEPOINT', 'SB4',
-              'SCAN_INSTANCES', 'SCHEMA', 'SCN', 'SCOPE', 'SD_ALL', 'SD_INHIBIT', 'SD_SHOW', 'SEGMENT', 'SEG_BLOCK',
-              'SEG_FILE', 'SELECT', 'SEQUENCE', 'SERIALIZABLE', 'SESSION', 'SESSION_CACHED_CURSORS',
-              'SESSIONS_PER_USER', 'SET', 'SHARE', 'SHARED', 'SHARED_POOL', 'SHRINK', 'SIZE', 'SKIP',
-              'SKIP_UNUSABLE_INDEXES', 'SMALLINT', 'SNAPSHOT', 'SOME', 'SORT', 'SPECIFICATION', 'SPLIT', 'SQL_TRACE',
-              'STANDBY', 'START', 'STATEMENT_ID', 'STATISTICS', 'STOP', 'STORAGE', 'STORE', 'STRUCTURE', 'SUCCESSFUL',
-              'SWITCH', 'SYS_OP_ENFORCE_NOT_NULL$', 'SYS_OP_NTCIMG$', 'SYNONYM', 'SYSDATE', 'SYSDBA', 'SYSOPER',
-              'SYSTEM', 'TABLE', 'TABLES', 'TABLESPACE', 'TABLESPACE_NO', 'TABNO', 'TEMPORARY', 'THAN', 'THE', 'THEN',
-              'THREAD', 'TIMESTAMP', 'TIME', 'TO', 'TOPLEVEL', 'TRACE', 'TRACING', 'TRANSACTION', 'TRANSITIONAL',
-              'TRIGGER', 'TRIGGERS', 'TRUE', 'TRUNCATE', 'TX', 'TYPE', 'UB2', 'UBA', 'UID', 'UNARCHIVED', 'UNDO',
-              'UNION', 'UNIQUE', 'UNLIMITED', 'UNLOCK', 'UNRECOVERABLE', 'UNTIL', 'UNUSABLE', 'UNUSED', 'UPDATABLE',
-              'UPDATE', 'USAGE', 'USE', 'USER', 'USING', 'VALIDATE', 'VALIDATION', 'VALUE', 'VALUES', 'VARCHAR',
-              'VARCHAR2', 'VARYING', 'VIEW', 'WHEN', 'WHENEVER', 'WHERE', 'WITH', 'WITHOUT', 'WORK', 'WRITE',
-              'WRITEDOWN', 'WRITEUP', 'XID', 'YEAR', 'ZONE']
-postgressql_rsv = ['ALL', 'ANALYSE', 'ANALYZE', 'AND', 'ANY', 'ARRAY', 'AS', 'ASC', 'ASYMMETRIC', 'AUTHORIZATION',
-                   'BETWEEN', 'BINARY', 'BOTH', 'CASE', 'CAST', 'CHECK', 'COLLATE', 'COLUMN', 'CONSTRAINT', 'CREATE',
-                   'CROSS', 'CURRENT_DATE', 'CURRENT_ROLE', 'CURRENT_TIME', 'CURRENT_TIMESTAMP', 'CURRENT_USER',
-                   'DEFAULT', 'DEFERRABLE', 'DESC', 'DISTINCT', 'DO', 'ELSE', 'END', 'EXCEPT', 'FOR', 'FOREIGN',
-                   'FREEZE', 'FROM', 'FULL', 'GRANT', 'GROUP', 'HAVING', 'ILIKE', 'IN', 'INITIALLY', 'INNER',
-                   'INTERSECT', 'INTO', 'IS', 'ISNULL', 'JOIN', 'LEADING', 'LEFT', 'LIKE', 'LIMIT', 'LOCALTIME',
-                   'LOCALTIMESTAMP', 'NATURAL', 'NEW', 'NOT', 'NOTNULL', 'NULL', 'OFF', 'OFFSET', 'OLD', 'ON', 'ONLY',
-                   'OR', 'ORDER', 'OUTER', 'OVERLAPS', 'PLACING', 'PRIMARY', 'REFERENCES', 'RIGHT', 'SELECT',
-                   'SESSION_USER', 'SIMILAR', 'SOME', 'SYMMETRIC', 'TABLE', 'THEN', 'TO', 'TRAILING', 'UNION',
-                   'UNIQUE', 'USER', 'USING', 'VERBOSE', 'WHEN', 'WHERE', 'FALSE', 'TRUE']
-sap_hana_rsv = ['ABS', 'ABSOLUTE', 'ACTION', 'ADA', 'ADD', 'ADMIN', 'AFTER', 'ALL', 'ALLOCATE', 'ALTER', 'ALWAYS',
-                'AND', 'ANY', 'ARE', 'ARRAY', 'ARRAY_AGG', 'ARRAY_MAX_CARDINALITY', 'AS', 'ASC', 'ASENSITIVE',
-                'ASSERTION', 'ASSIGNMENT', 'ASYMMETRIC', 'AT', 'ATOMIC', 'ATTRIBUTE', 'ATTRIBUTES', 'AUTHORIZATION',
-                'AVG', 'BEFORE', 'BEGIN', 'BEGIN_FRAME', 'BEGIN_PARTITION', 'BERNOULLI', 'BETWEEN', 'BIGINT', 'BINARY',
-                'BLOB', 'BOOL', 'BOOLEAN', 'BOTH', 'BREADTH', 'BREAK', 'BY', 'CALL', 'CALLED', 'CARDINALITY', 'CASCADE',
-                'CASCADED', 'CASE', 'CAST', 'CATALOG_NAME', 'CEIL', 'CEILING', 'CHAIN', 'CHAR', 'CHAR_LENGTH',
-                'CHARACTER', 'CHARACTER_LENGTH', 'CHARACTER_SET_CATALOG', 'CHARACTER_SET_NAME', 'CHARACTER_SET_SCHEMA',
-                'CHARACTERISTICS', 'CHARACTERS', 'CHECK', 'CLASS_ORIGIN', 'CLOB', 'CLOSE', 'COALESCE', 'COBOL',
-                'COLLATE', 'COLLATION', 'COLLATION_CATALOG', 'COLLATION_NAME', 'COLLATION_SCHEMA', 'COLLECT', 'COLUMN',
-                'COLUMN_NAME', 'COMMAND_FUNCTION', 'COMMAND_FUNCTION_CODE', 'COMMIT', 'COMMITTED', 'CONDITION',
-                'CONDITION_NUMBER', 'CONNECT', 'CONNECTION', 'CONNECTION_NAME', 'CONST', 'CONSTRAINT',
-                'CONSTRAINT_CATALOG', 'CONSTRAINT_NAME', 'CONSTRAINT_SCHEMA', 'CONSTRAINTS', 'CONSTRUCTOR', 'CONTAINS',
-                'CONTINUE', 'CONTINUE', 'CONVERT', 'CORR', 'CORRESPONDING', 'COUNT', 'COVAR_POP', 'COVAR_SAMP',
-                'CREATE', 'CROSS', 'CUBE', 'CUME_DIST', 'CURRENT', 'CURRENT_CATALOG', 'CURRENT_DATE',
-                'CURRENT_DEFAULT_TRANSFORM_GROUP', 'CURRENT_PATHCURRENT_ROLE', 'CURRENT_TRANSFORM_GROUP_FOR_TYPE',
-                'CURRENT_USER', 'CURSOR', 'CURSOR_NAME', 'CYCLE', 'DATA', 'DATE', 'DATETIME_INTERVAL_CODE',
-                'DATETIME_INTERVAL_PRECISION', 'DAY', 'DEALLOCATE', 'DEC', 'DECIMAL', 'DECLARE', 'DEFAULT', 'DEFAULTS',
-                'DEFERRABLE', 'DEFERRED', 'DEFINED', 'DEFINER', 'DEGREE', 'DELETE', 'DENSE_RANK', 'DEPTH', 'DEREF',
-                'DERIVED', 'DESC', 'DESCRIBE', 'DESCRIPTOR', 'DETERMINISTIC', 'DIAGNOSTICS', 'DISCONNECT', 'DISPATCH',
-                'DISTINCT', 'DO', 'DOMAIN', 'DOUBLE', 'DROP', 'DYNAMIC', 'DYNAMIC_FUNCTION', 'DYNAMIC_FUNCTION_CODE',
-                'EACH', 'EDGE', 'ELEMENT', 'ELSE', 'END', 'END_FRAME', 'END_PARTITION', 'END-EXEC', 'ENFORCED', 'ENUM',
-                'EQUALS', 'ESCAPE', 'EVERY', 'EXCEPT', 'EXCLUDE', 'EXCLUDING', 'EXEC', 'EXECUTE', 'EXISTS', 'EXP',
-                'EXPRESSION', 'EXTERNAL', 'EXTRACT', 'FETCH', 'FILTER', 'FINAL', 'FIRST', 'FIRST_VALUE', 'FLAG',
-                'FLOAT', 'FLOOR', 'FOLLOWING', 'FOR', 'FOREACH', 'FOREIGN', 'FORTRAN', 'FOUND', 'FRAME_ROW', 'FREE',
-                'FROM', 'FULL', 'FUNCTION', 'FUSION', 'GENERAL', 'GENERATED', 'GET', 'GLOBAL', 'GO', 'GOTO', 'GRANT',
-                'GRANTED', 'GRAPH', 'GROUP', 'GROUPING', 'GROUPS', 'HAVING', 'HIERARCHY', 'HOLD', 'HOOK', 'HOUR',
-                'IDENTITY', 'IF', 'IGNORE', 'IMMEDIATE', 'IMMEDIATELY', 'IMPLEMENTATION', 'IMPORT', 'IN', 'INCLUDE',
-                'INCLUDING', 'INCREMENT', 'INDICATOR', 'INITIALLY', 'INNER', 'INOUT', 'INPUT', 'INSENSITIVE', 'INSERT',
-                'INSTANCE', 'INSTANTIABLE', 'INSTEAD', 'INT', 'INTEGER', 'INTERSECT', 'INTERSECTION', 'INTERVAL',
-                'INTO', 'INVOKER', 'IS', 'ISOLATION', 'JOIN', 'KEY', 'KEY_MEMBER', 'KEY_TYPE', 'LAG', 'LANGUAGE',
-                'LARGE', 'LAST', 'LAST_VALUE', 'LATERAL', 'LEAD', 'LEADING', 'LEFT', 'LENGTH', 'LEVEL', 'LIKE',
-                'LIKE_REGEX', 'LIST', 'LN', 'LOCAL', 'LOCALTIME', 'LOCALTIMESTAMP', 'LOCATOR', 'LOWER', 'MAP', 'MATCH',
-                'MATCHED', 'MAX', 'MAXVALUE', 'MEMBER', 'MERGE', 'MESSAGE_LENGTH', 'MESSAGE_OCTET_LENGTH',
-                'MESSAGE_TEXT', 'METHOD', 'MIN', 'MINUTE', 'MINVALUE', 'MOD', 'MODIFIES', 'MODULE', 'MONTH', 'MORE',
-                'MULTISET', 'MUMPS', 'NAME', 'NAMES', 'NAMESPACE', 'NATIONAL', 'NATURAL', 'NCHAR', 'NCLOB', 'NESTING',
-                'NEW', 'NEXT', 'NFC', 'NFD', 'NFKC', 'NFKD', 'NO', 'NONE', 'NORMALIZE', 'NORMALIZED', 'NOT',
-                'NTH_VALUE', 'NTILE', 'NULL', 'NULLABLE', 'NULLIF', 'NULLS', 'NUMBER', 'NUMERIC', 'NVARCHAR', 'OBJECT',
-                'OCCURRENCES_REGEX', 'OCTET_LENGTH', 'OCTETS', 'OF', 'OFFSET', 'OLD', 'ON', 'ONLY', 'OPEN', 'OPTION',
-                'OPTIONS', 'OR', 'ORDER', 'ORDERING', 'ORDINALITY', 'OTHERS', 'OUT', 'OUTER', 'OUTPUT', 'OVER',
-                'OVERLAPS', 'OVERLAY', 'OVERRIDING', 'PAD', 'PARAMETER', 'PARAMETER_MODE', 'PARAMETER_NAME',
-                'PARAMETER_ORDINAL_POSITION', 'PARAMETER_SPECIFIC_CATALOG', 'PARAMETER_SPECIFIC_NAME',
-                'PARAMETER_SPECIFIC_SCHEMA', 'PARTIAL', 'PARTITION', 'PASCAL', 'PATH', 'PERCENT', 'PERCENT_RANK',
-                'PERCENTILE_CONT', 'PERCENTILE_DISC', 'PERIOD', 'PERSISTENT', 'PLACING', 'PLI', 'PORTION', 'POSITION',
-                'POSITION_REGEX', 'POWER', 'PRECEDES', 'PRECEDING', 'PRECISION', 'PREPARE', 'PRESERVE', 'PRIMARY',
-                'PRIOR', 'PRIVILEGES', 'PROCEDURE', 'PUBLIC', 'RANGE', 'RANK', 'READ', 'READS', 'REAL', 'RECURSIVE',
-                'REF', 'REFERENCES', 'REFERENCING', 'REGR_AVGX', 'REGR_AVGY', 'REGR_COUNT', 'REGR_INTERCEPT', 'REGR_R2',
-                'REGR_SLOPE', 'REGR_SXX', 'REGR_SXY', 'REGR_SYY', 'RELATIVE', 'RELEASE', 'REPEATABLE', 'RESPECT',
-                'RESTART', 'RESTRICT', 'RESULT', 'RETURN', 'RETURNED_CARDINALITY', 'RETURNED_LENGTH',
-                'RETURNED_OCTET_LENGTH', 'RETURNED_SQLSTATE', 'RETURNS', 'REVOKE', 'RIGHT', 'ROLE', 'ROLLBACK',
-                'ROLLUP', 'ROUTINE', 'ROUTINE_CATALOG', 'ROUTINE_NAME', 'ROUTINE_SCHEMA', 'ROW', 'ROW_COUNT',
-                'ROW_NUMBER', 'ROWS', 'SAVEPOINT', 'SCALE', 'SCHEMA', 'SCHEMA_NAME', 'SCOPE', 'SCOPE_CATALOG',
-                'SCOPE_NAME', 'SCOPE_SCHEMA', 'SCROLL', 'SEARCH', 'SECOND', 'SECTION', 'SECURITY', 'SELECT', 'SELF',
-                'SENSITIVE', 'SEQUENCE', 'SERIALIZABLE', 'SERVER_NAME', 'SESSION', 'SESSION_USER', 'SET', 'SETS',
-                'SIMILAR', 'SIMPLE', 'SIZE', 'SMALLINT', 'SOME', 'SOURCE', 'SPACE', 'SPECIFIC', 'SPECIFIC_NAME',
-                'SPECIFICTYPE', 'SQL', 'SQLEXCEPTION', 'SQLSTATE', 'SQLWARNING', 'SQRT', 'ST_CIRCULARSTRING',
-                'ST_COMPOUNDCURVE', 'ST_CURVE', 'ST_CURVEPOLYGON', 'ST_GEOMCOLLECTION', 'ST_GEOMETRY', 'ST_LINESTRING',
-                'ST_MULTICURVE', 'ST_MULTILINESTRING', 'ST_MULTIPOINT', 'ST_MULTIPOLYGON', 'ST_MULTISURFACE',
-                'ST_POINT', 'ST_POLYGON', 'ST_SURFACE', 'START', 'STATE', 'STATEMENT', 'STATIC', 'STDDEV_POP',
-                'STDDEV_SAMP', 'STRUCTURE', 'STYLE', 'SUBCLASS_ORIGIN', 'SUBMULTISET', 'SUBSTRING', 'SUBSTRING_REGEX',
-                'SUCCEEDS', 'SUM', 'SWITCH', 'SYMMETRIC', 'SYSTEM', 'SYSTEM_TIME', 'SYSTEM_USER', 'TABLE', 'TABLE_NAME',
-                'TABLESAMPLE', 'TEMPORARY', 'TEXT', 'THEN', 'TIES', 'TIME', 'TIMESTAMP', 'TIMEZONE_HOUR',
-                'TIMEZONE_MINUTE', 'TO', 'TOP_LEVEL_COUNT', 'TRAILING', 'TRANSACTION', 'TRANSACTION_ACTIVE',
-                'TRANSACTIONS_COMMITTED', 'TRANSACTIONS_ROLLED_BACK', 'TRANSFORM', 'TRANSFORMS', 'TRANSLATE',
-                'TRANSLATE_REGEX', 'TRANSLATION', 'TREAT', 'TREE', 'TRIGGER', 'TRIGGER_CATALOG', 'TRIGGER_NAME',
-                'TRIGGER_SCHEMA', 'TRIM', 'TRIM_ARRAY', 'TRUNCATE', 'TYPE', 'UESCAPE', 'UNBOUNDED', 'UNCOMMITTED',
-                'UNDER', 'UNION', 'UNIQUE', 'UNKNOWN', 'UNNAMED', 'UNNEST', 'UPDATE', 'UPPER', 'USAGE', 'USER',
-                'USER_DEFINED_TYPE_CATALOG', 'USER_DEFINED_TYPE_CODE', 'USER_DEFINED_TYPE_NAME',
-                'USER_DEFINED_TYPE_SCHEMA', 'USING', 'VALUE', 'VALUE_OF', 'VALUES', 'VAR_POP', 'VAR_SAMP', 'VARBINARY',
-                'VARCHAR', 'VARYING', 'VERSIONING', 'VERTEX', 'VIEW', 'VOID', 'WHEN', 'WHENEVER', 'WHERE', 'WHILE',
-                'WIDTH_BUCKET', 'WINDOW', 'WITH', 'WITHIN', 'WITHOUT', 'WORK', 'WRITE', 'YEAR', 'ZONE', 'FALSE', 'TRUE']
-teradata_rsv = ['ABORT', 'ABORTSESSION', 'ABS', 'ABSOLUTE', 'ACCESS_LOCK', 'ACCOUNT', 'ACOS', 'ACOSH', 'ACTION', 'ADD',
-                'ADD_MONTHS', 'ADMIN', 'AFTER', 'AGGREGATE', 'ALIAS', 'ALL', 'ALLOCATE', 'ALTER', 'AMP', 'AND',
-                'ANSIDATE', 'ANY', 'ARE', 'ARRAY', 'AS', 'ASC', 'ASIN', 'ASINH', 'ASSERTION', 'AT', 'ATAN', 'ATAN2',
-                'ATANH', 'ATOMIC', 'AUTHORIZATION', 'AVE', 'AVERAGE', 'AVG', 'BEFORE', 'BEGIN', 'BETWEEN', 'BINARY',
-                'BIT', 'BLOB', 'BOOLEAN', 'BOTH', 'BREADTH', 'BT', 'BUT', 'BY', 'BYTE', 'BYTEINT', 'BYTES', 'CALL',
-                'CASCADE', 'CASCADED', 'CASE', 'CASE_N', 'CASESPECIFIC', 'CAST', 'CATALOG', 'CD', 'CHAR', 'CHAR_LENGTH',
-                'CHAR2HEXINT', 'CHARACTER', 'CHARACTER_LENGTH', 'CHARACTERS', 'CHARS', 'CHECK', 'CHECKPOINT', 'CLASS',
-                'CLOB', 'CLOSE', 'CLUSTER', 'CM', 'COALESCE', 'COLLATE', 'COLLATION', 'COLLECT', 'COLUMN', 'COMMENT',
-                'COMMIT', 'COMPLETION', 'COMPRESS', 'CONNECT', 'CONNECTION', 'CONSTRAINT', 'CONSTRAINTS', 'CONSTRUCTOR',
-                'CONTINUE', 'CONVERT_TABLE_HEADER', 'CORR', 'CORRESPONDING', 'COS', 'COSH', 'COUNT', 'COVAR_POP',
-                'COVAR_SAMP', 'CREATE', 'CROSS', 'CS', 'CSUM', 'CT', 'CUBE', 'CURRENT', 'CURRENT_DATE', 'CURRENT_PATH',
-                'CURRENT_ROLE', 'CURRENT_TIME', 'CURRENT_TIMESTAMP', 'CURRENT_USER', 'CURSOR', 'CV', 'CYCLE', 'DATA',
-                'DATABASE', 'DATABLOCKSIZE', 'DATE', 'DATEFORM', 'DAY', 'DEALLOCATE', 'DEC', 'DECIMAL', 'DECLARE',
-                'DEFAULT', 'DEFERRABLE', 'DEFERRED', 'DEGREES', 'DEL', 'DELETE', 'DEPTH', 'DEREF', 'DESC', 'DESCRIBE',
-                'DESCRIPTOR', 'DESTROY', 'DESTRUCTOR', 'DETERMINISTIC', 'DIAGNOSTIC', 'DIAGNOSTICS', 'DICTIONARY',
-                'DISABLED', 'DISCONNECT', 'DISTINCT', 'DO', 'DOMAIN', 'DOUBLE', 'DROP', 'DUAL', 'DUMP', 'DYNAMIC',
-                'EACH', 'ECHO', 'ELSE', 'ELSEIF', 'ENABLED', 'END', 'END-EXEC', 'EQ', 'EQUALS', 'ERROR', 'ERRORFILES',
-                'ERRORTABLES', 'ESCAPE', 'ET', 'EVERY', 'EXCEPT', 'EXCEPTION', 'EXEC', 'EXECUTE', 'EXISTS', 'EXIT',
-                'EXP', 'EXPLAIN', 'EXTERNAL', 'EXTRACT', 'FALLBACK', 'FASTEXPORT', 'FETCH', 'FIRST', 'FLOAT', 'FOR',
-                'FOREIGN', 'FORMAT', 'FOUND', 'FREE', 'FREESPACE', 'FROM', 'FULL', 'FUNCTION', 'GE', 'GENERAL',
-                'GENERATED', 'GET', 'GIVE', 'GLOBAL', 'GO', 'GOTO', 'GRANT', 'GRAPHIC', 'GROUP', 'GROUPING', 'GT',
-                'HANDLER', 'HASH', 'HASHAMP', 'HASHBAKAMP', 'HASHBUCKET', 'HASHROW', 'HAVING', 'HELP', 'HOST', 'HOUR',
-                'IDENTITY', 'IF', 'IGNORE', 'IMMEDIATE', 'IN', 'INCONSISTENT', 'INDEX', 'INDICATOR', 'INITIALIZE',
-                'INITIALLY', 'INITIATE', 'INNER', 'INOUT', 'INPUT', 'INS', 'INSERT', 'INSTEAD', 'INT', 'INTEGER',
-                'INTEGERDATE', 'INTERSECT', 'INTERVAL', 'INTO', 'IS', 'ISOLATION', 'ITERATE', 'JOIN', 'JOURNAL', 'KEY',
-                'KURTOSIS', 'LANGUAGE', 'LARGE', 'LAST', 'LATERAL', 'LE', 'LEADING', 'LEAVE', 'LEFT', 'LESS', 'LEVEL',
-                'LIKE', 'LIMIT', 'LN', 'LOADING', 'LOCAL', 'LOCALTIME', 'LOCALTIMESTAMP', 'LOCATOR', 'LOCK', 'LOCKING',
-                'LOG', 'LOGGING', 'LOGON', 'LONG', 'LOOP', 'LOWER', 'LT', 'MACRO', 'MAP', 'MATCH', 'MAVG', 'MAX',
-                'MAXIMUM', 'MCHARACTERS', 'MDIFF', 'MERGE', 'MIN', 'MINDEX', 'MINIMUM', 'MINUS', 'MINUTE', 'MLINREG',
-                'MLOAD', 'MOD', 'MODE', 'MODIFIES', 'MODIFY', 'MODULE', 'MONITOR', 'MONRESOURCE', 'MONSESSION', 'MONTH',
-                'MSUBSTR', 'MSUM', 'MULTISET', 'NAMED', 'NAMES', 'NATIONAL', 'NATURAL', 'NCHAR', 'NCLOB', 'NE', 'NEW',
-                'NEW_TABLE', 'NEXT', 'NO', 'NONE', 'NOT', 'NOWAIT', 'NULL', 'NULLIF', 'NULLIFZERO', 'NUMERIC', 'OBJECT',
-                'OBJECTS', 'OCTET_LENGTH', 'OF', 'OFF', 'OLD', 'OLD_TABLE', 'ON', 'ONLY', 'OPEN', 'OPERATION', 'OPTION',
-                'OR', 'ORDER', 'ORDINALITY', 'OUT', 'OUTER', 'OUTPUT', 'OVER', 'OVERLAPS', 'OVERRIDE', 'PAD',
-                'PARAMETER', 'PARAMETERS', 'PARTIAL', 'PASSWORD', 'PATH', 'PERCENT', 'PERCENT_RANK', 'PERM',
-                'PERMANENT', 'POSITION', 'POSTFIX', 'PRECISION', 'PREFIX', 'PREORDER', 'PREPARE', 'PRESERVE', 'PRIMARY',
-                'PRIOR', 'PRIVATE', 'PRIVILEGES', 'PROCEDURE', 'PROFILE', 'PROPORTIONAL', 'PROTECTION', 'PUBLIC',
-                'QUALIFIED', 'QUALIFY', 'QUANTILE', 'RADIANS', 'RANDOM', 'RANGE_N', 'RANK', 'READ', 'READS', 'REAL',
-                'RECURSIVE', 'REF', 'REFERENCES', 'REFERENCING', 'REGR_AVGX', 'REGR_AVGY', 'REGR_COUNT',
-                'REGR_INTERCEPT', 'REGR_R2', 'REGR_SLOPE', 'REGR_SXX', 'REGR_SXY', 'REGR_SYY', 'RELATIVE', 'RELEASE',
-                'RENAME', 'REPEAT', 'REPLACE', 'REPLICATION', 'REPOVERRIDE', 'REQUEST', 'RESTART', 'RESTORE',
-                'RESTRICT', 'RESULT', 'RESUME', 'RET', 'RETRIEVE', 'RETURN', 'RETURNS', 'REVALIDATE', 'REVOKE', 'RIGHT',
-                'RIGHTS', 'ROLE', 'ROLLBACK', 'ROLLFORWARD', 'ROLLUP', 'ROUTINE', 'ROW', 'ROW_NUMBER', 'ROWID', 'ROWS',
-                'SAMPLE', 'SAMPLEID', 'SAVEPOINT', 'SCHEMA', 'SCOPE', 'SCROLL', 'SEARCH', 'SECOND', 'SECTION', 'SEL',
-                'SELECT', 'SEQUENCE', 'SESSION', 'SESSION_USER', 'SET', 'SETRESRATE', 'SETS', 'SETSESSRATE', 'SHOW',
-                'SIN', 'SINH', 'SIZE', 'SKEW', 'SMALLINT', 'SOME', 'SOUNDEX', 'SPACE', 'SPECIFIC', 'SPECIFICTYPE',
-                'SPOOL', 'SQL', 'SQLEXCEPTION', 'SQLSTATE', 'SQLTEXT', 'SQLWARNING', 'SQRT', 'SS', 'START', 'STARTUP',
-                'STATE', 'STATEMENT', 'STATIC', 'STATISTICS', 'STDDEV_POP', 'STDDEV_SAMP', 'STEPINFO', 'STRING_CS',
-                'STRUCTURE', 'SUBSCRIBER', 'SUBSTR', 'SUBSTRING', 'SUM', 'SUMMARY', 'SUSPEND', 'SYSTEM_USER', 'TABLE',
-                'TAN', 'TANH', 'TBL_CS', 'TEMPORARY', 'TERMINATE', 'THAN', 'THEN', 'THRESHOLD', 'TIME', 'TIMESTAMP',
-                'TIMEZONE_HOUR', 'TIMEZONE_MINUTE', 'TITLE', 'TO', 'TRACE', 'TRAILING', 'TRANSACTION', 'TRANSLATE',
-                'TRANSLATE_CHK', 'TRANSLATION', 'TREAT', 'TRIGGER', 'TRIM', 'TYPE', 'UC', 'UNDEFINED', 'UNDER', 'UNDO',
-                'UNION', 'UNIQUE', 'UNKNOWN', 'UNNEST', 'UNTIL', 'UPD', 'UPDATE', 'UPPER', 'UPPERCASE', 'USAGE', 'USER',
-                'USING', 'VALUE', 'VALUES', 'VAR_POP', 'VAR_SAMP', 'VARBYTE', 'VARCHAR', 'VARGRAPHIC', 'VARIABLE',
-                'VARYING', 'VIEW', 'VOLATILE', 'WAIT', 'WHEN', 'WHENEVER', 'WHERE', 'WHILE', 'WIDTH_BUCKET', 'WITH',
-                'WITHOUT', 'WORK', 'WRITE', 'YEAR', 'ZEROIFNULL', 'ZONE / ANSI SQL-99', 'FALSE', 'TRUE']
+#   ----------------------------------------------------------------
+#   Name:           ReservedWords.py
+#   Created by:     Neil Rose
+#   Created on:     4/30/2021
+#   Modified by:    GIS Systems Architecture
+#   Modified on:    10/18/2026
+#   Description:    Module that contains the different reserved word
+#                   lists for different database types and an index
+#                   that maps each word to a bitmask of the database
+#                   types that reserve it
+#   ----------------------------------------------------------------
+
+#   Reserved word lists
+sql_rsv = ['A', 'ABORT', 'ABS', 'ABSOLUTE', 'ACCESS', 'ACTION', 'ADA', 'ADD', 'ADMIN', 'AFTER', 'AGGREGATE', 'ALIAS',
+           'ALL', 'ALLOCATE', 'ALSO', 'ALTER', 'ALWAYS', 'ANALYSE', 'ANALYZE', 'AND', 'ANY', 'ARE', 'ARRAY', 'AS',
+           'ASC', 'ASENSITIVE', 'ASSERTION', 'ASSIGNMENT', 'ASYMMETRIC', 'AT', 'ATOMIC', 'ATTRIBUTE', 'ATTRIBUTES',
+           'AUDIT', 'AUTHORIZATION', 'AUTO_INCREMENT', 'AVG', 'AVG_ROW_LENGTH', 'BACKUP', 'BACKWARD', 'BEFORE',
+           'BEGIN', 'BERNOULLI', 'BETWEEN', 'BIGINT', 'BINARY', 'BIT', 'BIT_LENGTH', 'BITVAR', 'BLOB', 'BOOL',
+           'BOOLEAN', 'BOTH', 'BREADTH', 'BREAK', 'BROWSE', 'BULK', 'BY', 'C', 'CACHE', 'CALL', 'CALLED',
+           'CARDINALITY', 'CASCADE', 'CASCADED', 'CASE', 'CAST', 'CATALOG', 'CATALOG_NAME', 'CEIL', 'CEILING',
+           'CHAIN', 'CHANGE', 'CHAR', 'CHAR_LENGTH', 'CHARACTER', 'CHARACTER_LENGTH', 'CHARACTER_SET_CATALOG',
+           'CHARACTER_SET_NAME', 'CHARACTER_SET_SCHEMA', 'CHARACTERISTICS', 'CHARACTERS', 'CHECK', 'CHECKED',
+           'CHECKPOINT', 'CHECKSUM', 'CLASS', 'CLASS_ORIGIN', 'CLOB', 'CLOSE', 'CLUSTER', 'CLUSTERED', 'COALESCE',
+           'COBOL', 'COLLATE', 'COLLATION', 'COLLATION_CATALOG', 'COLLATION_NAME', 'COLLATION_SCHEMA', 'COLLECT',
+           'COLUMN', 'COLUMN_NAME', 'COLUMNS', 'COMMAND_FUNCTION', 'COMMAND_FUNCTION_CODE', 'COMMENT', 'COMMIT',
+           'COMMITTED', 'COMPLETION', 'COMPRESS', 'COMPUTE', 'CONDITION', 'CONDITION_NUMBER', 'CONNECT', 'CONNECTION',
+           'CONNECTION_NAME', 'CONSTRAINT', 'CONSTRAINT_CATALOG', 'CONSTRAINT_NAME', 'CONSTRAINT_SCHEMA',
+           'CONSTRAINTS', 'CONSTRUCTOR', 'CONTAINS', 'CONTAINSTABLE', 'CONTINUE', 'CONVERSION', 'CONVERT', 'COPY',
+           'CORR', 'CORRESPONDING', 'COUNT', 'COVAR_POP', 'COVAR_SAMP', 'CREATE', 'CREATEDB', 'CREATEROLE',
+           'CREATEUSER', 'CROSS', 'CSV', 'CUBE', 'CUME_DIST', 'CURRENT', 'CURRENT_DATE',
+           'CURRENT_DEFAULT_TRANSFORM_GROUP', 'CURRENT_PATH', 'CURRENT_ROLE', 'CURRENT_TIME', 'CURRENT_TIMESTAMP',
+           'CURRENT_TRANSFORM_GROUP_FOR_TYPE', 'CURRENT_USER', 'CURSOR', 'CURSOR_NAME', 'CYCLE', 'DATA', 'DATABASE',
+           'DATABASES', 'DATE', 'DATETIME', 'DATETIME_INTERVAL_CODE', 'DATETIME_INTERVAL_PRECISION', 'DAY',
+           'DAY_HOUR', 'DAY_MICROSECOND', 'DAY_MINUTE', 'DAY_SECOND', 'DAYOFMONTH', 'DAYOFWEEK', 'DAYOFYEAR', 'DBCC',
+           'DEALLOCATE', 'DEC', 'DECIMAL', 'DECLARE', 'DEFAULT', 'DEFAULTS', 'DEFERRABLE', 'DEFERRED', 'DEFINED',
+           'DEFINER', 'DEGREE', 'DELAY_KEY_WRITE', 'DELAYED', 'DELETE', 'DELIMITER', 'DELIMITERS', 'DENSE_RANK',
+           'DENY', 'DEPTH', 'DEREF', 'DERIVED', 'DESC', 'DESCRIBE', 'DESCRIPTOR', 'DESTROY', 'DESTRUCTOR',
+           'DETERMINISTIC', 'DIAGNOSTICS', 'DICTIONARY', 'DISABLE', 'DISCONNECT', 'DISK', 'DISPATCH', 'DISTINCT',
+           'DISTINCTROW', 'DISTRIBUTED', 'DIV', 'DO', 'DOMAIN', 'DOUBLE', 'DROP', 'DUAL', 'DUMMY', 'DUMP', 'DYNAMIC',
+           'DYNAMIC_FUNCTION', 'DYNAMIC_FUNCTION_CODE', 'EACH', 'ELEMENT', 'ELSE', 'ELSEIF', 'ENABLE', 'ENCLOSED',
+           'ENCODING', 'ENCRYPTED', 'END', 'END-EXEC', 'ENUM', 'EQUALS', 'ERRLVL', 'ESCAPE', 'ESCAPED', 'EVERY',
+           'EXCEPT', 'EXCEPTION', 'EXCLUDE', 'EXCLUDING', 'EXCLUSIVE', 'EXEC', 'EXECUTE', 'EXISTING', 'EXISTS',
+           'EXIT', 'EXP', 'EXPLAIN', 'EXTERNAL', 'EXTRACT', 'FALSE', 'FETCH', 'FIELDS', 'FILE', 'FILLFACTOR',
+           'FILTER', 'FINAL', 'FIRST', 'FLOAT', 'FLOAT4', 'FLOAT8', 'FLOOR', 'FLUSH', 'FOLLOWING', 'FOR', 'FORCE',
+           'FOREIGN', 'FORTRAN', 'FORWARD', 'FOUND', 'FREE', 'FREETEXT', 'FREETEXTTABLE', 'FREEZE', 'FROM', 'FULL',
+           'FULLTEXT', 'FUNCTION', 'FUSION', 'G', 'GENERAL', 'GENERATED', 'GET', 'GLOBAL', 'GO', 'GOTO', 'GRANT',
+           'GRANTED', 'GRANTS', 'GREATEST', 'GROUP', 'GROUPING', 'HANDLER', 'HAVING', 'HEADER', 'HEAP', 'HIERARCHY',
+           'HIGH_PRIORITY', 'HOLD', 'HOLDLOCK', 'HOST', 'HOSTS', 'HOUR', 'HOUR_MICROSECOND', 'HOUR_MINUTE',
+           'HOUR_SECOND', 'IDENTIFIED', 'IDENTITY', 'IDENTITY_INSERT', 'IDENTITYCOL', 'IF', 'IGNORE', 'ILIKE',
+           'IMMEDIATE', 'IMMUTABLE', 'IMPLEMENTATION', 'IMPLICIT', 'IN', 'INCLUDE', 'INCLUDING', 'INCREMENT', 'INDEX',
+           'INDICATOR', 'INFILE', 'INFIX', 'INHERIT', 'INHERITS', 'INITIAL', 'INITIALIZE', 'INITIALLY', 'INNER',
+           'INOUT', 'INPUT', 'INSENSITIVE', 'INSERT', 'INSERT_ID', 'INSTANCE', 'INSTANTIABLE', 'INSTEAD', 'INT',
+           'INT1', 'INT2', 'INT3', 'INT4', 'INT8', 'INTEGER', 'INTERSECT', 'INTERSECTION', 'INTERVAL', 'INTO',
+           'INVOKER', 'IS', 'ISAM', 'ISNULL', 'ISOLATION', 'ITERATE', 'JOIN', 'K', 'KEY', 'KEY_MEMBER', 'KEY_TYPE',
+           'KEYS', 'KILL', 'LANCOMPILER', 'LANGUAGE', 'LARGE', 'LAST', 'LAST_INSERT_ID', 'LATERAL', 'LEADING',
+           'LEAST', 'LEAVE', 'LEFT', 'LENGTH', 'LESS', 'LEVEL', 'LIKE', 'LIMIT', 'LINENO', 'LINES', 'LISTEN', 'LN',
+           'LOAD', 'LOCAL', 'LOCALTIME', 'LOCALTIMESTAMP', 'LOCATION', 'LOCATOR', 'LOCK', 'LOGIN', 'LOGS', 'LONG',
+           'LONGBLOB', 'LONGTEXT', 'LOOP', 'LOW_PRIORITY', 'LOWER', 'M', 'MAP', 'MATCH', 'MATCHED', 'MAX', 'MAX_ROWS',
+           'MAXEXTENTS', 'MAXVALUE', 'MEDIUMBLOB', 'MEDIUMINT', 'MEDIUMTEXT', 'MEMBER', 'MERGE', 'MESSAGE_LENGTH',
+           'MESSAGE_OCTET_LENGTH', 'MESSAGE_TEXT', 'METHOD', 'MIDDLEINT', 'MIN', 'MIN_ROWS', 'MINUS', 'MINUTE',
+           'MINUTE_MICROSECOND', 'MINUTE_SECOND', 'MINVALUE', 'MLSLABEL', 'MOD', 'MODE', 'MODIFIES', 'MODIFY',
+           'MODULE', 'MONTH', 'MONTHNAME', 'MORE', 'MOVE', 'MULTISET', 'MUMPS', 'MYISAM', 'NAME', 'NAMES',
+           'NATIONAL', 'NATURAL', 'NCHAR', 'NCLOB', 'NESTING', 'NEW', 'NEXT', 'NO', 'NO_WRITE_TO_BINLOG', 'NOAUDIT',
+           'NOCHECK', 'NOCOMPRESS', 'NOCREATEDB', 'NOCREATEROLE', 'NOCREATEUSER', 'NOINHERIT', 'NOLOGIN',
+           'NONCLUSTERED', 'NONE', 'NORMALIZE', 'NORMALIZED', 'NOSUPERUSER', 'NOT', 'NOTHING', 'NOTIFY', 'NOTNULL',
+           'NOWAIT', 'NULL', 'NULLABLE', 'NULLIF', 'NULLS', 'NUMBER', 'NUMERIC', 'OBJECT', 'OCTET_LENGTH', 'OCTETS',
+           'OF', 'OFF', 'OFFLINE', 'OFFSET', 'OFFSETS', 'OIDS', 'OLD', 'ON', 'ONLINE', 'ONLY', 'OPEN',
+           'OPENDATASOURCE', 'OPENQUERY', 'OPENROWSET', 'OPENXML', 'OPERATION', 'OPERATOR', 'OPTIMIZE', 'OPTION',
+           'OPTIONALLY', 'OPTIONS', 'OR', 'ORDER', 'ORDERING', 'ORDINALITY', 'OTHERS', 'OUT', 'OUTER', 'OUTFILE',
+           'OUTPUT', 'OVER', 'OVERLAPS', 'OVERLAY', 'OVERRIDING', 'OWNER', 'PACK_KEYS', 'PAD', 'PARAMETER',
+           'PARAMETER_MODE', 'PARAMETER_NAME', 'PARAMETER_ORDINAL_POSITION', 'PARAMETER_SPECIFIC_CATALOG',
+           'PARAMETER_SPECIFIC_NAME', 'PARAMETER_SPECIFIC_SCHEMA', 'PARAMETERS', 'PARTIAL', 'PARTITION', 'PASCAL',
+           'PASSWORD', 'PATH', 'PCTFREE', 'PERCENT', 'PERCENT_RANK', 'PERCENTILE_CONT', 'PERCENTILE_DISC', 'PLACING',
+           'PLAN', 'PLI', 'POSITION', 'POSTFIX', 'POWER', 'PRECEDING', 'PRECISION', 'PREFIX', 'PREORDER', 'PREPARE',
+           'PREPARED', 'PRESERVE', 'PRIMARY', 'PRINT', 'PRIOR', 'PRIVILEGES', 'PROC', 'PROCEDURAL', 'PROCEDURE',
+           'PROCESS', 'PROCESSLIST', 'PUBLIC', 'PURGE', 'QUOTE', 'RAID0', 'RAISERROR', 'RANGE', 'RANK', 'RAW', 'READ',
+           'READS', 'READTEXT', 'REAL', 'RECHECK', 'RECONFIGURE', 'RECURSIVE', 'REF', 'REFERENCES', 'REFERENCING',
+           'REGEXP', 'REGR_AVGX', 'REGR_AVGY', 'REGR_COUNT', 'REGR_INTERCEPT', 'REGR_R2', 'REGR_SLOPE', 'REGR_SXX',
+           'REGR_SXY', 'REGR_SYY', 'REINDEX', 'RELATIVE', 'RELEASE', 'RELOAD', 'RENAME', 'REPEAT', 'REPEATABLE',
+           'REPLACE', 'REPLICATION', 'REQUIRE', 'RESET', 'RESIGNAL', 'RESOURCE', 'RESTART', 'RESTORE', 'RESTRICT',
+           'RESULT', 'RETURN', 'RETURNED_CARDINALITY', 'RETURNED_LENGTH', 'RETURNED_OCTET_LENGTH',
+           'RETURNED_SQLSTATE', 'RETURNS', 'REVOKE', 'RIGHT', 'RLIKE', 'ROLE', 'ROLLBACK', 'ROLLUP', 'ROUTINE',
+           'ROUTINE_CATALOG', 'ROUTINE_NAME', 'ROUTINE_SCHEMA', 'ROW', 'ROW_COUNT', 'ROW_NUMBER', 'ROWCOUNT',
+           'ROWGUIDCOL', 'ROWID', 'ROWNUM', 'ROWS', 'RULE', 'SAVE', 'SAVEPOINT', 'SCALE', 'SCHEMA', 'SCHEMA_NAME',
+           'SCHEMAS', 'SCOPE', 'SCOPE_CATALOG', 'SCOPE_NAME', 'SCOPE_SCHEMA', 'SCROLL', 'SEARCH', 'SECOND',
+           'SECOND_MICROSECOND', 'SECTION', 'SECURITY', 'SELECT', 'SELF', 'SENSITIVE', 'SEPARATOR', 'SEQUENCE',
+           'SERIALIZABLE', 'SERVER_NAME', 'SESSION', 'SESSION_USER', 'SET', 'SETOF', 'SETS', 'SETUSER', 'SHARE',
+           'SHOW', 'SHUTDOWN', 'SIGNAL', 'SIMILAR', 'SIMPLE', 'SIZE', 'SMALLINT', 'SOME', 'SONAME', 'SOURCE',
+           'SPACE', 'SPATIAL', 'SPECIFIC', 'SPECIFIC_NAME', 'SPECIFICTYPE', 'SQL', 'SQL_BIG_RESULT',
+           'SQL_BIG_SELECTS', 'SQL_BIG_TABLES', 'SQL_CALC_FOUND_ROWS', 'SQL_LOG_OFF', 'SQL_LOG_UPDATE',
+           'SQL_LOW_PRIORITY_UPDATES', 'SQL_SELECT_LIMIT', 'SQL_SMALL_RESULT', 'SQL_WARNINGS', 'SQLCA', 'SQLCODE',
+           'SQLERROR', 'SQLEXCEPTION', 'SQLSTATE', 'SQLWARNING', 'SQRT', 'SSL', 'STABLE', 'START', 'STARTING',
+           'STATE', 'STATEMENT', 'STATIC', 'STATISTICS', 'STATUS', 'STDDEV_POP', 'STDDEV_SAMP', 'STDIN', 'STDOUT',
+           'STORAGE', 'STRAIGHT_JOIN', 'STRICT', 'STRING', 'STRUCTURE', 'STYLE', 'SUBCLASS_ORIGIN', 'SUBLIST',
+           'SUBMULTISET', 'SUBSTRING', 'SUCCESSFUL', 'SUM', 'SUPERUSER', 'SYMMETRIC', 'SYNONYM', 'SYSDATE', 'SYSID',
+           'SYSTEM', 'SYSTEM_USER', 'TABLE', 'TABLE_NAME', 'TABLES', 'TABLESAMPLE', 'TABLESPACE', 'TEMP', 'TEMPLATE',
+           'TEMPORARY', 'TERMINATE', 'TERMINATED', 'TEXT', 'TEXTSIZE', 'THAN', 'THEN', 'TIES', 'TIME', 'TIMESTAMP',
+           'TIMEZONE_HOUR', 'TIMEZONE_MINUTE', 'TINYBLOB', 'TINYINT', 'TINYTEXT', 'TO', 'TOAST', 'TOP',
+           'TOP_LEVEL_COUNT', 'TRAILING', 'TRAN', 'TRANSACTION', 'TRANSACTION_ACTIVE', 'TRANSACTIONS_COMMITTED',
+           'TRANSACTIONS_ROLLED_BACK', 'TRANSFORM', 'TRANSFORMS', 'TRANSLATE', 'TRANSLATION', 'TREAT', 'TRIGGER',
+           'TRIGGER_CATALOG', 'TRIGGER_NAME', 'TRIGGER_SCHEMA', 'TRIM', 'TRUE', 'TRUNCATE', 'TRUSTED', 'TSEQUAL',
+           'TYPE', 'UESCAPE', 'UID', 'UNBOUNDED', 'UNCOMMITTED', 'UNDER', 'UNDO', 'UNENCRYPTED', 'UNION', 'UNIQUE',
+           'UNKNOWN', 'UNLISTEN', 'UNLOCK', 'UNNAMED', 'UNNEST', 'UNSIGNED', 'UNTIL', 'UPDATE', 'UPDATETEXT', 'UPPER',
+           'USAGE', 'USE', 'USER', 'USER_DEFINED_TYPE_CATALOG', 'USER_DEFINED_TYPE_CODE', 'USER_DEFINED_TYPE_NAME',
+           'USER_DEFINED_TYPE_SCHEMA', 'USING', 'UTC_DATE', 'UTC_TIME', 'UTC_TIMESTAMP', 'VACUUM', 'VALID', 'VALIDATE',
+           'VALIDATOR', 'VALUE', 'VALUES', 'VAR_POP', 'VAR_SAMP', 'VARBINARY', 'VARCHAR', 'VARCHAR2', 'VARCHARACTER',
+           'VARIABLE', 'VARIABLES', 'VARYING', 'VERBOSE', 'VIEW', 'VOLATILE', 'WAITFOR', 'WHEN', 'WHENEVER', 'WHERE',
+           'WHILE', 'WIDTH_BUCKET', 'WINDOW', 'WITH', 'WITHIN', 'WITHOUT', 'WORK', 'WRITE', 'WRITETEXT', 'X509', 'XOR',
+           'YEAR', 'YEAR_MONTH', 'ZEROFILL', 'ZONE']
+altibase_rsv = ['_PROWID', 'ACCESS(O)', 'ADD', 'AFTER(O)', 'AGER(O)', 'ALL', 'ALTER', 'AND', 'ANY', 'APPLY',
+                'ARCHIVE(O)', 'ARCHIVELOG(O)', 'AS', 'ASC', 'AT(O)', 'AUDIT(O)', 'AUTOEXTEND(O)', 'BACKUP(O)',
+                'BEFORE(O)', 'BEGIN(O)', 'BETWEEN', 'BODY(O)', 'BULK', 'BY', 'CASCADE(O)', 'CASE', 'CAST(O)',
+                'CHECKPOINT(O)', 'CLOSE(O)', 'COALESCE(O)', 'COLUMN', 'COMMENT(O)', 'COMMIT(O)', 'COMPILE(O)',
+                'COMPRESS', 'COMPRESSED(O)', 'CONJOIN(O)', 'CONNECT', 'CONSTANT', 'CONSTRAINTS(O)', 'CONTINUE(O)',
+                'CREATE', 'CROSS', 'CUBE(O)', 'CURSOR(O)', 'CYCLE(O)', 'DATABASE(O)', 'DECLARE(O)', 'DECRYPT(O)',
+                'DEFAULT', 'DELAUDIT(O)', 'DELETE', 'DEQUEUE(O)', 'DESC', 'DETERMINISTIC(O)', 'DIRECTORY(O)',
+                'DISABLE(O)', 'DISASTER(O)', 'DISCONNECT(O)', 'DISJOIN(O)', 'DISTINCT', 'DROP', 'EACH(O)', 'ELSE',
+                'ELSEIF(O)', 'ELSIF(O)', 'ENABLE(O)', 'END(O)', 'ENQUEUE(O)', 'ESCAPE(O)', 'EXCEPTION', 'EXEC(O)',
+                'EXECUTE(O)', 'EXISTS', 'EXIT(O)', 'EXTENT(O)', 'EXTENTSIZE(O)', 'FETCH(O)', 'FIFO(O)', 'FIXED(O)',
+                'FLASHBACK(O)', 'FLUSH(O)', 'FLUSHER(O)', 'FOLLOWING(O)', 'FOR', 'FOREIGN', 'FROM', 'FULL(O)',
+                'FUNCTION(O)', 'GOTO(O)', 'GRANT', 'GROUP', 'HAVING', 'IF(O)', 'IN', 'INDEX', 'INITRANS(O)', 'INNER(O)',
+                'INSERT', 'INSTEAD', 'INTERSECT', 'INTO', 'IS', 'ISOLATION(O)', 'JOIN(O)', 'KEY(O)', 'LANGUAGE(O)',
+                'LATERAL', 'LEFT(O)', 'LESS(O)', 'LEVEL', 'LIBRARY(O)', 'LIFO(O)', 'LIKE', 'LIMIT(O)', 'LINK', 'LINKER',
+                'LOB', 'LOCAL', 'LOCK', 'LOGANCHOR', 'LOGGING', 'LOOP', 'MAXROWS', 'MAXTRANS', 'MERGE', 'MINUS', 'MODE',
+                'MODIFY', 'MOVE', 'MOVEMENT', 'NEW', 'NOAUDIT', 'NOCOPY', 'NOCYCLE', 'NOLOGGING', 'NOT', 'NULL',
+                'NULLS', 'OF', 'OFF', 'OFFLINE', 'OLD', 'ON', 'ONLINE', 'OPEN', 'OR', 'ORDER', 'OTHERS', 'OUT', 'OUTER',
+                'OVER', 'PACKAGE', 'PARALLEL', 'PARTITION', 'PIVOT', 'PRECEDING', 'PRIMARY', 'PRIOR', 'PROCEDURE',
+                'PURGE', 'QUEUE', 'RAISE', 'READ', 'REBUILD', 'RECOVER', 'REMOVE', 'RENAME', 'REPLACE', 'RETURN',
+                'RETURNING', 'REVOKE', 'RIGHT', 'ROLLBACK', 'ROLLUP', 'ROW', 'ROWCOUNT', 'ROWNUM', 'ROWTYPE',
+                'SAVEPOINT', 'SEGMENT', 'SELECT', 'SEQUENCE', 'SESSION', 'SET', 'SHARD', 'SOME', 'SPLIT', 'SQLCODE',
+                'SQLERRM', 'START', 'STEP', 'STORAGE', 'STORE', 'SYNONYM', 'TABLE', 'THAN', 'THEN', 'TO', 'TOP',
+                'TRIGGER', 'TRUNCATE', 'TYPE', 'TYPESET', 'UNION', 'UNIQUE', 'UNLOCK', 'UNPIVOT', 'UNTIL', 'UPDATE',
+                'USING', 'VALUES', 'VARIABLE', 'VC2COLL', 'VIEW', 'VOLATILE', 'WAIT', 'WHEN', 'WHENEVER', 'WHERE',
+                'WHILE', 'WITH', 'WITHIN', 'WORK', 'WRAPPED', 'WRITE', 'FALSE', 'TRUE']
+dameng_rsv = []
+db2_rsv = ['ADD', 'AFTER', 'ALL', 'ALLOCATE', 'ALLOW', 'ALTERAND', 'ANY', 'AS', 'ARRAY1', 'ARRAY_EXISTS1', 'ASENSITIVE',
+           'ASSOCIATE', 'ASUTIME', 'AT', 'AUDIT', 'AUX', 'AUXILIARY', 'BEFORE', 'BEGIN', 'BETWEEN', 'BUFFERPOOL', 'BY',
+           'CALL', 'CAPTURE', 'CASCADED', 'CASE', 'CAST', 'CCSID', 'CHAR', 'CHARACTER', 'CHECK', 'CLONE', 'CLOSE',
+           'CLUSTER', 'COLLECTION', 'COLLID', 'COLUMN', 'COMMENT', 'COMMIT', 'CONCAT', 'CONDITION', 'CONNECT',
+           'CONNECTION', 'CONSTRAINT', 'CONTAINS', 'CONTENT', 'CONTINUE', 'CREATE', 'CUBE', 'CURRENT', 'CURRENT_DATE',
+           'CURRENT_LC_CTYPE', 'CURRENT_PATH', 'CURRENT_SCHEMA', 'CURRENT_TIME', 'CURRENT_TIMESTAMP', 'CURRVAL',
+           'CURSOR', 'DATA', 'DATABASE', 'DAY', 'DAYS', 'DBINFO', 'DECLARE', 'DEFAULT', 'DELETE', 'DESCRIPTOR',
+           'DETERMINISTIC', 'DISABLE', 'DISALLOW', 'DISTINCT', 'DO', 'DOCUMENT', 'DOUBLE', 'DROP', 'DSSIZE', 'DYNAMIC',
+           'EDITPROC', 'ELSE', 'ELSEIF', 'ENCODING', 'ENCRYPTION', 'END', 'ENDING', 'END-EXEC2', 'ERASE', 'ESCAPE',
+           'EXCEPT', 'EXCEPTION', 'EXECUTE', 'EXISTS', 'EXIT', 'EXPLAIN', 'EXTERNAL', 'FENCED', 'FETCH', 'FIELDPROC',
+           'FINAL', 'FIRST', 'FOR', 'FREE', 'FROM', 'FULL', 'FUNCTION', 'GENERATED', 'GET', 'GLOBAL', 'GO', 'GOTO',
+           'GRANT', 'GROUP', 'HANDLER', 'HAVING', 'HOLD', 'HOUR', 'HOURS', 'IF', 'IMMEDIATE', 'IN', 'INCLUSIVE',
+           'INDEX', 'INHERIT', 'INNER', 'INOUT', 'INSENSITIVE', 'INSERT', 'INTERSECT', 'INTO', 'IS', 'ISOBID',
+           'ITERATE', 'JAR', 'JOIN', 'KEEP', 'KEY', 'LABEL', 'LANGUAGE', 'LAST', 'LC_CTYPE', 'LEAVE', 'LEFT', 'LIKE',
+           'LOCAL', 'LOCALE', 'LOCATOR', 'LOCATORS', 'LOCK', 'LOCKMAX', 'LOCKSIZE', 'LONG', 'LOOP', 'MAINTAINED',
+           'MATERIALIZED', 'MICROSECOND', 'MICROSECONDS', 'MINUTEMINUTES', 'MODIFIES', 'MONTH', 'MONTHS', 'NEXT',
+           'NEXTVAL', 'NO', 'NONE', 'NOT', 'NULL', 'NULLS', 'NUMPARTS', 'OBID', 'OF', 'OLD', 'ON', 'OPEN',
+           'OPTIMIZATION', 'OPTIMIZE', 'OR', 'ORDER', 'ORGANIZATION', 'OUT', 'OUTER', 'PACKAGE', 'PARAMETER', 'PART',
+           'PADDED', 'PARTITION', 'PARTITIONED', 'PARTITIONING', 'PATH', 'PIECESIZE', 'PERIOD', 'PLAN', 'PRECISION',
+           'PREPARE', 'PREVVAL', 'PRIOR', 'PRIQTY', 'PRIVILEGES', 'PROCEDURE', 'PROGRAM', 'PSID', 'PUBLIC', 'QUERY',
+           'QUERYNO', 'READS', 'REFERENCES', 'REFRESH', 'RESIGNAL', 'RELEASE', 'RENAME', 'REPEAT', 'RESTRICT', 'RESULT',
+           'RESULT_SET_LOCATOR', 'RETURN', 'RETURNS', 'REVOKE', 'RIGHT', 'ROLE', 'ROLLBACK', 'ROLLUP1', 'ROUND_CEILING',
+           'ROUND_DOWN', 'ROUND_FLOOR', 'ROUND_HALF_DOWN', 'ROUND_HALF_EVEN', 'ROUND_HALF_UP', 'ROUND_UP', 'ROW',
+           'ROWSET', 'RUN', 'SAVEPOINT', 'SCHEMA', 'SCRATCHPAD', 'SECOND', 'SECONDS', 'SECQTY', 'SECURITY', 'SEQUENCE',
+           'SELECT', 'SENSITIVE', 'SESSION_USER', 'SET', 'SIGNAL', 'SIMPLE', 'SOME', 'SOURCE', 'SPECIFIC', 'STANDARD',
+           'STATIC', 'STATEMENT', 'STAY', 'STOGROUP', 'STORES', 'STYLE', 'SUMMARY', 'SYNONYM', 'SYSDATE', 'SYSTEM',
+           'SYSTIMESTAMP', 'TABLE', 'TABLESPACE', 'THEN', 'TO', 'TRIGGER', 'TRUNCATE', 'TYPE', 'UNDO', 'UNION',
+           'UNIQUE', 'UNTIL', 'UPDATE', 'USER', 'USING', 'VALIDPROC', 'VALUE', 'VALUES', 'VARIABLE', 'VARIANT', 'VCAT',
+           'VERSIONING1', 'VIEW', 'VOLATILE', 'VOLUMES', 'WHEN', 'WHENEVER', 'WHERE', 'WHILE', 'WITH', 'WLM',
+           'XMLEXISTS', 'XMLNAMESPACES', 'XMLCAST', 'YEAR', 'YEARS', 'ZONE']
+oracle_rsv = ['ACCESS', 'ACCOUNT', 'ACTIVATE', 'ADD', 'ADMIN', 'ADVISE', 'AFTER', 'ALL', 'ALL_ROWS', 'ALLOCATE',
+              'ALTER', 'ANALYZE', 'AND', 'ANY', 'ARCHIVE', 'ARCHIVELOG', 'ARRAY', 'AS', 'ASC', 'AT', 'AUDIT',
+              'AUTHENTICATED', 'AUTHORIZATION', 'AUTOEXTEND', 'AUTOMATIC', 'BACKUP', 'BECOME', 'BEFORE', 'BEGIN',
+              'BETWEEN', 'BFILE', 'BITMAP', 'BLOB', 'BLOCK', 'BODY', 'BY', 'CACHE', 'CACHE_INSTANCES', 'CANCEL',
+              'CASCADE', 'CAST', 'CFILE', 'CHAINED', 'CHANGE', 'CHAR', 'CHAR_CS', 'CHARACTER', 'CHECK', 'CHECKPOINT',
+              'CHOOSE', 'CHUNK', 'CLEAR', 'CLOB', 'CLONE', 'CLOSE', 'CLOSE_CACHED_OPEN_CURSORS', 'CLUSTER', 'COALESCE',
+              'COLUMN', 'COLUMNS', 'COMMENT', 'COMMIT', 'COMMITTED', 'COMPATIBILITY', 'COMPILE', 'COMPLETE',
+              'COMPOSITE_LIMIT', 'COMPRESS', 'COMPUTE', 'CONNECT', 'CONNECT_TIME', 'CONSTRAINT', 'CONSTRAINTS',
+              'CONTENTS', 'CONTINUE', 'CONTROLFILE', 'CONVERT', 'COST', 'CPU_PER_CALL', 'CPU_PER_SESSION',
+              'CREATE', 'CURRENT', 'CURRENT_SCHEMA', 'CURREN_USER', 'CURSOR', 'CYCLE', ' ', 'ANGLING', 'DATABASE',
+              'DATAFILE', 'DATAFILES', 'DATAOBJNO', 'DATE', 'DBA', 'DBHIGH', 'DBLOW', 'DBMAC', 'DEALLOCATE', 'DEBUG',
+              'DEC', 'DECIMAL', 'DECLARE', 'DEFAULT', 'DEFERRABLE', 'DEFERRED', 'DEGREE', 'DELETE', 'DEREF', 'DESC',
+              'DIRECTORY', 'DISABLE', 'DISCONNECT', 'DISMOUNT', 'DISTINCT', 'DISTRIBUTED', 'DML', 'DOUBLE', 'DROP',
+              'DUMP', 'EACH', 'ELSE', 'ENABLE', 'END', 'ENFORCE', 'ENTRY', 'ESCAPE', 'EXCEPT', 'EXCEPTIONS', 'EXCHANGE',
+              'EXCLUDING', 'EXCLUSIVE', 'EXECUTE', 'EXISTS', 'EXPIRE', 'EXPLAIN', 'EXTENT', 'EXTENTS', 'EXTERNALLY',
+              'FAILED_LOGIN_ATTEMPTS', 'FALSE', 'FAST', 'FILE', 'FIRST_ROWS', 'FLAGGER', 'FLOAT', 'FLOB', 'FLUSH',
+              'FOR', 'FORCE', 'FOREIGN', 'FREELIST', 'FREELISTS', 'FROM', 'FULL', 'FUNCTION', 'GLOBAL', 'GLOBALLY',
+              'GLOBAL_NAME', 'GRANT', 'GROUP', 'GROUPS', 'HASH', 'HASHKEYS', 'HAVING', 'HEADER', 'HEAP', 'IDENTIFIED',
+              'IDGENERATORS', 'IDLE_TIME', 'IF', 'IMMEDIATE', 'IN', 'INCLUDING', 'INCREMENT', 'INDEX', 'INDEXED',
+              'INDEXES', 'INDICATOR', 'IND_PARTITION', 'INITIAL', 'INITIALLY', 'INITRANS', 'INSERT', 'INSTANCE',
+              'INSTANCES', 'INSTEAD', 'INT', 'INTEGER', 'INTERMEDIATE', 'INTERSECT', 'INTO', 'IS', 'ISOLATION',
+              'ISOLATION_LEVEL', 'KEEP', 'KEY', 'KILL', 'LABEL', 'LAYER', 'LESS', 'LEVEL', 'LIBRARY', 'LIKE', 'LIMIT',
+              'LINK', 'LIST', 'LOB', 'LOCAL', 'LOCK', 'LOCKED', 'LOG', 'LOGFILE', 'LOGGING', 'LOGICAL_READS_PER_CALL',
+              'LOGICAL_READS_PER_SESSION', 'LONG', 'MANAGE', 'MASTER', 'MAX', 'MAXARCHLOGS', 'MAXDATAFILES',
+              'MAXEXTENTS', 'MAXINSTANCES', 'MAXLOGFILES', 'MAXLOGHISTORY', 'MAXLOGMEMBERS', 'MAXSIZE', 'MAXTRANS',
+              'MAXVALUE', 'MIN', 'MEMBER', 'MINIMUM', 'MINEXTENTS', 'MINUS', 'MINVALUE', 'MLSLABEL', 'MLS_LABEL_FORMAT',
+              'MODE', 'MODIFY', 'MOUNT', 'MOVE', 'MTS_DISPATCHERS', 'MULTISET', 'NATIONAL', 'NCHAR', 'NCHAR_CS',
+              'NCLOB', 'NEEDED', 'NESTED', 'NETWORK', 'NEW', 'NEXT', 'NOARCHIVELOG', 'NOAUDIT', 'NOCACHE', 'NOCOMPRESS',
+              'NOCYCLE', 'NOFORCE', 'NOLOGGING', 'NOMAXVALUE', 'NOMINVALUE', 'NONE', 'NOORDER', 'NOOVERRIDE',
+              'NOPARALLEL', 'NOPARALLEL', 'NOREVERSE', 'NORMAL', 'NOSORT', 'NOT', 'NOTHING', 'NOWAIT', 'NULL', 'NUMBER',
+              'NUMERIC', 'NVARCHAR2', 'OBJECT', 'OBJNO', 'OBJNO_REUSE', 'OF', 'OFF', 'OFFLINE', 'OID', 'OIDINDEX',
+              'OLD', 'ON', 'ONLINE', 'ONLY', 'OPCODE', 'OPEN', 'OPTIMAL', 'OPTIMIZER_GOAL', 'OPTION', 'OR', 'ORDER',
+              'ORGANIZATION', 'OSLABEL', 'OVERFLOW', 'OWN', 'PACKAGE', 'PARALLEL', 'PARTITION', 'PASSWORD',
+              'PASSWORD_GRACE_TIME', 'PASSWORD_LIFE_TIME', 'PASSWORD_LOCK_TIME', 'PASSWORD_REUSE_MAX',
+              'PASSWORD_REUSE_TIME', 'PASSWORD_VERIFY_FUNCTION', 'PCTFREE', 'PCTINCREASE', 'PCTTHRESHOLD', 'PCTUSED',
+              'PCTVERSION', 'PERCENT', 'PERMANENT', 'PLAN', 'PLSQL_DEBUG', 'POST_TRANSACTION', 'PRECISION', 'PRESERVE',
+              'PRIMARY', 'PRIOR', 'PRIVATE', 'PRIVATE_SGA', 'PRIVILEGE', 'PRIVILEGES', 'PROCEDURE', 'PROFILE', 'PUBLIC',
+              'PURGE', 'QUEUE', 'QUOTA', 'RANGE', 'RAW', 'RBA', 'READ', 'READUP', 'REAL', 'REBUILD', 'RECOVER',
+              'RECOVERABLE', 'RECOVERY', 'REF', 'REFERENCES', 'REFERENCING', 'REFRESH', 'RENAME', 'REPLACE', 'RESET',
+              'RESETLOGS', 'RESIZE', 'RESOURCE', 'RESTRICTED', 'RETURN', 'RETURNING', 'REUSE', 'REVERSE', 'REVOKE',
+              'ROLE', 'ROLES', 'ROLLBACK', 'ROW', 'ROWID', 'ROWNUM', 'ROWS', 'RULE', 'SAMPLE', 'SAVEPOINT', 'SB4',
+              'SCAN_INSTANCES', 'SCHEMA', 'SCN', 'SCOPE', 'SD_ALL', 'SD_INHIBIT', 'SD_SHOW', 'SEGMENT', 'SEG_BLOCK',
+              'SEG_FILE', 'SELECT', 'SEQUENCE', 'SERIALIZABLE', 'SESSION', 'SESSION_CACHED_CURSORS',
+              'SESSIONS_PER_USER', 'SET', 'SHARE', 'SHARED', 'SHARED_POOL', 'SHRINK', 'SIZE', 'SKIP',
+              'SKIP_UNUSABLE_INDEXES', 'SMALLINT', 'SNAPSHOT', 'SOME', 'SORT', 'SPECIFICATION', 'SPLIT', 'SQL_TRACE',
+              'STANDBY', 'START', 'STATEMENT_ID', 'STATISTICS', 'STOP', 'STORAGE', 'STORE', 'STRUCTURE', 'SUCCESSFUL',
+              'SWITCH', 'SYS_OP_ENFORCE_NOT_NULL$', 'SYS_OP_NTCIMG$', 'SYNONYM', 'SYSDATE', 'SYSDBA', 'SYSOPER',
+              'SYSTEM', 'TABLE', 'TABLES', 'TABLESPACE', 'TABLESPACE_NO', 'TABNO', 'TEMPORARY', 'THAN', 'THE', 'THEN',
+              'THREAD', 'TIMESTAMP', 'TIME', 'TO', 'TOPLEVEL', 'TRACE', 'TRACING', 'TRANSACTION', 'TRANSITIONAL',
+              'TRIGGER', 'TRIGGERS', 'TRUE', 'TRUNCATE', 'TX', 'TYPE', 'UB2', 'UBA', 'UID', 'UNARCHIVED', 'UNDO',
+              'UNION', 'UNIQUE', 'UNLIMITED', 'UNLOCK', 'UNRECOVERABLE', 'UNTIL', 'UNUSABLE', 'UNUSED', 'UPDATABLE',
+              'UPDATE', 'USAGE', 'USE', 'USER', 'USING', 'VALIDATE', 'VALIDATION', 'VALUE', 'VALUES', 'VARCHAR',
+              'VARCHAR2', 'VARYING', 'VIEW', 'WHEN', 'WHENEVER', 'WHERE', 'WITH', 'WITHOUT', 'WORK', 'WRITE',
+              'WRITEDOWN', 'WRITEUP', 'XID', 'YEAR', 'ZONE']
+postgressql_rsv = ['ALL', 'ANALYSE', 'ANALYZE', 'AND', 'ANY', 'ARRAY', 'AS', 'ASC', 'ASYMMETRIC', 'AUTHORIZATION',
+                   'BETWEEN', 'BINARY', 'BOTH', 'CASE', 'CAST', 'CHECK', 'COLLATE', 'COLUMN', 'CONSTRAINT', 'CREATE',
+                   'CROSS', 'CURRENT_DATE', 'CURRENT_ROLE', 'CURRENT_TIME', 'CURRENT_TIMESTAMP', 'CURRENT_USER',
+                   'DEFAULT', 'DEFERRABLE', 'DESC', 'DISTINCT', 'DO', 'ELSE', 'END', 'EXCEPT', 'FOR', 'FOREIGN',
+                   'FREEZE', 'FROM', 'FULL', 'GRANT', 'GROUP', 'HAVING', 'ILIKE', 'IN', 'INITIALLY', 'INNER',
+                   'INTERSECT', 'INTO', 'IS', 'ISNULL', 'JOIN', 'LEADING', 'LEFT', 'LIKE', 'LIMIT', 'LOCALTIME',
+                   'LOCALTIMESTAMP', 'NATURAL', 'NEW', 'NOT', 'NOTNULL', 'NULL', 'OFF', 'OFFSET', 'OLD', 'ON', 'ONLY',
+                   'OR', 'ORDER', 'OUTER', 'OVERLAPS', 'PLACING', 'PRIMARY', 'REFERENCES', 'RIGHT', 'SELECT',
+                   'SESSION_USER', 'SIMILAR', 'SOME', 'SYMMETRIC', 'TABLE', 'THEN', 'TO', 'TRAILING', 'UNION',
+                   'UNIQUE', 'USER', 'USING', 'VERBOSE', 'WHEN', 'WHERE', 'FALSE', 'TRUE']
+sap_hana_rsv = ['ABS', 'ABSOLUTE', 'ACTION', 'ADA', 'ADD', 'ADMIN', 'AFTER', 'ALL', 'ALLOCATE', 'ALTER', 'ALWAYS',
+                'AND', 'ANY', 'ARE', 'ARRAY', 'ARRAY_AGG', 'ARRAY_MAX_CARDINALITY', 'AS', 'ASC', 'ASENSITIVE',
+                'ASSERTION', 'ASSIGNMENT', 'ASYMMETRIC', 'AT', 'ATOMIC', 'ATTRIBUTE', 'ATTRIBUTES', 'AUTHORIZATION',
+                'AVG', 'BEFORE', 'BEGIN', 'BEGIN_FRAME', 'BEGIN_PARTITION', 'BERNOULLI', 'BETWEEN', 'BIGINT', 'BINARY',
+                'BLOB', 'BOOL', 'BOOLEAN', 'BOTH', 'BREADTH', 'BREAK', 'BY', 'CALL', 'CALLED', 'CARDINALITY', 'CASCADE',
+                'CASCADED', 'CASE', 'CAST', 'CATALOG_NAME', 'CEIL', 'CEILING', 'CHAIN', 'CHAR', 'CHAR_LENGTH',
+                'CHARACTER', 'CHARACTER_LENGTH', 'CHARACTER_SET_CATALOG', 'CHARACTER_SET_NAME', 'CHARACTER_SET_SCHEMA',
+                'CHARACTERISTICS', 'CHARACTERS', 'CHECK', 'CLASS_ORIGIN', 'CLOB', 'CLOSE', 'COALESCE', 'COBOL',
+                'COLLATE', 'COLLATION', 'COLLATION_CATALOG', 'COLLATION_NAME', 'COLLATION_SCHEMA', 'COLLECT', 'COLUMN',
+                'COLUMN_NAME', 'COMMAND_FUNCTION', 'COMMAND_FUNCTION_CODE', 'COMMIT', 'COMMITTED', 'CONDITION',
+                'CONDITION_NUMBER', 'CONNECT', 'CONNECTION', 'CONNECTION_NAME', 'CONST', 'CONSTRAINT',
+                'CONSTRAINT_CATALOG', 'CONSTRAINT_NAME', 'CONSTRAINT_SCHEMA', 'CONSTRAINTS', 'CONSTRUCTOR', 'CONTAINS',
+                'CONTINUE', 'CONTINUE', 'CONVERT', 'CORR', 'CORRESPONDING', 'COUNT', 'COVAR_POP', 'COVAR_SAMP',
+                'CREATE', 'CROSS', 'CUBE', 'CUME_DIST', 'CURRENT', 'CURRENT_CATALOG', 'CURRENT_DATE',
+                'CURRENT_DEFAULT_TRANSFORM_GROUP', 'CURRENT_PATHCURRENT_ROLE', 'CURRENT_TRANSFORM_GROUP_FOR_TYPE',
+                'CURRENT_USER', 'CURSOR', 'CURSOR_NAME', 'CYCLE', 'DATA', 'DATE', 'DATETIME_INTERVAL_CODE',
+                'DATETIME_INTERVAL_PRECISION', 'DAY', 'DEALLOCATE', 'DEC', 'DECIMAL', 'DECLARE', 'DEFAULT', 'DEFAULTS',
+                'DEFERRABLE', 'DEFERRED', 'DEFINED', 'DEFINER', 'DEGREE', 'DELETE', 'DENSE_RANK', 'DEPTH', 'DEREF',
+                'DERIVED', 'DESC', 'DESCRIBE', 'DESCRIPTOR', 'DETERMINISTIC', 'DIAGNOSTICS', 'DISCONNECT', 'DISPATCH',
+                'DISTINCT', 'DO', 'DOMAIN', 'DOUBLE', 'DROP', 'DYNAMIC', 'DYNAMIC_FUNCTION', 'DYNAMIC_FUNCTION_CODE',
+                'EACH', 'EDGE', 'ELEMENT', 'ELSE', 'END', 'END_FRAME', 'END_PARTITION', 'END-EXEC', 'ENFORCED', 'ENUM',
+                'EQUALS', 'ESCAPE', 'EVERY', 'EXCEPT', 'EXCLUDE', 'EXCLUDING', 'EXEC', 'EXECUTE', 'EXISTS', 'EXP',
+                'EXPRESSION', 'EXTERNAL', 'EXTRACT', 'FETCH', 'FILTER', 'FINAL', 'FIRST', 'FIRST_VALUE', 'FLAG',
+                'FLOAT', 'FLOOR', 'FOLLOWING', 'FOR', 'FOREACH', 'FOREIGN', 'FORTRAN', 'FOUND', 'FRAME_ROW', 'FREE',
+                'FROM', 'FULL', 'FUNCTION', 'FUSION', 'GENERAL', 'GENERATED', 'GET', 'GLOBAL', 'GO', 'GOTO', 'GRANT',
+                'GRANTED', 'GRAPH', 'GROUP', 'GROUPING', 'GROUPS', 'HAVING', 'HIERARCHY', 'HOLD', 'HOOK', 'HOUR',
+                'IDENTITY', 'IF', 'IGNORE', 'IMMEDIATE', 'IMMEDIATELY', 'IMPLEMENTATION', 'IMPORT', 'IN', 'INCLUDE',
+                'INCLUDING', 'INCREMENT', 'INDICATOR', 'INITIALLY', 'INNER', 'INOUT', 'INPUT', 'INSENSITIVE', 'INSERT',
+                'INSTANCE', 'INSTANTIABLE', 'INSTEAD', 'INT', 'INTEGER', 'INTERSECT', 'INTERSECTION', 'INTERVAL',
+                'INTO', 'INVOKER', 'IS', 'ISOLATION', 'JOIN', 'KEY', 'KEY_MEMBER', 'KEY_TYPE', 'LAG', 'LANGUAGE',
+                'LARGE', 'LAST', 'LAST_VALUE', 'LATERAL', 'LEAD', 'LEADING', 'LEFT', 'LENGTH', 'LEVEL', 'LIKE',
+                'LIKE_REGEX', 'LIST', 'LN', 'LOCAL', 'LOCALTIME', 'LOCALTIMESTAMP', 'LOCATOR', 'LOWER', 'MAP', 'MATCH',
+                'MATCHED', 'MAX', 'MAXVALUE', 'MEMBER', 'MERGE', 'MESSAGE_LENGTH', 'MESSAGE_OCTET_LENGTH',
+                'MESSAGE_TEXT', 'METHOD', 'MIN', 'MINUTE', 'MINVALUE', 'MOD', 'MODIFIES', 'MODULE', 'MONTH', 'MORE',
+                'MULTISET', 'MUMPS', 'NAME', 'NAMES', 'NAMESPACE', 'NATIONAL', 'NATURAL', 'NCHAR', 'NCLOB', 'NESTING',
+                'NEW', 'NEXT', 'NFC', 'NFD', 'NFKC', 'NFKD', 'NO', 'NONE', 'NORMALIZE', 'NORMALIZED', 'NOT',
+                'NTH_VALUE', 'NTILE', 'NULL', 'NULLABLE', 'NULLIF', 'NULLS', 'NUMBER', 'NUMERIC', 'NVARCHAR', 'OBJECT',
+                'OCCURRENCES_REGEX', 'OCTET_LENGTH', 'OCTETS', 'OF', 'OFFSET', 'OLD', 'ON', 'ONLY', 'OPEN', 'OPTION',
+                'OPTIONS', 'OR', 'ORDER', 'ORDERING', 'ORDINALITY', 'OTHERS', 'OUT', 'OUTER', 'OUTPUT', 'OVER',
+                'OVERLAPS', 'OVERLAY', 'OVERRIDING', 'PAD', 'PARAMETER', 'PARAMETER_MODE', 'PARAMETER_NAME',
+                'PARAMETER_ORDINAL_POSITION', 'PARAMETER_SPECIFIC_CATALOG', 'PARAMETER_SPECIFIC_NAME',
+                'PARAMETER_SPECIFIC_SCHEMA', 'PARTIAL', 'PARTITION', 'PASCAL', 'PATH', 'PERCENT', 'PERCENT_RANK',
+                'PERCENTILE_CONT', 'PERCENTILE_DISC', 'PERIOD', 'PERSISTENT', 'PLACING', 'PLI', 'PORTION', 'POSITION',
+                'POSITION_REGEX', 'POWER', 'PRECEDES', 'PRECEDING', 'PRECISION', 'PREPARE', 'PRESERVE', 'PRIMARY',
+                'PRIOR', 'PRIVILEGES', 'PROCEDURE', 'PUBLIC', 'RANGE', 'RANK', 'READ', 'READS', 'REAL', 'RECURSIVE',
+                'REF', 'REFERENCES', 'REFERENCING', 'REGR_AVGX', 'REGR_AVGY', 'REGR_COUNT', 'REGR_INTERCEPT', 'REGR_R2',
+                'REGR_SLOPE', 'REGR_SXX', 'REGR_SXY', 'REGR_SYY', 'RELATIVE', 'RELEASE', 'REPEATABLE', 'RESPECT',
+                'RESTART', 'RESTRICT', 'RESULT', 'RETURN', 'RETURNED_CARDINALITY', 'RETURNED_LENGTH',
+                'RETURNED_OCTET_LENGTH', 'RETURNED_SQLSTATE', 'RETURNS', 'REVOKE', 'RIGHT', 'ROLE', 'ROLLBACK',
+                'ROLLUP', 'ROUTINE', 'ROUTINE_CATALOG', 'ROUTINE_NAME', 'ROUTINE_SCHEMA', 'ROW', 'ROW_COUNT',
+                'ROW_NUMBER', 'ROWS', 'SAVEPOINT', 'SCALE', 'SCHEMA', 'SCHEMA_NAME', 'SCOPE', 'SCOPE_CATALOG',
+                'SCOPE_NAME', 'SCOPE_SCHEMA', 'SCROLL', 'SEARCH', 'SECOND', 'SECTION', 'SECURITY', 'SELECT', 'SELF',
+                'SENSITIVE', 'SEQUENCE', 'SERIALIZABLE', 'SERVER_NAME', 'SESSION', 'SESSION_USER', 'SET', 'SETS',
+                'SIMILAR', 'SIMPLE', 'SIZE', 'SMALLINT', 'SOME', 'SOURCE', 'SPACE', 'SPECIFIC', 'SPECIFIC_NAME',
+                'SPECIFICTYPE', 'SQL', 'SQLEXCEPTION', 'SQLSTATE', 'SQLWARNING', 'SQRT', 'ST_CIRCULARSTRING',
+                'ST_COMPOUNDCURVE', 'ST_CURVE', 'ST_CURVEPOLYGON', 'ST_GEOMCOLLECTION', 'ST_GEOMETRY', 'ST_LINESTRING',
+                'ST_MULTICURVE', 'ST_MULTILINESTRING', 'ST_MULTIPOINT', 'ST_MULTIPOLYGON', 'ST_MULTISURFACE',
+                'ST_POINT', 'ST_POLYGON', 'ST_SURFACE', 'START', 'STATE', 'STATEMENT', 'STATIC', 'STDDEV_POP',
+                'STDDEV_SAMP', 'STRUCTURE', 'STYLE', 'SUBCLASS_ORIGIN', 'SUBMULTISET', 'SUBSTRING', 'SUBSTRING_REGEX',
+                'SUCCEEDS', 'SUM', 'SWITCH', 'SYMMETRIC', 'SYSTEM', 'SYSTEM_TIME', 'SYSTEM_USER', 'TABLE', 'TABLE_NAME',
+                'TABLESAMPLE', 'TEMPORARY', 'TEXT', 'THEN', 'TIES', 'TIME', 'TIMESTAMP', 'TIMEZONE_HOUR',
+                'TIMEZONE_MINUTE', 'TO', 'TOP_LEVEL_COUNT', 'TRAILING', 'TRANSACTION', 'TRANSACTION_ACTIVE',
+                'TRANSACTIONS_COMMITTED', 'TRANSACTIONS_ROLLED_BACK', 'TRANSFORM', 'TRANSFORMS', 'TRANSLATE',
+                'TRANSLATE_REGEX', 'TRANSLATION', 'TREAT', 'TREE', 'TRIGGER', 'TRIGGER_CATALOG', 'TRIGGER_NAME',
+                'TRIGGER_SCHEMA', 'TRIM', 'TRIM_ARRAY', 'TRUNCATE', 'TYPE', 'UESCAPE', 'UNBOUNDED', 'UNCOMMITTED',
+                'UNDER', 'UNION', 'UNIQUE', 'UNKNOWN', 'UNNAMED', 'UNNEST', 'UPDATE', 'UPPER', 'USAGE', 'USER',
+                'USER_DEFINED_TYPE_CATALOG', 'USER_DEFINED_TYPE_CODE', 'USER_DEFINED_TYPE_NAME',
+                'USER_DEFINED_TYPE_SCHEMA', 'USING', 'VALUE', 'VALUE_OF', 'VALUES', 'VAR_POP', 'VAR_SAMP', 'VARBINARY',
+                'VARCHAR', 'VARYING', 'VERSIONING', 'VERTEX', 'VIEW', 'VOID', 'WHEN', 'WHENEVER', 'WHERE', 'WHILE',
+                'WIDTH_BUCKET', 'WINDOW', 'WITH', 'WITHIN', 'WITHOUT', 'WORK', 'WRITE', 'YEAR', 'ZONE', 'FALSE', 'TRUE']
+teradata_rsv = ['ABORT', 'ABORTSESSION', 'ABS', 'ABSOLUTE', 'ACCESS_LOCK', 'ACCOUNT', 'ACOS', 'ACOSH', 'ACTION', 'ADD',
+                'ADD_MONTHS', 'ADMIN', 'AFTER', 'AGGREGATE', 'ALIAS', 'ALL', 'ALLOCATE', 'ALTER', 'AMP', 'AND',
+                'ANSIDATE', 'ANY', 'ARE', 'ARRAY', 'AS', 'ASC', 'ASIN', 'ASINH', 'ASSERTION', 'AT', 'ATAN', 'ATAN2',
+                'ATANH', 'ATOMIC', 'AUTHORIZATION', 'AVE', 'AVERAGE', 'AVG', 'BEFORE', 'BEGIN', 'BETWEEN', 'BINARY',
+                'BIT', 'BLOB', 'BOOLEAN', 'BOTH', 'BREADTH', 'BT', 'BUT', 'BY', 'BYTE', 'BYTEINT', 'BYTES', 'CALL',
+                'CASCADE', 'CASCADED', 'CASE', 'CASE_N', 'CASESPECIFIC', 'CAST', 'CATALOG', 'CD', 'CHAR', 'CHAR_LENGTH',
+                'CHAR2HEXINT', 'CHARACTER', 'CHARACTER_LENGTH', 'CHARACTERS', 'CHARS', 'CHECK', 'CHECKPOINT', 'CLASS',
+                'CLOB', 'CLOSE', 'CLUSTER', 'CM', 'COALESCE', 'COLLATE', 'COLLATION', 'COLLECT', 'COLUMN', 'COMMENT',
+                'COMMIT', 'COMPLETION', 'COMPRESS', 'CONNECT', 'CONNECTION', 'CONSTRAINT', 'CONSTRAINTS', 'CONSTRUCTOR',
+                'CONTINUE', 'CONVERT_TABLE_HEADER', 'CORR', 'CORRESPONDING', 'COS', 'COSH', 'COUNT', 'COVAR_POP',
+                'COVAR_SAMP', 'CREATE', 'CROSS', 'CS', 'CSUM', 'CT', 'CUBE', 'CURRENT', 'CURRENT_DATE', 'CURRENT_PATH',
+                'CURRENT_ROLE', 'CURRENT_TIME', 'CURRENT_TIMESTAMP', 'CURRENT_USER', 'CURSOR', 'CV', 'CYCLE', 'DATA',
+                'DATABASE', 'DATABLOCKSIZE', 'DATE', 'DATEFORM', 'DAY', 'DEALLOCATE', 'DEC', 'DECIMAL', 'DECLARE',
+                'DEFAULT', 'DEFERRABLE', 'DEFERRED', 'DEGREES', 'DEL', 'DELETE', 'DEPTH', 'DEREF', 'DESC', 'DESCRIBE',
+                'DESCRIPTOR', 'DESTROY', 'DESTRUCTOR', 'DETERMINISTIC', 'DIAGNOSTIC', 'DIAGNOSTICS', 'DICTIONARY',
+                'DISABLED', 'DISCONNECT', 'DISTINCT', 'DO', 'DOMAIN', 'DOUBLE', 'DROP', 'DUAL', 'DUMP', 'DYNAMIC',
+                'EACH', 'ECHO', 'ELSE', 'ELSEIF', 'ENABLED', 'END', 'END-EXEC', 'EQ', 'EQUALS', 'ERROR', 'ERRORFILES',
+                'ERRORTABLES', 'ESCAPE', 'ET', 'EVERY', 'EXCEPT', 'EXCEPTION', 'EXEC', 'EXECUTE', 'EXISTS', 'EXIT',
+                'EXP', 'EXPLAIN', 'EXTERNAL', 'EXTRACT', 'FALLBACK', 'FASTEXPORT', 'FETCH', 'FIRST', 'FLOAT', 'FOR',
+                'FOREIGN', 'FORMAT', 'FOUND', 'FREE', 'FREESPACE', 'FROM', 'FULL', 'FUNCTION', 'GE', 'GENERAL',
+                'GENERATED', 'GET', 'GIVE', 'GLOBAL', 'GO', 'GOTO', 'GRANT', 'GRAPHIC', 'GROUP', 'GROUPING', 'GT',
+                'HANDLER', 'HASH', 'HASHAMP', 'HASHBAKAMP', 'HASHBUCKET', 'HASHROW', 'HAVING', 'HELP', 'HOST', 'HOUR',
+                'IDENTITY', 'IF', 'IGNORE', 'IMMEDIATE', 'IN', 'INCONSISTENT', 'INDEX', 'INDICATOR', 'INITIALIZE',
+                'INITIALLY', 'INITIATE', 'INNER', 'INOUT', 'INPUT', 'INS', 'INSERT', 'INSTEAD', 'INT', 'INTEGER',
+                'INTEGERDATE', 'INTERSECT', 'INTERVAL', 'INTO', 'IS', 'ISOLATION', 'ITERATE', 'JOIN', 'JOURNAL', 'KEY',
+                'KURTOSIS', 'LANGUAGE', 'LARGE', 'LAST', 'LATERAL', 'LE', 'LEADING', 'LEAVE', 'LEFT', 'LESS', 'LEVEL',
+                'LIKE', 'LIMIT', 'LN', 'LOADING', 'LOCAL', 'LOCALTIME', 'LOCALTIMESTAMP', 'LOCATOR', 'LOCK', 'LOCKING',
+                'LOG', 'LOGGING', 'LOGON', 'LONG', 'LOOP', 'LOWER', 'LT', 'MACRO', 'MAP', 'MATCH', 'MAVG', 'MAX',
+                'MAXIMUM', 'MCHARACTERS', 'MDIFF', 'MERGE', 'MIN', 'MINDEX', 'MINIMUM', 'MINUS', 'MINUTE', 'MLINREG',
+                'MLOAD', 'MOD', 'MODE', 'MODIFIES', 'MODIFY', 'MODULE', 'MONITOR', 'MONRESOURCE', 'MONSESSION', 'MONTH',
+                'MSUBSTR', 'MSUM', 'MULTISET', 'NAMED', 'NAMES', 'NATIONAL', 'NATURAL', 'NCHAR', 'NCLOB', 'NE', 'NEW',
+                'NEW_TABLE', 'NEXT', 'NO', 'NONE', 'NOT', 'NOWAIT', 'NULL', 'NULLIF', 'NULLIFZERO', 'NUMERIC', 'OBJECT',
+                'OBJECTS', 'OCTET_LENGTH', 'OF', 'OFF', 'OLD', 'OLD_TABLE', 'ON', 'ONLY', 'OPEN', 'OPERATION', 'OPTION',
+                'OR', 'ORDER', 'ORDINALITY', 'OUT', 'OUTER', 'OUTPUT', 'OVER', 'OVERLAPS', 'OVERRIDE', 'PAD',
+                'PARAMETER', 'PARAMETERS', 'PARTIAL', 'PASSWORD', 'PATH', 'PERCENT', 'PERCENT_RANK', 'PERM',
+                'PERMANENT', 'POSITION', 'POSTFIX', 'PRECISION', 'PREFIX', 'PREORDER', 'PREPARE', 'PRESERVE', 'PRIMARY',
+                'PRIOR', 'PRIVATE', 'PRIVILEGES', 'PROCEDURE', 'PROFILE', 'PROPORTIONAL', 'PROTECTION', 'PUBLIC',
+                'QUALIFIED', 'QUALIFY', 'QUANTILE', 'RADIANS', 'RANDOM', 'RANGE_N', 'RANK', 'READ', 'READS', 'REAL',
+                'RECURSIVE', 'REF', 'REFERENCES', 'REFERENCING', 'REGR_AVGX', 'REGR_AVGY', 'REGR_COUNT',
+                'REGR_INTERCEPT', 'REGR_R2', 'REGR_SLOPE', 'REGR_SXX', 'REGR_SXY', 'REGR_SYY', 'RELATIVE', 'RELEASE',
+                'RENAME', 'REPEAT', 'REPLACE', 'REPLICATION', 'REPOVERRIDE', 'REQUEST', 'RESTART', 'RESTORE',
+                'RESTRICT', 'RESULT', 'RESUME', 'RET', 'RETRIEVE', 'RETURN', 'RETURNS', 'REVALIDATE', 'REVOKE', 'RIGHT',
+                'RIGHTS', 'ROLE', 'ROLLBACK', 'ROLLFORWARD', 'ROLLUP', 'ROUTINE', 'ROW', 'ROW_NUMBER', 'ROWID', 'ROWS',
+                'SAMPLE', 'SAMPLEID', 'SAVEPOINT', 'SCHEMA', 'SCOPE', 'SCROLL', 'SEARCH', 'SECOND', 'SECTION', 'SEL',
+                'SELECT', 'SEQUENCE', 'SESSION', 'SESSION_USER', 'SET', 'SETRESRATE', 'SETS', 'SETSESSRATE', 'SHOW',
+                'SIN', 'SINH', 'SIZE', 'SKEW', 'SMALLINT', 'SOME', 'SOUNDEX', 'SPACE', 'SPECIFIC', 'SPECIFICTYPE',
+                'SPOOL', 'SQL', 'SQLEXCEPTION', 'SQLSTATE', 'SQLTEXT', 'SQLWARNING', 'SQRT', 'SS', 'START', 'STARTUP',
+                'STATE', 'STATEMENT', 'STATIC', 'STATISTICS', 'STDDEV_POP', 'STDDEV_SAMP', 'STEPINFO', 'STRING_CS',
+                'STRUCTURE', 'SUBSCRIBER', 'SUBSTR', 'SUBSTRING', 'SUM', 'SUMMARY', 'SUSPEND', 'SYSTEM_USER', 'TABLE',
+                'TAN', 'TANH', 'TBL_CS', 'TEMPORARY', 'TERMINATE', 'THAN', 'THEN', 'THRESHOLD', 'TIME', 'TIMESTAMP',
+                'TIMEZONE_HOUR', 'TIMEZONE_MINUTE', 'TITLE', 'TO', 'TRACE', 'TRAILING', 'TRANSACTION', 'TRANSLATE',
+                'TRANSLATE_CHK', 'TRANSLATION', 'TREAT', 'TRIGGER', 'TRIM', 'TYPE', 'UC', 'UNDEFINED', 'UNDER', 'UNDO',
+                'UNION', 'UNIQUE', 'UNKNOWN', 'UNNEST', 'UNTIL', 'UPD', 'UPDATE', 'UPPER', 'UPPERCASE', 'USAGE', 'USER',
+                'USING', 'VALUE', 'VALUES', 'VAR_POP', 'VAR_SAMP', 'VARBYTE', 'VARCHAR', 'VARGRAPHIC', 'VARIABLE',
+                'VARYING', 'VIEW', 'VOLATILE', 'WAIT', 'WHEN', 'WHENEVER', 'WHERE', 'WHILE', 'WIDTH_BUCKET', 'WITH',
+                'WITHOUT', 'WORK', 'WRITE', 'YEAR', 'ZEROIFNULL', 'ZONE / ANSI SQL-99', 'FALSE', 'TRUE']
+
+#   Reserved word lists by database type, in the bit order of the index
+rsv_dict = {'SQL': sql_rsv, 'ALTIBASE': altibase_rsv, 'Dameng': dameng_rsv, 'DB2': db2_rsv, 'Oracle': oracle_rsv,
+            'PostgresSQL': postgressql_rsv, 'SAP HANA': sap_hana_rsv, 'Teradata': teradata_rsv, 'ESRI GDB': sql_rsv}
+rsv_types = list(rsv_dict)
+
+
+#   defined functions
+#   Function that builds the reserved word index, {word: bitmask of the database types that reserve it}
+def build_rsv_index(word_lists):
+    index = {}
+    for bit, db_type in enumerate(word_lists):
+        for word in word_lists[db_type]:
+            index[word] = index.get(word, 0) | 1 << bit
+    return index
+
+
+rsv_index = build_rsv_index(rsv_dict)
+
+
+#   Function that returns the bitmask of the database types that reserve a name, 0 for none
+def rsv_mask(name):
+    return rsv_index.get(name.upper(), 0)
+
+
+#   Function that returns the bit of a database type in the index
+def rsv_bit(db_type):
+    return 1 << rsv_types.index(db_type)
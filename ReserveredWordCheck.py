@@ -1,114 +1,100 @@
-#   ----------------------------------------------------------------
-#   Name:           ReservedWordCheck.py
-#   Created by:     Neil Rose
-#   Created on:     4/28/2021
-#   Modified by:
-#   Modified on:
-#   Description:    Tool that checks reserved words
-#   ----------------------------------------------------------------
-
-#   import modules
-import arcpy
-import datetime
-import os
-import time
-from ReservedWords import sql_rsv, altibase_rsv, dameng_rsv, \
-    db2_rsv, oracle_rsv, postgressql_rsv, sap_hana_rsv, teradata_rsv
-
-
-#   defined functions
-#   Function for creating output messages
-def note(message):
-    return arcpy.AddMessage(str(message))
-
-
-#   Set environments
-unc_path = "//app-gisdata/gisdata/"
-prj_dir = r'{0}\GIS\SystemsArchitecture\DataAudit2021\DataAuditTools\Dependencies'
-arcpy.env.workspace = prj_dir
-arcpy.env.overwriteOutput = True
-
-#   Set inputs
-conn_file = arcpy.GetParameterAsText(0)
-conn_base = os.path.basename(conn_file)
-db_type = arcpy.GetParameterAsText(1)
-report_loc = arcpy.GetParameterAsText(2)
-
-#   Global variables
-fn_count = 0
-fn_errors = 0
-#   Reserve dictionary
-rsv_dict = {'SQL': sql_rsv, 'ALTIBASE': altibase_rsv, 'Dameng': dameng_rsv, 'DB2': db2_rsv, 'Oracle': oracle_rsv,
-            'PostgresSQL': postgressql_rsv, 'SAP HANA': sap_hana_rsv, 'Teradata': teradata_rsv, 'ESRI GDB': sql_rsv}
-
-for k, v in rsv_dict.items():
-    if k == db_type:
-        rsv_list = v
-
-#   Main script
-#   Start timer
-start = time.time()
-start_time = datetime.datetime.today().time()
-note('ReservedWordCheck.py beginning at {0}...'.format(str(start_time)))
-#   Begin checking reserved words
-arcpy.env.workspace = conn_file
-
-report_file = open(os.path.join(report_loc, '{0}_{1}_Check.txt'.format(conn_base, db_type)), 'w')
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} features...'.format(os.path.basename(conn_base)))
-note('-------------------------------------------------------------------')
-for fc in sorted(arcpy.ListFeatureClasses()):
-    note('Checking the {0} Feature Class.'.format(fc))
-    for fn in (arcpy.ListFields(fc)):
-        fn_count += 1
-        if fn.name.upper() in rsv_list:
-            fn_errors += 1
-            report_file.write('fc: {0} - '
-                              'Feature Class: {1} - '
-                              'Field Name: {2} '
-                              'is a {3} Reserved Word.\n'.format(conn_base, fc, fn.name, db_type))
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} tables...'.format(conn_base))
-note('-------------------------------------------------------------------')
-for tbl in sorted(arcpy.ListTables()):
-    note('Checking the {0} Table.'.format(tbl))
-    for fn in (arcpy.ListFields(tbl)):
-        fn_count += 1
-        if fn.name.upper() in rsv_list:
-            fn_errors += 1
-            report_file.write('tbl: {0} - '
-                              'Table: {1} - '
-                              'Field Name: {2} '
-                              'is a {3} Reserved Word.\n'.format(conn_base, tbl, fn.name, db_type))
-
-datasets = sorted(arcpy.ListDatasets())
-for ds in datasets:
-    note('-------------------------------------------------------------------')
-    note('Checking the {0} Feature Dataset...'.format(ds))
-    note('-------------------------------------------------------------------')
-    for fc in sorted(arcpy.ListFeatureClasses(feature_dataset=ds)):
-        note('Checking the {0} Feature Class.'.format(fc))
-        for fn in (arcpy.ListFields(fc)):
-            fn_count += 1
-            if fn.name.upper() in rsv_list:
-                fn_errors += 1
-                report_file.write('fds: {0} - '
-                                  'Feature Dataset: {1} - '
-                                  'Feature Class: {2} - '
-                                  'Field Name: {3} '
-                                  'is a {4} Reserved Word.\n'.format(conn_base, ds, fc, fn.name, db_type))
-
-report_file.write('\n\nField Name Reserved Word Errors: {0}\n'
-                  'Field Name Count: {1}\n'
-                  'Percent Reserved Word Error: {2}%'.format(str(fn_errors), str(fn_count), str(round((fn_errors/fn_count)*100, 2))))
-
-report_file.close()
-note('All field names have been verified. Please see results in the generated txt file.')
-#   End timer
-end = time.time()
-end_time = datetime.datetime.today().time()
-#   Timer math
-note('ReservedWordCheck.py completed at {0}...'.format(str(end_time)))
-note('It took {0} minutes to complete...'.format(str(round(((end - start)/60), 4))))
+#   ----------------------------------------------------------------
+#   Name:           ReservedWordCheck.py
+#   Created by:     Neil Rose
+#   Created on:     4/28/2021
+#   Modified by:    GIS Systems Architecture
+#   Modified on:    10/18/2026
+#   Description:    Tool and audit check that checks reserved words
+#                   against every database type in one pass and
+#                   writes a field by database type conflict matrix
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import csv
+import datetime
+import os
+from Audit import audit_context, finding_line, option, register_check, report_finding, run_check
+from ReservedWords import rsv_bit, rsv_mask, rsv_types
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that starts the field list of the check
+#   field_masks holds the bitmask of the database types that reserve the name of each field,
+#   [dataset type, fds, dataset, field, mask]
+def start_check(context):
+    return {'fn_count': 0, 'field_masks': []}
+
+
+#   Function that records which database types reserve the name of a field
+def visit_field(state, context, fds, dataset, fn):
+    state['fn_count'] += 1
+    state['field_masks'].append([dataset.datasetType, fds, dataset.name, fn.name, rsv_mask(fn.name)])
+
+
+#   Function that writes the report of one database type
+def write_type_report(state, context, report_type):
+    conn_base = context.conn_base
+    fn_count = state['fn_count']
+    type_bit = rsv_bit(report_type)
+    fn_errors = 0
+    report_file = open(os.path.join(context.report_loc, '{0}_{1}_Check.txt'.format(conn_base, report_type)), 'w')
+    for dataset_type, fds_name, ds_name, fn_name, mask in state['field_masks']:
+        if not mask & type_bit:
+            continue
+        fn_errors += 1
+        report_file.write(finding_line(report_finding(context, 'ReserveredWordCheck', fds_name, ds_name, fn_name,
+                                                      'ReservedWord', 'is a {0} Reserved Word.'.format(report_type),
+                                                      'Error'), dataset_type))
+
+    report_file.write('\n\nField Name Reserved Word Errors: {0}\n'
+                      'Field Name Count: {1}\n'
+                      'Percent Reserved Word Error: {2}%'.format(str(fn_errors), str(fn_count),
+                                                                str(round((fn_errors/fn_count)*100, 2))))
+    report_file.close()
+
+
+#   Function that writes the report of each database type and the conflict matrix
+#   db_type is one database type, or All for every one
+def finish_check(state, context, dataset_results):
+    db_type = option(context, 'db_type', 'All')
+    report_types = rsv_types if db_type == 'All' else [db_type]
+    for report_type in report_types:
+        write_type_report(state, context, report_type)
+
+    #   Field by database type conflict matrix of every field that is reserved somewhere
+    with open(os.path.join(context.report_loc, '{0}_ReservedWord_Matrix.csv'.format(context.conn_base)), 'w',
+              newline='') as matrix_file:
+        matrix = csv.writer(matrix_file)
+        matrix.writerow(['Feature Dataset', 'Dataset', 'Field'] + rsv_types)
+        for dataset_type, fds_name, ds_name, fn_name, mask in state['field_masks']:
+            if mask:
+                matrix.writerow([fds_name or '', ds_name, fn_name] +
+                                ['X' if mask & rsv_bit(matrix_type) else '' for matrix_type in rsv_types])
+
+
+register_check('ReserveredWordCheck', start_check, visit_field=visit_field, finish=finish_check)
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    conn_file = arcpy.GetParameterAsText(0)
+    db_type = arcpy.GetParameterAsText(1)
+    report_loc = arcpy.GetParameterAsText(2)
+    catalog_file = arcpy.GetParameterAsText(3)
+
+    start_time = datetime.datetime.today().time()
+    note('ReservedWordCheck.py beginning at {0}...'.format(str(start_time)))
+    run_check(audit_context(conn_file, report_loc, catalog_file, {'db_type': db_type}), 'ReserveredWordCheck')
+    note('All field names have been verified. Please see results in the generated txt and csv files.')
+    end_time = datetime.datetime.today().time()
+    note('ReservedWordCheck.py completed at {0}...'.format(str(end_time)))
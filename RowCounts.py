@@ -0,0 +1,119 @@
+#   ----------------------------------------------------------------
+#   Name:           RowCounts.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that answers how many rows the catalog
+#                   feature classes and tables hold. Emptiness is
+#                   answered by reading at most one row, approximate
+#                   counts and sizes come from the DBMS statistics in
+#                   one query, and exact counts use Get Count only
+#                   when they are asked for.
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+from collections import namedtuple
+from Catalog import sde_executor, workspace_dialect
+from Instrument import span
+from Pushdown import table_name
+
+
+#   Global variables
+#   rows and sizeBytes are None when the provider does not know them, source names where rows came from
+RowCount = namedtuple('RowCount', ['hasRows', 'rows', 'sizeBytes', 'source'])
+
+#   Row count and size of every table from the DBMS statistics, by dialect
+#   The counts are as fresh as the last statistics update, PostgreSQL reports -1 for a table never analyzed
+table_stats_sql = {'SQL Server': 'SELECT s.name, t.name, SUM(p.rows), SUM(u.pages) * 8192 '
+                                 'FROM sys.tables t JOIN sys.schemas s ON t.schema_id = s.schema_id '
+                                 'JOIN sys.partitions p ON p.object_id = t.object_id '
+                                 'JOIN (SELECT container_id, SUM(total_pages) AS pages FROM sys.allocation_units '
+                                 'GROUP BY container_id) u ON u.container_id = p.partition_id '
+                                 'WHERE p.index_id IN (0, 1) GROUP BY s.name, t.name',
+                   'Oracle': 'SELECT OWNER, TABLE_NAME, NUM_ROWS, NUM_ROWS * AVG_ROW_LEN FROM ALL_TABLES',
+                   'PostgreSQL': "SELECT n.nspname, c.relname, c.reltuples, pg_total_relation_size(c.oid) "
+                                 "FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+                                 "WHERE c.relkind IN ('r', 'p')"}
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that tells whether a cursor over one field of a dataset returns a row, reading at most one
+def cursor_has_row(name, field):
+    with arcpy.da.SearchCursor(name, [field]) as cursor:
+        for row in cursor:
+            return True
+    return False
+
+
+#   Function that tells whether a dataset holds a row by reading at most one
+#   Tables without an ObjectID, views and unregistered tables for instance, cannot be read with OID@. They are
+#   probed through their first field, or counted with Get Count when they have no fields to read.
+def probe_rows(name):
+    with span('Probe', 'arcpy', dataset=name):
+        try:
+            return cursor_has_row(name, 'OID@')
+        except RuntimeError:
+            fields = arcpy.ListFields(name)
+            if fields:
+                return cursor_has_row(name, fields[0].name)
+            return int(arcpy.GetCount_management(name)[0]) > 0
+
+
+#   Function that reads {OWNER.TABLE: [rows, size in bytes]} from the DBMS statistics in one query
+#   Returns an empty dict for workspaces without statistics or when the query fails
+def read_table_stats(conn_file):
+    dialect = workspace_dialect(conn_file)
+    if dialect not in table_stats_sql:
+        return {}
+    try:
+        rows = sde_executor(conn_file)(table_stats_sql[dialect])
+    except Exception as e:
+        note('DBMS statistics could not be read ({0}), only emptiness will be reported...'.format(e))
+        return {}
+    table_stats = {}
+    for owner, table, row_count, size in rows:
+        row_count = int(row_count) if row_count is not None and row_count >= 0 else None
+        table_stats['{0}.{1}'.format(owner, table).upper()] = [row_count, int(size) if size is not None else None]
+    return table_stats
+
+
+#   Function that answers emptiness with a one row probe for every dataset
+def probe_counts(conn_file, names):
+    return dict((name, RowCount(probe_rows(name), None, None, 'Probe')) for name in names)
+
+
+#   Function that adds the approximate counts and sizes of the DBMS statistics to the probes
+#   Emptiness still comes from the probe so stale statistics cannot report a table as empty
+def statistics_counts(conn_file, names):
+    table_stats = read_table_stats(conn_file)
+    counts = {}
+    for name in names:
+        row_count, size = table_stats.get(table_name(name).upper(), [None, None])
+        counts[name] = RowCount(probe_rows(name), row_count, size, 'Statistics' if row_count is not None else 'Probe')
+    return counts
+
+
+#   Function that counts every row of every dataset with Get Count
+def exact_counts(conn_file, names):
+    counts = {}
+    for name in names:
+        with span('GetCount', 'arcpy', dataset=name):
+            row_count = int(arcpy.GetCount_management(name)[0])
+        counts[name] = RowCount(row_count > 0, row_count, None, 'Exact')
+    return counts
+
+
+#   Row count provider of each count mode
+count_providers = {'Probe': probe_counts, 'Statistics': statistics_counts, 'Exact': exact_counts}
+
+
+#   Function used by the checks to get {dataset name: RowCount} with the provider of a count mode
+def row_counts(conn_file, names, count_mode='Probe'):
+    return count_providers[count_mode](conn_file, names)
@@ -0,0 +1,108 @@
+#   ----------------------------------------------------------------
+#   Name:           RuleBenchmark.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Script that times the row rules on synthetic
+#                   text columns with the original per-cell loop,
+#                   the row engine and the batch engine, and checks
+#                   that the three agree. Run it from the ArcGIS Pro
+#                   python environment:
+#                   python RuleBenchmark.py [rows] [fields] [batch]
+#   ----------------------------------------------------------------
+
+#   import modules
+import numpy
+import random
+import re
+import sys
+import time
+from AttributeScan import array_runs, evaluate_columns, evaluate_rows, null_mask, null_values
+from OidRuns import compress_oids
+
+#   Global variables
+rules = ['Null', 'Blank', 'ExtraSpaces']
+samples = [None, '', 'fine value', 'two  spaces', ' lead', 'trail ', 'Main Street', 'N 5TH AVE', 'tab\tx']
+weights = [5, 5, 30, 3, 2, 2, 30, 20, 3]
+
+
+#   defined functions
+#   Function that builds the synthetic rows, every field is a nullable text field
+def build_rows(row_count, field_count):
+    rnd = random.Random(0)
+    return [tuple([oid] + rnd.choices(samples, weights, k=field_count)) for oid in range(1, row_count + 1)]
+
+
+#   Function that runs the rules the way the original checks did, one field at a time with a while loop
+def original_loop(rows, field_count):
+    results = dict((rule, [[], 0]) for rule in rules)
+    for row in rows:
+        field_len = field_count
+        row_counter = 1
+        while row_counter <= field_len:
+            value = row[row_counter]
+            if value is None:
+                results['Null'][0].append(row[0])
+                results['Null'][1] += 1
+            if value == '':
+                results['Blank'][0].append(row[0])
+                results['Blank'][1] += 1
+            if type(value) == str and value != re.sub(' +', ' ', value):
+                results['ExtraSpaces'][0].append(row[0])
+                results['ExtraSpaces'][1] += 1
+            row_counter += 1
+    return dict((rule, [compress_oids(results[rule][0]), results[rule][1]]) for rule in rules)
+
+
+#   Function that runs the rules with the batch engine on columns already read into arrays
+def batch_engine(batches, fields):
+    matches = dict((rule, []) for rule in rules)
+    for oids, columns in batches:
+        for rule, name, rule_oids in evaluate_columns(oids, columns, [(rule, fields) for rule in rules]):
+            matches[rule].append(rule_oids)
+    return dict((rule, [array_runs(numpy.unique(numpy.concatenate(matches[rule]))) if matches[rule] else [],
+                        sum(len(rule_oids) for rule_oids in matches[rule])]) for rule in rules)
+
+
+#   Function that splits the rows into the column batches read_batches would return
+def build_batches(rows, fields, batch_size):
+    batches = []
+    for start in range(0, len(rows), batch_size):
+        chunk = rows[start:start + batch_size]
+        oids = numpy.array([row[0] for row in chunk])
+        columns = {}
+        for i, name in enumerate(fields):
+            column = numpy.array([null_values['String'] if row[i + 1] is None else row[i + 1] for row in chunk])
+            columns[name] = [column, null_mask(column, null_values['String'])]
+        batches.append((oids, columns))
+    return batches
+
+
+#   Function that times a function and returns its result and the seconds it took
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+#   Main script
+row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+field_count = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+batch_size = int(sys.argv[3]) if len(sys.argv) > 3 else 50000
+fields = ['FIELD_{0}'.format(i) for i in range(field_count)]
+rows = build_rows(row_count, field_count)
+batches = build_batches(rows, fields, batch_size)
+positions = dict((rule, list(range(1, field_count + 1))) for rule in rules)
+
+original, original_time = timed(original_loop, rows, field_count)
+row, row_time = timed(evaluate_rows, rows, rules, positions, ['OID@'] + fields)
+batch, batch_time = timed(batch_engine, batches, fields)
+if not original == dict((rule, row[rule][:2]) for rule in rules) == batch:
+    raise ValueError('The engines returned different results.')
+
+cells = row_count * field_count
+print('{0} rows x {1} text fields, batches of {2} rows'.format(row_count, field_count, batch_size))
+for name, seconds in [('Original loop', original_time), ('Row engine', row_time), ('Batch engine', batch_time)]:
+    print('{0:<14}{1:>10.3f} s{2:>14,.0f} cells/s{3:>8.1f}x'.format(name, seconds, cells / seconds,
+                                                                   original_time / seconds))
@@ -1,104 +1,126 @@
-#   ----------------------------------------------------------------
-#   Name:           SpatialReferenceCheck.py
-#   Created by:     Neil Rose
-#   Created on:     5/3/2021
-#   Modified by:
-#   Modified on:
-#   Description:    Tool that checks all feature classes for
-#                   spatial reference
-#   ----------------------------------------------------------------
-
-#   import modules
-import arcpy
-import datetime
-import os
-import time
-
-
-#   defined functions
-#   Function for creating output messages
-def note(message):
-    return arcpy.AddMessage(str(message))
-
-
-#   Set environments
-unc_path = "//app-gisdata/gisdata/"
-prj_dir = r'{0}\GIS\SystemsArchitecture\DataAudit2021\DataAuditTools\Dependencies'
-arcpy.env.workspace = prj_dir
-arcpy.env.overwriteOutput = True
-
-#   Set inputs
-conn_file = arcpy.GetParameterAsText(0)
-conn_base = os.path.basename(conn_file)
-report_loc = arcpy.GetParameterAsText(1)
-wkt_srs = arcpy.GetParameterAsText(2)
-base_srs = arcpy.SpatialReference()
-base_srs.loadFromString(wkt_srs)
-
-#   Set global lists
-srs_list = []
-
-fc_count = 0
-fc_errors = 0
-
-#   Main script
-#   Start timer
-start = time.time()
-start_time = datetime.datetime.today().time()
-note('SpatialReferenceCheck.py beginning at {0}...'.format(str(start_time)))
-#   Begin checking spatial reference systems
-arcpy.env.workspace = conn_file
-
-report_file = open(os.path.join(report_loc, '{0}_SRS_Check.txt'.format(conn_base)), 'w')
-
-note('-------------------------------------------------------------------')
-note('Checking the top level {0} features...'.format(os.path.basename(conn_base)))
-note('-------------------------------------------------------------------')
-for fc in sorted(arcpy.ListFeatureClasses()):
-    fc_count += 1
-    note('Checking the {0} Feature Class.'.format(fc))
-    srs = arcpy.Describe(fc).spatialReference.name
-    srs_list.append(srs)
-    if wkt_srs not in [None, '', ' ']:
-        if srs != base_srs.name:
-            fc_errors += 1
-            report_file.write('fc: {0} - '
-                              'Feature Class: {1} - '
-                              'SRS: {2} does not match input\n'.format(conn_base, fc, srs))
-
-datasets = sorted(arcpy.ListDatasets())
-for ds in datasets:
-    note('-------------------------------------------------------------------')
-    note('Checking the {0} Feature Dataset...'.format(ds))
-    note('-------------------------------------------------------------------')
-    for fc in sorted(arcpy.ListFeatureClasses(feature_dataset=ds)):
-        fc_count += 1
-        note('Checking the {0} Feature Class.'.format(fc))
-        srs = arcpy.Describe(fc).spatialReference.name
-        srs_list.append(srs)
-        if wkt_srs not in [None, '', ' ']:
-            if srs != base_srs.name:
-                fc_errors += 1
-                report_file.write('fds: {0} - '
-                                  'Feature Dataset: {1} - '
-                                  'Feature Class: {2} - '
-                                  'SRS: {2} does not match input\n'.format(conn_base, ds, fc, srs))
-
-unique_srs = set(srs_list)
-
-for srs in unique_srs:
-    report_file.write('There are {0} instances of {1}\n'.format(srs_list.count(srs), srs))
-
-if wkt_srs not in [None, '', ' ']:
-    report_file.write('\n\nFeature Class SRS Errors: {0}\n'
-                      'Feature Class Count: {1}\n'
-                      'Percent SRS Error: {2}%'.format(str(fc_errors), str(fc_count), str(round((fc_errors/fc_count)*100, 2))))
-
-report_file.close()
-note('All spatial reference systems have been verified. Please see results in the generated txt file.')
-#   End timer
-end = time.time()
-end_time = datetime.datetime.today().time()
-#   Timer math
-note('SpatialReferenceCheck.py completed at {0}...'.format(str(end_time)))
-note('It took {0} minutes to complete...'.format(str(round(((end - start)/60), 4))))
+#   ----------------------------------------------------------------
+#   Name:           SpatialReferenceCheck.py
+#   Created by:     Neil Rose
+#   Created on:     5/3/2021
+#   Modified by:    GIS Systems Architecture
+#   Modified on:    10/18/2026
+#   Description:    Tool and audit check that checks all feature
+#                   classes for spatial reference. Spatial references
+#                   are compared by projection, XY tolerance, XY
+#                   resolution and XY domain and the inventory is
+#                   grouped by all four.
+#   ----------------------------------------------------------------
+
+#   import modules
+import arcpy
+import datetime
+import os
+from collections import Counter
+from Audit import audit_context, finding_line, option, register_check, report_finding, run_check
+from Catalog import read_spatial_ref
+from SpatialRefs import srs_differences, srs_inventory, srs_properties
+
+
+#   defined functions
+#   Function for creating output messages
+def note(message):
+    return arcpy.AddMessage(str(message))
+
+
+#   Function that reads the input spatial reference and opens the report
+#   wkt_srs is the WKT or full spatial reference string the feature classes are compared with, the inventory is
+#   written without a comparison when it is not given
+def start_check(context):
+    wkt_srs = option(context, 'wkt_srs')
+    reference = None
+    if wkt_srs is not None:
+        base_srs = arcpy.SpatialReference()
+        base_srs.loadFromString(wkt_srs)
+        reference = read_spatial_ref(base_srs)
+    report_file = open(os.path.join(context.report_loc, '{0}_SRS_Check.txt'.format(context.conn_base)), 'w')
+    #   A full spatial reference string carries the XY domain and tolerances after the WKT, a bare WKT does not
+    return {'report_file': report_file, 'reference': reference, 'precision': ';' in (wkt_srs or ''),
+            'fds_srs': dict((ds.name, ds.spatialReference) for ds in context.catalog.featureDatasets),
+            'fds_differences': {}, 'difference_counts': Counter(), 'fc_count': 0, 'fc_errors': 0}
+
+
+#   Function that compares the spatial reference of a feature class with the input
+def visit_dataset(state, context, fds, dataset):
+    if dataset.datasetType != 'FeatureClass':
+        return
+    state['fc_count'] += 1
+    if state['reference'] is None:
+        return
+    if fds is not None:
+        #   Members of a feature dataset share its spatial reference so it is compared once
+        if fds not in state['fds_differences']:
+            state['fds_differences'][fds] = srs_differences(state['fds_srs'][fds], state['reference'],
+                                                            state['precision'])
+        differences = state['fds_differences'][fds]
+        srs = getattr(state['fds_srs'][fds], 'name', None)
+    else:
+        differences = srs_differences(dataset.spatialReference, state['reference'], state['precision'])
+        srs = getattr(dataset.spatialReference, 'name', None)
+    if not differences:
+        return
+    state['fc_errors'] += 1
+    state['difference_counts'].update(differences)
+    state['report_file'].write(finding_line(report_finding(
+        context, 'SpatialReferenceCheck', fds, dataset.name, None, 'SpatialReferenceMismatch',
+        'SRS: {0} does not match input ({1})'.format(srs, ', '.join(differences)), 'Error'),
+        dataset.datasetType, ' - '))
+
+
+#   Function that writes the spatial reference inventory and the totals and closes the report
+def finish_check(state, context, dataset_results):
+    report_file = state['report_file']
+    tally, groups = srs_inventory(context.catalog)
+
+    for key, count in sorted(tally.items(), key=lambda item: (-item[1], str(item[0]))):
+        srs = groups[key][0]
+        if srs is None:
+            report_file.write('There are {0} instances of no spatial reference\n'.format(count))
+        else:
+            report_file.write('There are {0} instances of {1} (WKID: {2} - XY Tolerance: {3} - '
+                              'XY Resolution: {4} - XY Domain: {5})\n'.format(count, srs.name, srs.factoryCode,
+                                                                              srs.XYTolerance, srs.XYResolution,
+                                                                              srs.domain))
+        for fds, name in groups[key][1]:
+            report_file.write('    {0}\n'.format(name if fds is None else '{0}/{1}'.format(fds, name)))
+
+    if state['reference'] is not None:
+        fc_errors, fc_count = state['fc_errors'], state['fc_count']
+        report_file.write('\n\nFeature Class SRS Errors: {0}\n'
+                          'Feature Class Count: {1}\n'
+                          'Percent SRS Error: {2}%'.format(str(fc_errors), str(fc_count),
+                                                          str(round((fc_errors/fc_count)*100, 2))))
+        for srs_property in srs_properties:
+            report_file.write('\n{0} Errors: {1}'.format(srs_property,
+                                                         str(state['difference_counts'][srs_property])))
+
+    report_file.close()
+
+
+register_check('SpatialReferenceCheck', start_check, visit_dataset, finish=finish_check)
+
+
+#   Main script
+if __name__ == '__main__':
+    #   Set environments
+    unc_path = "//app-gisdata/gisdata/"
+    prj_dir = r'{0}\GIS\SystemsArchitecture\DataAudit2021\DataAuditTools\Dependencies'
+    arcpy.env.workspace = prj_dir
+    arcpy.env.overwriteOutput = True
+
+    #   Set inputs
+    conn_file = arcpy.GetParameterAsText(0)
+    report_loc = arcpy.GetParameterAsText(1)
+    wkt_srs = arcpy.GetParameterAsText(2)
+    catalog_file = arcpy.GetParameterAsText(3)
+
+    start_time = datetime.datetime.today().time()
+    note('SpatialReferenceCheck.py beginning at {0}...'.format(str(start_time)))
+    run_check(audit_context(conn_file, report_loc, catalog_file, {'wkt_srs': wkt_srs}), 'SpatialReferenceCheck')
+    note('All spatial reference systems have been verified. Please see results in the generated txt file.')
+    end_time = datetime.datetime.today().time()
+    note('SpatialReferenceCheck.py completed at {0}...'.format(str(end_time)))
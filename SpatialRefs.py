@@ -0,0 +1,87 @@
+#   ----------------------------------------------------------------
+#   Name:           SpatialRefs.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that inventories the spatial references of
+#                   the catalog feature classes. Spatial references
+#                   are compared by factory code, WKT fingerprint,
+#                   XY tolerance, XY resolution and XY domain, not by
+#                   name. It does not import arcpy.
+#   ----------------------------------------------------------------
+
+#   import modules
+import re
+from collections import Counter
+from functools import lru_cache
+from CatalogModel import definition_hash, iter_datasets
+
+
+#   Global variables
+#   Properties a feature class can differ from the input in, in report order
+srs_properties = ['Projection', 'XY Tolerance', 'XY Resolution', 'XY Domain']
+
+
+#   defined functions
+#   Function that fingerprints a WKT, whitespace and case do not change the fingerprint
+#   A full spatial reference string is fingerprinted by its WKT, the part before the XY domain and tolerances, so
+#   it matches the bare WKT of the same spatial reference
+#   Feature classes mostly share a few WKTs so the fingerprints are cached
+@lru_cache(maxsize=None)
+def wkt_fingerprint(wkt):
+    return definition_hash(re.sub(r'\s+', '', (wkt or '').split(';')[0]).upper())
+
+
+#   Function that returns the identity of the projection of a spatial reference
+#   A spatial reference with a factory code is its code, the WKT of one code can differ between releases, and a
+#   custom spatial reference is its WKT fingerprint
+def projection_key(srs):
+    if srs.factoryCode:
+        return ('WKID', srs.factoryCode)
+    return ('WKT', wkt_fingerprint(srs.wkt))
+
+
+#   Function that returns the key spatial references are grouped by, the projection and the XY precision
+def srs_key(srs):
+    if srs is None:
+        return None
+    return (projection_key(srs), srs.XYTolerance, srs.XYResolution, srs.domain)
+
+
+#   Function that tells whether two spatial references are the same projection, by the projection key the
+#   inventory groups them by
+def same_projection(srs, reference):
+    return projection_key(srs) == projection_key(reference)
+
+
+#   Function that returns the properties a spatial reference differs from the reference in
+#   precision is False when the reference carries no tolerance, resolution or domain of its own
+def srs_differences(srs, reference, precision=True):
+    if srs is None:
+        return ['Projection']
+    differences = []
+    if not same_projection(srs, reference):
+        differences.append('Projection')
+    if precision:
+        if srs.XYTolerance != reference.XYTolerance:
+            differences.append('XY Tolerance')
+        if srs.XYResolution != reference.XYResolution:
+            differences.append('XY Resolution')
+        if srs.domain != reference.domain:
+            differences.append('XY Domain')
+    return differences
+
+
+#   Function that inventories the feature class spatial references in one pass
+#   Returns [Counter of srs keys, {srs key: [spatial reference, [(feature dataset, feature class), ...]]}]
+def srs_inventory(catalog):
+    tally = Counter()
+    groups = {}
+    for fds, dataset in iter_datasets(catalog):
+        if dataset.datasetType != 'FeatureClass':
+            continue
+        key = srs_key(dataset.spatialReference)
+        tally[key] += 1
+        groups.setdefault(key, [dataset.spatialReference, []])[1].append((fds, dataset.name))
+    return [tally, groups]
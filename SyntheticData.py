@@ -0,0 +1,154 @@
+#   ----------------------------------------------------------------
+#   Name:           SyntheticData.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that lays out a synthetic geodatabase of
+#                   a configurable size for the benchmarks: feature
+#                   datasets, feature classes, tables, text fields,
+#                   coded value domains and the rows, with the Null,
+#                   blank and whitespace densities and the domain
+#                   duplicate rate asked for. Every check has
+#                   something to find in it. The same spec always
+#                   gives the same layout and rows. It does not
+#                   import arcpy, CheckBenchmark writes the layout.
+#   ----------------------------------------------------------------
+
+#   import modules
+import json
+import random
+from collections import namedtuple
+from CatalogModel import Domain, Field, definition_hash
+
+
+#   Global variables
+#   Size and make up of a synthetic geodatabase
+#   featureClasses are spread over the workspace root and the feature datasets, rows is the row count of every
+#   dataset that is not left empty, the rates are fractions of the text values, the domains or the datasets
+BenchmarkSpec = namedtuple('BenchmarkSpec', ['featureDatasets', 'featureClasses', 'tables', 'fields', 'rows',
+                                             'nullRate', 'blankRate', 'spaceRate', 'domains', 'codedValues',
+                                             'duplicateRate', 'emptyRate', 'seed'])
+default_spec = BenchmarkSpec(2, 6, 3, 8, 1000, 0.05, 0.05, 0.02, 20, 8, 0.2, 0.1, 0)
+
+#   A dataset of the layout, wkid is None for a table and fields are CatalogModel Fields
+SyntheticDataset = namedtuple('SyntheticDataset', ['name', 'aliasName', 'datasetType', 'featureDataset', 'wkid',
+                                                   'fields', 'rowCount'])
+
+#   Spatial references of the layout, one in three root feature classes is in the other one
+workspace_wkid = 3857
+other_wkid = 4326
+
+#   Words the text values are made of
+words = ['Main', 'Street', 'North', 'Avenue', 'Park', 'River', 'Oak', 'Hill', 'Station', 'Valve', 'Hydrant',
+         'Pump', 'Meter', 'Pole', 'Sign', 'Culvert', 'Inlet', 'Manhole', 'Bridge', 'Lane']
+#   Values with spaces the hygiene rules report, ExtraSpaces, LeadingSpaces, TrailingSpaces and Tabs
+spaced_values = ['Main  Street', ' Oak Lane', 'River Road ', 'Park\tAvenue']
+
+
+#   defined functions
+#   Function that returns the spec with the values of a {field: value} dict, any field left out keeps its default
+def read_spec(values=None):
+    return default_spec._replace(**(values or {}))
+
+
+#   Function that returns a short hash of a spec, the name of the geodatabase it is written to
+def spec_hash(spec):
+    return definition_hash(json.dumps(spec._asdict(), sort_keys=True))[:12]
+
+
+#   Function that returns the coded value domains of the layout
+#   duplicateRate of the domains copy the coded values of an earlier domain, they are reported by the duplicate
+#   and similarity checks
+def spec_domains(spec):
+    rnd = random.Random('{0}-domains'.format(spec.seed))
+    domains = []
+    for i in range(spec.domains):
+        if domains and rnd.random() < spec.duplicateRate:
+            coded_values = list(rnd.choice(domains).codedValues)
+        else:
+            coded_values = [['D{0}_{1}'.format(i, j), 'Domain {0} value {1}'.format(i, j)]
+                            for j in range(spec.codedValues)]
+        domains.append(Domain('BENCH_DOMAIN_{0}'.format(i), 'CodedValue', 'String', coded_values, None))
+    return domains
+
+
+#   Function that returns the text fields of a dataset
+#   The first field has no alias, the second a name too long for a shapefile and the third a reserved word.
+#   Every fourth field takes a domain from the first half of the domains, the other half is left orphaned.
+def spec_fields(spec, index, domains):
+    fields = []
+    for j in range(spec.fields):
+        if j == 1:
+            name = 'DESCRIPTION_{0}'.format(j)
+        elif j == 2:
+            name = 'COMMENT'
+        else:
+            name = 'TEXT_{0}'.format(j)
+        domain = None
+        if j % 4 == 3 and domains:
+            domain = domains[(index + j) % max(1, len(domains) // 2)].name
+        fields.append(Field(name, name if j == 0 else 'Text {0}'.format(j), 'String', 50, domain, True))
+    return fields
+
+
+#   Function that returns the feature dataset names of the layout
+def spec_feature_datasets(spec):
+    return ['BENCH_FDS_{0}'.format(i) for i in range(spec.featureDatasets)]
+
+
+#   Function that returns the datasets of the layout in the order they are written
+#   Every other dataset has no alias and emptyRate of them are left without rows
+def spec_datasets(spec, domains=None):
+    domains = spec_domains(spec) if domains is None else domains
+    rnd = random.Random('{0}-datasets'.format(spec.seed))
+    containers = [None] + spec_feature_datasets(spec)
+    datasets = []
+    for i in range(spec.featureClasses + spec.tables):
+        if i < spec.featureClasses:
+            container = containers[i % len(containers)]
+            name = 'BENCH_FC_{0}'.format(i)
+            dataset_type = 'FeatureClass'
+            wkid = other_wkid if container is None and i % 3 == 2 else workspace_wkid
+        else:
+            container = None
+            name = 'BENCH_TBL_{0}'.format(i - spec.featureClasses)
+            dataset_type = 'Table'
+            wkid = None
+        row_count = 0 if rnd.random() < spec.emptyRate else spec.rows
+        datasets.append(SyntheticDataset(name, name if i % 2 == 0 else 'Benchmark {0}'.format(i), dataset_type,
+                                         container, wkid, spec_fields(spec, i, domains), row_count))
+    return datasets
+
+
+#   Function that returns a text value, Null, blank or spaced at the rates of the spec
+def text_value(spec, rnd):
+    draw = rnd.random()
+    if draw < spec.nullRate:
+        return None
+    draw -= spec.nullRate
+    if draw < spec.blankRate:
+        return ''
+    draw -= spec.blankRate
+    if draw < spec.spaceRate:
+        return rnd.choice(spaced_values)
+    return '{0} {1}'.format(rnd.choice(words), rnd.choice(words))
+
+
+#   Function that yields the rows of a dataset, a list of field values in field order
+#   Fields with a domain take its codes, they are Null at the Null rate. Feature classes end with a point.
+def dataset_rows(spec, dataset, domains):
+    rnd = random.Random('{0}-{1}'.format(spec.seed, dataset.name))
+    codes = dict((domain.name, [code for code, description in domain.codedValues]) for domain in domains)
+    for oid in range(dataset.rowCount):
+        row = []
+        for field in dataset.fields:
+            if field.domain is not None:
+                row.append(None if rnd.random() < spec.nullRate else rnd.choice(codes[field.domain]))
+            else:
+                row.append(text_value(spec, rnd))
+        if dataset.wkid == workspace_wkid:
+            row.append((rnd.uniform(-9000000, 9000000), rnd.uniform(-5000000, 5000000)))
+        elif dataset.wkid is not None:
+            row.append((rnd.uniform(-120, -70), rnd.uniform(25, 49)))
+        yield row
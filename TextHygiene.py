@@ -0,0 +1,55 @@
+#   ----------------------------------------------------------------
+#   Name:           TextHygiene.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Module that compiles a set of text hygiene rules
+#                   into one matcher. A clean value costs a single
+#                   search of the combined pattern, only values that
+#                   hit it are tested rule by rule to classify the
+#                   finding. It does not import arcpy.
+#   ----------------------------------------------------------------
+
+#   import modules
+import re
+import unicodedata
+from functools import lru_cache
+
+
+#   Global variables
+#   Pattern of each text hygiene rule, in the order findings are reported
+#   Leading and trailing whitespace is any Unicode whitespace, tabs and non-breaking spaces included
+hygiene_patterns = {'ExtraSpaces': ' {2,}',
+                    'LeadingSpaces': r'\A\s',
+                    'TrailingSpaces': r'\s\Z',
+                    'Tabs': r'\t',
+                    'NonBreakingSpaces': r'[\xa0\u2007\u202f]',
+                    'ControlCharacters': r'[\x00-\x08\x0a-\x1f\x7f-\x9f]'}
+
+#   Rules that are not a pattern, values that are not in this Unicode normal form are reported
+NORMAL_FORM = 'NFC'
+hygiene_rules = list(hygiene_patterns) + ['Unnormalized']
+
+
+#   defined functions
+#   Function that compiles a set of hygiene rules into a classify(value) function
+#   classify returns the rules a value breaks, an empty tuple for clean values and anything but text
+@lru_cache(maxsize=None)
+def compile_matcher(rules):
+    pattern_rules = [rule for rule in hygiene_patterns if rule in rules]
+    check_normal = 'Unnormalized' in rules
+    gate = re.compile('|'.join(hygiene_patterns[rule] for rule in pattern_rules) or '(?!)').search
+    searches = [(rule, re.compile(hygiene_patterns[rule]).search) for rule in pattern_rules]
+
+    def classify(value):
+        if type(value) != str:
+            return ()
+        unnormalized = check_normal and not value.isascii() and not unicodedata.is_normalized(NORMAL_FORM, value)
+        if not unnormalized and not gate(value):
+            return ()
+        found = [rule for rule, search in searches if search(value)]
+        if unnormalized:
+            found.append('Unnormalized')
+        return found
+    return classify
@@ -0,0 +1,52 @@
+#   ----------------------------------------------------------------
+#   Name:           test_attribute_scan.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Tests of the row scan of the attribute scanning
+#                   engine. The engine reads rows with arcpy, the
+#                   tests are skipped where arcpy is not installed.
+#                   Run them with python -m pytest from the
+#                   repository folder.
+#   ----------------------------------------------------------------
+
+#   import modules
+import os
+import sys
+import pytest
+
+arcpy = pytest.importorskip('arcpy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import AttributeScan
+from CatalogModel import Dataset, Field
+
+#   Global variables
+#   A table without an ObjectID, a view or an unregistered table for instance, whose first field is text
+view = Dataset('PARCEL_VIEW', 'PARCEL_VIEW', 'Table', None, None,
+               [Field('NAME', 'NAME', 'String', 50, None, True), Field('OWNER', 'OWNER', 'String', 50, None, True)],
+               None, [])
+view_rows = [('b', None), ('a', 'x'), ('c', None), ('d', None)]
+
+
+#   defined functions
+#   Function that stands in for a SearchCursor over the rows of the view, it checks the projection it is given
+class ViewCursor(object):
+    def __init__(self, name, fields):
+        assert name == 'PARCEL_VIEW' and fields == ['NAME', 'OWNER']
+        self.rows = view_rows
+
+    def __enter__(self):
+        return iter(self.rows)
+
+    def __exit__(self, *args):
+        return False
+
+
+#   The rows of a table without an OID are numbered by cursor position, a text first field is not taken for the OID
+def test_table_without_oid_uses_row_positions(monkeypatch):
+    monkeypatch.setattr(arcpy.da, 'SearchCursor', ViewCursor)
+    projection, positions = AttributeScan.rule_projection(view, ['Null'])
+    assert projection == [AttributeScan.ROW_POSITION, 'NAME', 'OWNER']
+    assert AttributeScan.scan_rules(view, ['Null']) == {'Null': [[[1, 1], [3, 4]], 3, {'OWNER': 3},
+                                                                 {'OWNER': [[1, 1], [3, 4]]}]}
@@ -0,0 +1,44 @@
+#   ----------------------------------------------------------------
+#   Name:           test_domain_export.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Tests of the domain exports and of the diff of
+#                   two exports. Run them with python -m pytest from
+#                   the repository folder.
+#   ----------------------------------------------------------------
+
+#   import modules
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from CatalogModel import Domain
+from DomainExport import diff_exports, export_domains
+
+#   Global variables
+status = Domain('Status', 'CodedValue', 'String', [['A', 'Active'], ['R', 'Retired']], None)
+#   A coded value domain that was created without any values yet
+placeholder = Domain('Placeholder', 'CodedValue', 'String', [], None)
+height = Domain('Height', 'Range', 'Double', None, [0, 100])
+
+
+#   defined functions
+#   A coded value domain whose values were all deleted is still in the export and is not reported as removed
+def test_emptied_coded_domain_is_not_removed(tmp_path):
+    for export_format in ['JSONL', 'CSV', 'SQLite']:
+        old_file = export_domains([status, placeholder, height], str(tmp_path / 'old'), export_format)
+        new_file = export_domains([status._replace(codedValues=[]), placeholder, height], str(tmp_path / 'new'),
+                                  export_format)
+        assert diff_exports(old_file, new_file) == [[], [], {'Status': ['Code A removed : Active',
+                                                                        'Code R removed : Retired']}]
+
+
+#   Values added to an empty coded value domain are reported as added codes
+def test_codes_added_to_empty_coded_domain(tmp_path):
+    for export_format in ['JSONL', 'CSV', 'SQLite']:
+        old_file = export_domains([placeholder], str(tmp_path / 'old'), export_format)
+        new_file = export_domains([placeholder._replace(codedValues=[['N', 'New']])], str(tmp_path / 'new'),
+                                  export_format)
+        assert diff_exports(old_file, new_file) == [[], [], {'Placeholder': ['Code N added : New']}]
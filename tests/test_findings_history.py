@@ -0,0 +1,57 @@
+#   ----------------------------------------------------------------
+#   Name:           test_findings_history.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Tests of the finding keys and run comparisons of
+#                   the findings history store. Run them with
+#                   python -m pytest from the repository folder.
+#   ----------------------------------------------------------------
+
+#   import modules
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Findings import Finding
+from FindingsHistory import finding_key, insert_findings, new_findings, open_store, persisting_count, \
+    resolved_findings, start_run
+
+
+#   defined functions
+#   Function that returns the Null findings of the NAME field of Parcels, one per OID run
+def null_findings(runs):
+    return [Finding('conn.sde', None, 'Parcels', 'NAME', start, end, 'NullBlankCheck', 'Null', 'Warning',
+                    'contains Null values') for start, end in runs]
+
+
+#   Function that stores a run of the NullBlankCheck with the findings and returns its id
+def store_run(conn, findings):
+    run_id = start_run(conn, 'conn.sde', ['NullBlankCheck'])
+    insert_findings(conn, {}, run_id, findings)
+    return run_id
+
+
+#   The OID run is kept with a finding but is not part of its key
+def test_finding_key_ignores_oid_run():
+    first, second = null_findings([[1, 2], [7, 9]])
+    assert finding_key(first) == finding_key(second)
+    assert finding_key(first) != finding_key(first._replace(field='OWNER'))
+
+
+#   The runs of a field and rule are stored once with the OID span of all of them
+def test_runs_widen_the_oid_span(tmp_path):
+    conn = open_store(str(tmp_path / 'history.sqlite'))
+    run_id = store_run(conn, null_findings([[4, 5], [1, 2], [9, 9]]))
+    assert conn.execute('SELECT oidStart, oidEnd FROM findings WHERE runId = ?', [run_id]).fetchall() == [(1, 9)]
+
+
+#   Rows that shift between runs leave the finding persisting rather than new and resolved
+def test_shifted_rows_persist(tmp_path):
+    conn = open_store(str(tmp_path / 'history.sqlite'))
+    store_run(conn, null_findings([[1, 2], [5, 5]]))
+    run_id = store_run(conn, null_findings([[2, 3], [6, 6]]))
+    assert new_findings(conn, run_id, 'NullBlankCheck') == []
+    assert resolved_findings(conn, run_id, 'NullBlankCheck') == []
+    assert persisting_count(conn, run_id, 'NullBlankCheck') == 1
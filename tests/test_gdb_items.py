@@ -0,0 +1,105 @@
+#   ----------------------------------------------------------------
+#   Name:           test_gdb_items.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Tests of the GDB_Items catalog reader against a
+#                   SQLite stand-in of the geodatabase system tables.
+#                   Run them with python -m pytest from the
+#                   repository folder.
+#   ----------------------------------------------------------------
+
+#   import modules
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from CatalogModel import Domain, Field, SpatialRef, Subtype
+from GdbItems import read_catalog, read_schema_stamp, sqlite_executor
+
+#   Global variables
+srs_xml = ('<SpatialReference><WKT>PROJCS["NAD_1983_StatePlane",GEOGCS["GCS_North_American_1983"]]</WKT>'
+           '<XOrigin>-100</XOrigin><YOrigin>-100</YOrigin><XYScale>1000</XYScale><XYTolerance>0.001</XYTolerance>'
+           '<WKID>2274</WKID><LatestWKID>2274</LatestWKID></SpatialReference>')
+field_xml = ('<GPFieldInfoEx><Name>{0}</Name><AliasName>{1}</AliasName><FieldType>{2}</FieldType>'
+             '<IsNullable>{3}</IsNullable><DomainName>{4}</DomainName></GPFieldInfoEx>')
+parcels_xml = ('<DEFeatureClassInfo><AliasName>Parcels</AliasName><GPFieldInfoExs>' +
+               field_xml.format('OBJECTID', 'OBJECTID', 'esriFieldTypeOID', 'false', '') +
+               field_xml.format('STATUS', 'Status', 'esriFieldTypeString', 'true', 'Status') +
+               field_xml.format('KIND', 'Kind', 'esriFieldTypeInteger', 'true', '') +
+               '</GPFieldInfoExs><Subtypes><Subtype><SubtypeName>Lot</SubtypeName><SubtypeCode>1</SubtypeCode>'
+               '<FieldInfos><SubtypeFieldInfo><FieldName>STATUS</FieldName><DomainName>Status</DomainName>'
+               '</SubtypeFieldInfo></FieldInfos></Subtype></Subtypes>' + srs_xml + '</DEFeatureClassInfo>')
+owners_xml = ('<DETableInfo><AliasName>Owners</AliasName><GPFieldInfoExs>' +
+              field_xml.format('OBJECTID', 'OBJECTID', 'esriFieldTypeOID', 'false', '') +
+              field_xml.format('NAME', 'Name', 'esriFieldTypeString', 'true', '') +
+              '</GPFieldInfoExs></DETableInfo>')
+status_xml = ('<GPCodedValueDomain2><DomainName>Status</DomainName><FieldType>esriFieldTypeString</FieldType>'
+              '<CodedValues><CodedValue><Name>Active</Name><Code>A</Code></CodedValue>'
+              '<CodedValue><Name>Retired</Name><Code>R</Code></CodedValue></CodedValues></GPCodedValueDomain2>')
+#   UUIDs of the item types and of the items
+types = [['{T-FDS}', 'Feature Dataset'], ['{T-FC}', 'Feature Class'], ['{T-TBL}', 'Table'],
+         ['{T-CVD}', 'Coded Value Domain'], ['{T-RD}', 'Range Domain']]
+items = [[1, '{LAND}', '{T-FDS}', 'GIS.LAND', 'GIS.LAND', '<DEFeatureDataset>' + srs_xml + '</DEFeatureDataset>'],
+         [2, '{PARCELS}', '{T-FC}', 'GIS.PARCELS', 'GIS.PARCELS', parcels_xml],
+         [3, '{OWNERS}', '{T-TBL}', 'GIS.OWNERS', 'GIS.OWNERS', owners_xml],
+         [4, '{STATUS}', '{T-CVD}', 'Status', None, status_xml]]
+
+
+#   defined functions
+#   Function that writes a SQLite stand-in of the system tables the catalog queries read and returns its path
+def write_geodatabase(tmp_path):
+    db_path = str(tmp_path / 'gdb.sqlite')
+    conn = sqlite3.connect(db_path)
+    conn.execute('CREATE TABLE GDB_ITEMTYPES (UUID TEXT, Name TEXT)')
+    conn.execute('CREATE TABLE GDB_ITEMS (ObjectID INTEGER, UUID TEXT, Type TEXT, Name TEXT, PhysicalName TEXT, '
+                 'Definition TEXT)')
+    conn.execute('CREATE TABLE GDB_ITEMRELATIONSHIPTYPES (UUID TEXT, Name TEXT)')
+    conn.execute('CREATE TABLE GDB_ITEMRELATIONSHIPS (OriginID TEXT, DestID TEXT, Type TEXT)')
+    conn.execute('CREATE TABLE COLUMNS (TABLE_SCHEMA TEXT, TABLE_NAME TEXT, COLUMN_NAME TEXT, '
+                 'CHARACTER_MAXIMUM_LENGTH INTEGER)')
+    conn.executemany('INSERT INTO GDB_ITEMTYPES VALUES (?, ?)', types)
+    conn.executemany('INSERT INTO GDB_ITEMS VALUES (?, ?, ?, ?, ?, ?)', items)
+    conn.execute("INSERT INTO GDB_ITEMRELATIONSHIPTYPES VALUES ('{R-FDS}', 'DatasetInFeatureDataset')")
+    conn.execute("INSERT INTO GDB_ITEMRELATIONSHIPS VALUES ('{LAND}', '{PARCELS}', '{R-FDS}')")
+    conn.executemany('INSERT INTO COLUMNS VALUES (?, ?, ?, ?)',
+                     [['GIS', 'PARCELS', 'STATUS', 1], ['GIS', 'OWNERS', 'NAME', 80]])
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+#   The catalog read from the stand-in holds the feature dataset, its feature class, the table and the domain
+def test_read_catalog(tmp_path):
+    catalog = read_catalog(sqlite_executor(write_geodatabase(tmp_path)), 'SQLite', 'conn.sde')
+    srs = SpatialRef('NAD_1983_StatePlane', 2274, 'PROJCS["NAD_1983_StatePlane",GEOGCS["GCS_North_American_1983"]]',
+                     0.001, 0.001, '-100.0 -100.0 9007199254640.99 9007199254640.99')
+    assert catalog.domains == [Domain('Status', 'CodedValue', 'Text', [['A', 'Active'], ['R', 'Retired']], None)]
+    assert catalog.featureClasses == [] and len(catalog.featureDatasets) == 1
+    land = catalog.featureDatasets[0]
+    assert [land.name, land.spatialReference] == ['GIS.LAND', srs]
+    parcels = land.featureClasses[0]
+    assert [parcels.name, parcels.aliasName, parcels.datasetType, parcels.featureDataset] == \
+        ['GIS.PARCELS', 'Parcels', 'FeatureClass', 'GIS.LAND']
+    assert parcels.spatialReference == srs
+    assert parcels.fields == [Field('OBJECTID', 'OBJECTID', 'OID', 4, '', False),
+                              Field('STATUS', 'Status', 'String', 1, 'Status', True),
+                              Field('KIND', 'Kind', 'Integer', 4, '', True)]
+    assert parcels.subtypes == [Subtype(1, 'Lot', [['STATUS', 'Status']])]
+    assert [table.name for table in catalog.tables] == ['GIS.OWNERS']
+    assert catalog.tables[0].fields[1] == Field('NAME', 'Name', 'String', 80, '', True)
+
+
+#   The schema stamp changes when an item is redefined, even to a definition of the same length
+def test_schema_stamp_sees_same_length_redefinition(tmp_path):
+    db_path = write_geodatabase(tmp_path)
+    stamp = read_schema_stamp(sqlite_executor(db_path), 'SQLite')
+    assert stamp == read_schema_stamp(sqlite_executor(db_path), 'SQLite')
+    assert stamp.startswith('4/')
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE GDB_ITEMS SET Definition = replace(Definition, 'Retired', 'Removed') WHERE ObjectID = 4")
+    conn.commit()
+    conn.close()
+    assert read_schema_stamp(sqlite_executor(db_path), 'SQLite') != stamp
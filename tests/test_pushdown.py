@@ -0,0 +1,56 @@
+#   ----------------------------------------------------------------
+#   Name:           test_pushdown.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Tests of the pushdown decision and of the rules
+#                   pushed down to a SQLite stand-in. Run them with
+#                   python -m pytest from the repository folder.
+#   ----------------------------------------------------------------
+
+#   import modules
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Pushdown import pushdown_applies, pushdown_rules
+
+
+#   defined functions
+#   Function that returns an execute function over an in-memory SQLite table of (OBJECTID, NAME) rows
+def sqlite_executor(rows):
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE PARCELS (OBJECTID INTEGER, NAME TEXT)')
+    conn.executemany('INSERT INTO PARCELS VALUES (?, ?)', rows)
+    return lambda sql: conn.execute(sql).fetchall()
+
+
+#   Unversioned and unarchived base tables hold the rows a cursor reads
+def test_pushdown_applies_to_plain_tables():
+    for dialect in ['SQL Server', 'Oracle', 'PostgreSQL', 'SQLite']:
+        assert pushdown_applies(dialect, False, False)
+
+
+#   Versioned and archived datasets fall back to the cursor scan in every enterprise dialect
+def test_versioned_and_archived_fall_back():
+    for dialect in ['SQL Server', 'Oracle', 'PostgreSQL', 'SQLite']:
+        assert not pushdown_applies(dialect, True, False)
+        assert not pushdown_applies(dialect, False, True)
+        assert not pushdown_applies(dialect, True, True)
+
+
+#   File Geodatabase clauses run as arcpy where clauses and always apply
+def test_file_geodatabase_always_applies():
+    assert pushdown_applies('File Geodatabase', True, True)
+
+
+#   The pushed down rules return the runs, instance counts, field counts and field runs of scan_rules
+def test_pushdown_rules_counts_and_runs():
+    execute = sqlite_executor([[1, None], [2, None], [3, 'a  b'], [4, ''], [5, None], [6, 'fine']])
+    results = pushdown_rules(execute, 'SQLite', 'PARCELS', 'OBJECTID',
+                             [('Null', ['NAME']), ('Blank', ['NAME']), ('ExtraSpaces', ['NAME'])])
+    assert results == {'Null': [[[1, 2], [5, 5]], 3, {'NAME': 3}, {'NAME': [[1, 2], [5, 5]]}],
+                       'Blank': [[[4, 4]], 1, {'NAME': 1}, {'NAME': [[4, 4]]}],
+                       'ExtraSpaces': [[[3, 3]], 1, {'NAME': 1}, {'NAME': [[3, 3]]}]}
@@ -0,0 +1,47 @@
+#   ----------------------------------------------------------------
+#   Name:           test_spatial_refs.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Tests that the spatial reference inventory groups
+#                   and the projection comparison agree. Run them with
+#                   python -m pytest from the repository folder.
+#   ----------------------------------------------------------------
+
+#   import modules
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from CatalogModel import SpatialRef
+from SpatialRefs import same_projection, srs_differences, srs_key
+
+#   Global variables
+wkt = 'PROJCS["NAD_1983_StatePlane",GEOGCS["GCS_North_American_1983"]]'
+coded = SpatialRef('NAD_1983_StatePlane', 2274, wkt, 0.001, 0.0001, '-100 -100 100 100')
+#   The same spatial reference from another release, its WKT has more digits
+coded_release = coded._replace(wkt=wkt.replace('1983"', '1983",PARAMETER["Scale",1.0]'))
+custom = coded._replace(factoryCode=0)
+#   A full spatial reference string of the custom spatial reference, the WKT followed by its XY domain
+custom_full = custom._replace(wkt='{0};-100 -100 10000;#;#;0.001;#;#;IsHighPrecision'.format(wkt))
+
+
+#   defined functions
+#   Function that tells whether the inventory puts two spatial references with the same precision in one group
+def same_group(srs, reference):
+    return srs_key(srs) == srs_key(reference)
+
+
+#   Spatial references the comparison calls the same projection share an inventory group and the others do not
+def test_comparison_matches_inventory_groups():
+    for srs, reference in [(coded, coded_release), (custom, custom_full), (coded, custom), (custom, coded_release)]:
+        assert same_projection(srs, reference) == same_group(srs, reference)
+
+
+#   A factory code is compared by code, a custom spatial reference by its WKT
+def test_projection_identity():
+    assert same_projection(coded, coded_release)
+    assert same_projection(custom, custom_full)
+    assert not same_projection(custom, custom._replace(wkt=wkt.replace('1983"', '1927"')))
+    assert srs_differences(coded_release, coded) == []
@@ -0,0 +1,40 @@
+#   ----------------------------------------------------------------
+#   Name:           test_text_hygiene.py
+#   Created by:     GIS Systems Architecture
+#   Created on:     10/18/2026
+#   Modified by:
+#   Modified on:
+#   Description:    Tests of the compiled text hygiene matcher. Run
+#                   them with python -m pytest from the repository
+#                   folder.
+#   ----------------------------------------------------------------
+
+#   import modules
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from TextHygiene import compile_matcher
+
+#   Global variables
+classify = compile_matcher(('LeadingSpaces', 'TrailingSpaces', 'Tabs', 'NonBreakingSpaces'))
+
+
+#   defined functions
+#   A leading or trailing tab is leading or trailing whitespace as well as a tab
+def test_tab_at_either_end():
+    assert classify('\tMain St') == ['LeadingSpaces', 'Tabs']
+    assert classify('Main St\t') == ['TrailingSpaces', 'Tabs']
+
+
+#   A leading or trailing non-breaking space is leading or trailing whitespace as well as a non-breaking space
+def test_non_breaking_space_at_either_end():
+    assert classify('\xa0Main St') == ['LeadingSpaces', 'NonBreakingSpaces']
+    assert classify('Main St ') == ['TrailingSpaces', 'NonBreakingSpaces']
+
+
+#   Whitespace inside a value is not leading or trailing
+def test_inner_whitespace_is_not_at_the_ends():
+    assert classify('Main\tSt') == ['Tabs']
+    assert classify(' Main St ') == ['LeadingSpaces', 'TrailingSpaces']
+    assert classify('Main St') == ()